@@ -0,0 +1,4 @@
+"""
+Benchmarks for the graph algorithms: seeded input generators (generators.py), the cases and the
+measuring / comparing code (harness.py) and a command-line runner (`python -m benchmarks`).
+"""
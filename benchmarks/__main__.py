@@ -0,0 +1,83 @@
+"""
+Benchmark runner: `python -m benchmarks` from the repository root.
+
+Runs every case (see harness.CASES) at each of its sizes, prints a table, and compares the results
+with benchmarks/baseline.json when it exists. Exits with status 1 if anything regressed.
+Timings only compare on the machine they were recorded on, so the baseline is not part of the
+repository: record one locally with --save (e.g. on the main branch) before comparing.
+
+    python -m benchmarks                       # all sizes, compare with the baseline
+    python -m benchmarks --quick               # smallest size of every case only
+    python -m benchmarks --only kruskal prim   # cases whose name contains one of these
+    python -m benchmarks --output run.json     # also write the results as JSON
+    python -m benchmarks --save                # store this run as the local baseline
+"""
+import argparse
+import json
+import os
+import sys
+
+from .harness import CASES, compare, run_all
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Run the graph algorithm benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="only run the smallest size of every case")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="only run cases whose name contains NAME")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (the median counts)")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON to PATH ('-' for stdout)")
+    parser.add_argument("--baseline", default=BASELINE, metavar="PATH", help="baseline to compare against")
+    parser.add_argument("--save", "--save-baseline", dest="save", action="store_true",
+                        help="write the results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed slowdown / memory growth before a result counts as a regression")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.only or any(name in case.name for name in args.only)]
+    # The table goes to stderr when the JSON goes to stdout
+    log = sys.stderr if args.output == "-" else sys.stdout
+
+    def progress(result):
+        print(f"{result['name']:<40} {result['size']:>7} {result['seconds'] * 1000:10.2f} ms "
+              f"{result['peak_bytes'] / 2 ** 20:9.2f} MiB", file=log, flush=True)
+
+    report = run_all(cases, sizes=[0] if args.quick else None, seed=args.seed, repeat=args.repeat,
+                     progress=progress)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}", file=log)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to record one.", file=log)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressed = False
+    print(f"\nCompared with {args.baseline} (tolerance {args.tolerance:.0%}):", file=log)
+    for row in compare(report, baseline, args.tolerance):
+        regressed |= row["regressed"]
+        status = "REGRESSED" if row["regressed"] else "ok" if row["gated"] else "ok (too fast to gate)"
+        print(f"{row['name']:<40} {row['size']:>7}  time x{row['time_ratio']:.2f}  "
+              f"memory x{row['memory_ratio']:.2f}  {status}", file=log)
+        for counter, (old, new) in row["changed_counters"].items():
+            print(f"{'':<48} {counter}: {old} -> {new}", file=log)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
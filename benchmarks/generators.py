@@ -0,0 +1,160 @@
+"""
+Seeded synthetic inputs for the benchmarks.
+
+Every generator takes a size and a seed and returns the same input for the same arguments, in the
+format the algorithms take: weighted graphs as {node: {neighbor: weight}}, unweighted graphs and
+trees as {node: [neighbors]}, and matrices as 2D lists.
+"""
+import random
+
+INF = float('inf')
+
+
+def random_graph(n, m, seed=0, max_weight=100):
+    """
+    Random simple undirected graph with n nodes and (at most) m edges, weights 1..max_weight.
+    A random spanning tree is laid first so the graph is connected when m >= n - 1.
+    """
+    rng = random.Random(seed)
+    graph = {v: {} for v in range(n)}
+    m = min(m, n * (n - 1) // 2)
+    edges = 0
+    for v in range(1, n):
+        if edges >= m:
+            break
+        u = rng.randrange(v)
+        graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+        edges += 1
+    if m > n * (n - 1) // 4:
+        # Dense: walk the missing pairs in random order instead of retrying collisions
+        missing = [(u, v) for u in range(n) for v in range(u + 1, n) if v not in graph[u]]
+        rng.shuffle(missing)
+        for u, v in missing[:m - edges]:
+            graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+    else:
+        while edges < m:
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v and v not in graph[u]:
+                graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+                edges += 1
+    return graph
+
+
+def grid_graph(rows, cols, seed=0, max_weight=100):
+    """rows x cols grid with random weights; node (r, c) is numbered r * cols + c."""
+    rng = random.Random(seed)
+    graph = {v: {} for v in range(rows * cols)}
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols:
+                graph[v][v + 1] = graph[v + 1][v] = rng.randint(1, max_weight)
+            if r + 1 < rows:
+                graph[v][v + cols] = graph[v + cols][v] = rng.randint(1, max_weight)
+    return graph
+
+
+def power_law_graph(n, edges_per_node=2, seed=0, max_weight=100):
+    """
+    Barabasi-Albert preferential attachment: every new node joins edges_per_node existing nodes
+    picked proportionally to their degree, giving a few hubs and a long tail of small degrees.
+    """
+    rng = random.Random(seed)
+    k = max(1, edges_per_node)
+    graph = {v: {} for v in range(n)}
+    endpoints = []  # Every node appears once per incident edge
+    for v in range(1, min(n, k + 1)):
+        for u in range(v):
+            graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+            endpoints += (u, v)
+    for v in range(k + 1, n):
+        targets = set()
+        while len(targets) < k:
+            targets.add(rng.choice(endpoints))
+        for u in targets:
+            graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+            endpoints += (u, v)
+    return graph
+
+
+def random_tree(n, seed=0):
+    """Random labelled tree on nodes 1..n (each node joins a random earlier node), as neighbor lists."""
+    rng = random.Random(seed)
+    order = list(range(1, n + 1))
+    rng.shuffle(order)
+    tree = {v: [] for v in range(1, n + 1)}
+    for i in range(1, n):
+        u, v = order[rng.randrange(i)], order[i]
+        tree[u].append(v)
+        tree[v].append(u)
+    return tree
+
+
+def eulerian_graph(n, cycles, cycle_length, seed=0):
+    """
+    Connected undirected multigraph in which every degree is even, as neighbor lists: a random
+    Hamiltonian cycle (for connectivity) plus `cycles` random closed walks of cycle_length nodes.
+    """
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(n)}
+
+    def add_cycle(walk):
+        for u, v in zip(walk, walk[1:] + walk[:1]):
+            graph[u].append(v)
+            graph[v].append(u)
+
+    order = list(range(n))
+    rng.shuffle(order)
+    if n > 2:
+        add_cycle(order)
+    for _ in range(cycles):
+        walk = [rng.randrange(n)]
+        while len(walk) < cycle_length:
+            v = rng.randrange(n)
+            if v != walk[-1]:
+                walk.append(v)
+        if walk[0] != walk[-1]:
+            add_cycle(walk)
+    return graph
+
+
+def neighbor_lists(graph):
+    """Drop the weights of a {node: {neighbor: weight}} graph."""
+    return {node: list(neighbors) for node, neighbors in graph.items()}
+
+
+def distance_matrix(graph):
+    """Adjacency matrix with INF for missing edges and 0 on the diagonal, like floyd_warshall takes."""
+    n = len(graph)
+    matrix = [[0 if i == j else INF for j in range(n)] for i in range(n)]
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            matrix[u][v] = weight
+    return matrix
+
+
+def capacity_matrix(n, m, seed=0, max_capacity=100):
+    """
+    Random directed flow network as a capacity matrix with m edges: node 0 is the source (no edges
+    in) and node n - 1 the sink (no edges out), as ford_fulkerson requires.
+    """
+    rng = random.Random(seed)
+    matrix = [[0] * n for _ in range(n)]
+    pairs = [(u, v) for u in range(n - 1) for v in range(1, n) if u != v]
+    for u, v in rng.sample(pairs, min(m, len(pairs))):
+        matrix[u][v] = rng.randint(1, max_capacity)
+    return matrix
+
+
+def degree_sequence(n, seed=0):
+    """Degree sequence of a power-law graph (always graphical)."""
+    graph = power_law_graph(n, 3, seed)
+    return [len(neighbors) for neighbors in graph.values()]
+
+
+def preference_profile(players, items, length=None, seed=0):
+    """Every player ranks `length` distinct random items (all items by default)."""
+    rng = random.Random(seed)
+    names = [f"item{i}" for i in range(items)]
+    length = items if length is None else min(length, items)
+    return {f"player{p}": rng.sample(names, length) for p in range(players)}
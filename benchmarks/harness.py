@@ -0,0 +1,254 @@
+"""
+Benchmark cases and the code that runs and compares them.
+
+A case builds its input with a seeded generator (not timed) and returns a zero-argument function
+that runs the algorithm once and returns a dictionary of operation counters. Every case is timed
+`repeat` times with the garbage collector off (the median and interquartile range are kept), then
+run once more under tracemalloc for its peak memory. Algorithms that print their steps run with
+stdout redirected into a line counter, so printing costs stay in the timing (they are part of what
+the function does) but the terminal isn't flooded; the number of lines is reported as the
+output_lines counter.
+"""
+import gc
+import io
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import redirect_stdout
+from math import isqrt
+
+from graph_algorithms import (FlowCounters, allocate_items, color_graph_with_steps, find_eulerian_circuit,
+                              floyd_warshall, ford_fulkerson, generate_prufer_sequence, hakimi_havel,
+                              kruskal_algorithm, prim_algorithm)
+
+from . import generators
+
+# Cases faster than this (median) are reported but never fail a comparison: at millisecond scale
+# scheduler and cache noise is as large as the changes we'd want to catch
+MIN_GATED_SECONDS = 0.010
+# Memory growth smaller than this is allocator noise
+MIN_BYTES_CHANGE = 64 * 1024
+
+# name is "<algorithm>/<input family>"; sizes are the node (or player) counts to run it at
+Case = namedtuple("Case", ["name", "sizes", "prepare"])
+
+
+def _mst_case(algorithm, make_graph):
+    def prepare(n, seed):
+        graph = make_graph(n, seed)
+
+        def run():
+            mst, total_weight = algorithm(graph)
+            return {"mst_edges": len(mst), "total_weight": total_weight}
+        return run
+    return prepare
+
+
+def _prepare_floyd_warshall(n, seed):
+    matrix = generators.distance_matrix(generators.random_graph(n, n * n // 4, seed))
+
+    def run():
+        floyd_warshall(matrix)
+        return {}
+    return run
+
+
+def _prepare_ford_fulkerson(n, seed):
+    matrix = generators.capacity_matrix(n, 4 * n, seed)
+
+    def run():
+        counters = FlowCounters()
+        flow = ford_fulkerson(matrix, 0, n - 1, counters=counters)
+        result = {key: value for key, value in counters.as_dict().items() if key != "phase_times"}
+        result["max_flow"] = flow
+        return result
+    return run
+
+
+def _prepare_hakimi_havel(n, seed):
+    sequence = generators.degree_sequence(n, seed)
+
+    def run():
+        return {"graphical": hakimi_havel(list(sequence))}
+    return run
+
+
+def _prepare_eulerian_circuit(n, seed):
+    graph = generators.eulerian_graph(n, n // 4, 8, seed)
+
+    def run():
+        return {"circuit_length": len(find_eulerian_circuit(graph))}
+    return run
+
+
+def _prepare_prufer(n, seed):
+    tree = generators.random_tree(n, seed)
+
+    def run():
+        return {"sequence_length": len(generate_prufer_sequence(tree))}
+    return run
+
+
+def _prepare_coloring(n, seed):
+    side = max(1, isqrt(n))
+    graph = generators.neighbor_lists(generators.grid_graph(side, side, seed))
+
+    def run():
+        return {"colors": len(set(color_graph_with_steps(graph).values()))}
+    return run
+
+
+def _prepare_allocation(n, seed):
+    preferences = generators.preference_profile(n, n, seed=seed)
+
+    def run():
+        allocation = allocate_items(preferences)
+        return {"allocated": sum(item is not None for item in allocation.values())}
+    return run
+
+
+CASES = [
+    Case("floyd_warshall/random_dense", [25, 50, 100], _prepare_floyd_warshall),
+    Case("ford_fulkerson/random", [25, 50, 100], _prepare_ford_fulkerson),
+    Case("kruskal_algorithm/random_sparse", [1000, 4000, 16000],
+         _mst_case(kruskal_algorithm, lambda n, seed: generators.random_graph(n, 4 * n, seed))),
+    Case("kruskal_algorithm/random_dense", [50, 100, 200],
+         _mst_case(kruskal_algorithm, lambda n, seed: generators.random_graph(n, n * n // 4, seed))),
+    Case("kruskal_algorithm/grid", [1024, 4096, 16384],
+         _mst_case(kruskal_algorithm, lambda n, seed: generators.grid_graph(isqrt(n), isqrt(n), seed))),
+    Case("prim_algorithm/random_sparse", [1000, 4000, 16000],
+         _mst_case(prim_algorithm, lambda n, seed: generators.random_graph(n, 4 * n, seed))),
+    Case("prim_algorithm/power_law", [1000, 4000, 16000],
+         _mst_case(prim_algorithm, lambda n, seed: generators.power_law_graph(n, 3, seed))),
+    Case("hakimi_havel/power_law", [250, 500, 1000], _prepare_hakimi_havel),
+    Case("find_eulerian_circuit/random", [1000, 4000, 16000], _prepare_eulerian_circuit),
+    Case("generate_prufer_sequence/random_tree", [1000, 10000, 100000], _prepare_prufer),
+    Case("color_graph_with_steps/grid", [100, 400, 900], _prepare_coloring),
+    Case("allocate_items/random_profile", [50, 100, 200], _prepare_allocation),
+]
+
+
+class _LineCounter(io.TextIOBase):
+    """A stdout replacement that only counts the lines written to it."""
+
+    def __init__(self):
+        self.lines = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.lines += text.count("\n")
+        return len(text)
+
+
+def measure(case, size, seed=0, repeat=3):
+    """
+    Run one case at one size.
+
+    Returns:
+        dict: name, size, seconds (median of repeat runs), iqr (interquartile range of the run
+              times, 0 for fewer than 2 runs), peak_bytes (tracemalloc peak of one run) and counters
+              (from the last run, plus output_lines if the algorithm printed anything).
+    """
+    times = []
+    for _ in range(repeat):
+        run = case.prepare(size, seed)
+        output = _LineCounter()
+        gc.collect()
+        gc.disable()  # Like timeit: a collection triggered by the input build shouldn't land in the timing
+        try:
+            with redirect_stdout(output):
+                start = time.perf_counter()
+                counters = run()
+                times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    # Separate run for memory, since tracing slows everything down
+    run = case.prepare(size, seed)
+    with redirect_stdout(_LineCounter()):
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    counters = dict(counters)
+    if output.lines:
+        counters["output_lines"] = output.lines
+    quartiles = statistics.quantiles(times, n=4) if len(times) > 1 else [times[0]] * 3
+    return {"name": case.name, "size": size, "seconds": statistics.median(times),
+            "iqr": quartiles[2] - quartiles[0], "peak_bytes": peak, "counters": counters}
+
+
+def run_all(cases=None, sizes=None, seed=0, repeat=3, progress=None):
+    """
+    Run every case at each of its sizes (or only at the sizes in `sizes` that are its positions,
+    e.g. sizes=[0] for the smallest size of every case).
+
+    Returns:
+        dict: {"meta": {...}, "results": [measure(...) for every case and size]}
+    """
+    results = []
+    for case in cases or CASES:
+        chosen = case.sizes if sizes is None else [case.sizes[i] for i in sizes if i < len(case.sizes)]
+        for size in chosen:
+            result = measure(case, size, seed, repeat)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    meta = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": sys.platform,
+        "seed": seed,
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(report, baseline, tolerance=0.3):
+    """
+    Compare a run_all report with a stored baseline report.
+
+    A result regresses when its median time grows by more than `tolerance` (0.3 = 30%) and by more
+    than the run-to-run noise (twice the larger interquartile range of the two reports), or when
+    its peak memory grows by more than `tolerance` and MIN_BYTES_CHANGE. Cases whose baseline
+    median is under MIN_GATED_SECONDS are compared but never count as regressions (gated=False).
+    Counters are deterministic for a given seed, so any difference in them is reported too
+    (it means the algorithm now does different work, or returns something else).
+
+    Returns:
+        list: One dict per result that is in both reports: name, size, time_ratio, memory_ratio,
+              changed_counters ({counter: (baseline, now)}), gated (bool) and regressed (bool).
+    """
+    stored = {(result["name"], result["size"]): result for result in baseline["results"]}
+    rows = []
+    for result in report["results"]:
+        old = stored.get((result["name"], result["size"]))
+        if old is None:
+            continue
+        time_ratio = result["seconds"] / old["seconds"] if old["seconds"] else float('inf')
+        memory_ratio = result["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+        changed = {key: (old["counters"].get(key), value) for key, value in result["counters"].items()
+                   if old["counters"].get(key) != value}
+        noise = 2 * max(result.get("iqr", 0), old.get("iqr", 0))
+        slower = time_ratio > 1 + tolerance and result["seconds"] - old["seconds"] > noise
+        bigger = memory_ratio > 1 + tolerance and result["peak_bytes"] - old["peak_bytes"] > MIN_BYTES_CHANGE
+        gated = old["seconds"] >= MIN_GATED_SECONDS
+        rows.append({
+            "name": result["name"],
+            "size": result["size"],
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "changed_counters": changed,
+            "gated": gated,
+            "regressed": gated and (slower or bigger),
+        })
+    return rows
@@ -0,0 +1 @@
+# Lets pytest import graph_algorithms from the repository root.
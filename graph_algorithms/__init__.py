@@ -0,0 +1,89 @@
+"""
+Graph algorithms from the MTH 325 portfolio.
+
+Every algorithm can be imported straight from the package, e.g.
+
+    from graph_algorithms import kruskal_algorithm, floyd_warshall
+
+Submodules are only imported the first time one of their names is used, so importing the
+package itself is nearly free; see `python -m graph_algorithms` for the cold-import check.
+Each submodule can still be run on its own to see its example, e.g.
+`python -m graph_algorithms.kruskal`.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Shared graph storage
+    "CSRGraph": "csr",
+    "save_graph": "graph_file",
+    "load_graph": "graph_file",
+    "convert_edge_list": "graph_file",
+    # All-pairs shortest paths
+    "floyd_warshall": "all_pairs",
+    "path": "all_pairs",
+    "johnson": "all_pairs",
+    "update_edge": "all_pairs",
+    "update_edges": "all_pairs",
+    # Maximum flow
+    "ford_fulkerson": "flow",
+    "check_source_sink": "flow",
+    "bfs_capacity": "flow",
+    "FlowEvent": "flow",
+    "FlowCounters": "flow",
+    "print_trace": "flow",
+    "FlowNetwork": "flow",
+    "MaxFlowResult": "flow",
+    "solve_max_flow": "flow",
+    "max_flow": "flow",
+    "batch_max_flow": "flow",
+    # Graph coloring
+    "color_graph_with_steps": "coloring",
+    "color_graph": "coloring",
+    "exact_coloring": "coloring",
+    "ColoringResult": "coloring",
+    # Degree sequences
+    "hakimi_havel": "degree_sequence",
+    "is_graphical": "degree_sequence",
+    "is_graphical_batch": "degree_sequence",
+    "realize_degree_sequence": "degree_sequence",
+    # Eulerian circuits
+    "find_eulerian_circuit": "euler",
+    "find_eulerian_trail": "euler",
+    # Minimum spanning trees
+    "UnionFind": "kruskal",
+    "kruskal_algorithm": "kruskal",
+    "kruskal_from_file": "kruskal",
+    "write_edge_file": "kruskal",
+    "prim_algorithm": "prim",
+    "prim_matrix": "prim",
+    "IndexedMinHeap": "prim",
+    "boruvka_algorithm": "boruvka",
+    "DynamicMST": "dynamic_mst",
+    # Prufer sequences
+    "generate_prufer_sequence": "prufer",
+    "decode_prufer_sequence": "prufer",
+    "encode_prufer_batch": "prufer",
+    "decode_prufer_batch": "prufer",
+    # Stable matching
+    "allocate_items": "stable_matching",
+    "allocate_items_fast": "stable_matching",
+    "stable_allocation": "stable_matching",
+    "IncrementalAllocation": "stable_matching",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule defining `name` on first use and cache the attribute on the package."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
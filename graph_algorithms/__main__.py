@@ -0,0 +1,45 @@
+"""
+Cold-import check: `python -m graph_algorithms`.
+
+Starts a fresh interpreter for the package and for each submodule, and compares the time they add
+on top of a bare interpreter against IMPORT_BUDGET_MS. Exits with status 1 if any is over budget,
+so it can run in CI before shipping to short-lived worker processes.
+"""
+import subprocess
+import sys
+import time
+
+# Extra start-up time (milliseconds) an import may add to a fresh interpreter
+IMPORT_BUDGET_MS = 25
+
+SUBMODULES = ["csr", "graph_file", "all_pairs", "flow", "coloring", "degree_sequence", "euler", "kruskal",
+              "prim", "boruvka", "dynamic_mst", "prufer", "stable_matching"]
+
+
+def cold_start_ms(code, repeat=5):
+    """Best-of-`repeat` wall time in milliseconds to run `code` in a new interpreter."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    baseline = cold_start_ms("pass")
+    targets = ["graph_algorithms"] + [f"graph_algorithms.{name}" for name in SUBMODULES]
+
+    over_budget = False
+    for target in targets:
+        cost = cold_start_ms(f"import {target}") - baseline
+        status = "ok" if cost <= IMPORT_BUDGET_MS else "OVER BUDGET"
+        over_budget |= cost > IMPORT_BUDGET_MS
+        print(f"{target:<35} {cost:7.2f} ms  {status}")
+
+    print(f"(interpreter start-up {baseline:.2f} ms, budget {IMPORT_BUDGET_MS} ms per import)")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,481 @@
+# Floyd-Warshall algorithm to find the shortest paths between all pairs of vertices in a weighted graph
+import heapq
+from array import array
+
+from .csr import CSRGraph
+
+
+def floyd_warshall(graph, engine="python", dtype="float64", block_size=256, with_paths=False):
+    """
+    Floyd-Warshall algorithm to compute the shortest paths between all pairs of vertices in a graph.
+
+    Parameters:
+    graph: A 2D list (adjacency matrix) where graph[i][j] represents the weight of the edge from vertex i to vertex j.
+           Use 'INF' (infinity) to represent no path between two vertices.
+           A CSRGraph is also accepted (parallel edges keep their smallest weight).
+    engine: Which implementation to run.
+            "python"  - the original pure-Python triple loop (default).
+            "numpy"   - each k-step is a whole-matrix NumPy broadcast.
+            "blocked" - cache-blocked (tiled) NumPy version for matrices that don't fit in L2.
+    dtype: Element type used by the NumPy engines ("float64" or "float32"). float32 halves the memory.
+    block_size: Tile width used by the "blocked" engine.
+    with_paths: If True, also maintain a next-hop matrix during the relaxation so routes can be
+                recovered with path(next_hop, i, j). The "blocked" engine then relaxes in plain k order
+                like "numpy", since tiles update cells out of k order and could leave a cycle of hops
+                around a zero-weight cycle.
+
+    Returns:
+    dist: A 2D list (distance matrix) where dist[i][j] gives the shortest path from vertex i to vertex j.
+          The NumPy engines return the same distances as a 2D NumPy array.
+    If with_paths is True, returns (dist, next_hop) instead, where next_hop[i][j] is the vertex that
+    follows i on a shortest path to j (-1 if j is unreachable). next_hop is a list of int32
+    array('i') rows for the "python" engine and a 2D int32 NumPy array for the NumPy engines.
+    If a negative-weight cycle is detected, returns None and prints a message.
+    """
+
+    if isinstance(graph, CSRGraph):
+        graph = graph.to_dense() if engine != "python" else graph.to_dense().tolist()
+
+    # Hand off to one of the NumPy engines if requested
+    if engine != "python":
+        return _floyd_warshall_numpy(graph, engine, dtype, block_size, with_paths)
+
+    # Number of vertices in the graph
+    n = len(graph)
+
+    # Initialize the distance matrix as a copy of the graph matrix to preserve the original graph
+    dist = [row[:] for row in graph]
+
+    if with_paths:
+        # Next hop is the destination itself for direct edges, -1 where there is no edge yet
+        next_hop = [array('i', [j if i == j or dist[i][j] != float('inf') else -1 for j in range(n)])
+                    for i in range(n)]
+
+        for k in range(n):
+            dist_k = dist[k]
+            for i in range(n):
+                dist_i, next_i = dist[i], next_hop[i]
+                dist_ik, next_ik = dist_i[k], next_i[k]
+                for j in range(n):
+                    # Same relaxation as below, but remember which way we left i when it improves
+                    candidate = dist_ik + dist_k[j]
+                    if candidate < dist_i[j]:
+                        dist_i[j] = candidate
+                        next_i[j] = next_ik
+
+        for i in range(n):
+            if dist[i][i] < 0:
+                print("Graph contains a negative-weight cycle")
+                return None
+
+        return dist, next_hop
+
+    # Triple nested loop to consider each vertex as an intermediate point
+    for k in range(n):  # Loop over all possible intermediate vertices
+        for i in range(n):  # Loop over all source vertices
+            for j in range(n):  # Loop over all destination vertices
+                # Update the shortest distance if a shorter path is found through vertex k
+                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+
+    # Check for negative-weight cycles by examining the diagonal elements of the distance matrix
+    for i in range(n):
+        if dist[i][i] < 0:  # If any diagonal element is negative, a negative cycle exists
+            print("Graph contains a negative-weight cycle")
+            return None
+
+    return dist  # Return the distance matrix with the shortest paths
+
+
+def path(next_hop, i, j):
+    """
+    Recover a shortest path from the next-hop matrix returned by floyd_warshall(with_paths=True).
+
+    Parameters:
+    next_hop: The next-hop matrix (list of array('i') rows or a 2D NumPy int32 array).
+    i: The source vertex.
+    j: The destination vertex.
+
+    Returns:
+    A list of vertices [i, ..., j] along a shortest path, or an empty list if j is unreachable from i.
+    Runs in O(path length), it only walks the table.
+    Raises a ValueError if the walk doesn't reach j within n hops (a corrupted table).
+    """
+    if next_hop[i][j] == -1:
+        return []
+
+    route = [i]
+    while i != j:
+        # A shortest path visits every vertex at most once
+        if len(route) > len(next_hop):
+            raise ValueError("The next-hop table has a cycle; it is not a valid shortest-path table.")
+        i = int(next_hop[i][j])
+        route.append(i)
+    return route
+
+
+def _relax_blocks(dist_ij, dist_ik, dist_kj, next_ij=None, next_ik=None):
+    """
+    Relax every cell of dist_ij through each intermediate vertex of a tile, in place.
+
+    Parameters:
+    dist_ij: The tile being updated (rows I, columns J).
+    dist_ik: The tile holding the distances from rows I to the intermediate vertices K.
+    dist_kj: The tile holding the distances from the intermediate vertices K to columns J.
+    next_ij: Optional next-hop tile for (I, J), updated wherever dist_ij improves.
+    next_ik: The next-hop tile for (I, K), required together with next_ij.
+
+    The tiles are allowed to be views of each other (e.g. the diagonal tile), in which case
+    updates made for one k are seen by the next one, exactly like the plain triple loop.
+    """
+    import numpy as np
+
+    for k in range(dist_ik.shape[1]):
+        # Row k of the column tile plus column k of the row tile
+        candidate = dist_ik[:, k, None] + dist_kj[k, None, :]
+        if next_ij is None:
+            # Elementwise minimum in place
+            np.minimum(dist_ij, candidate, out=dist_ij)
+        else:
+            # Only the improved cells take the new distance and the first hop towards k
+            improved = candidate < dist_ij
+            np.copyto(dist_ij, candidate, where=improved)
+            np.copyto(next_ij, next_ik[:, k, None], where=improved)
+
+
+def _floyd_warshall_numpy(graph, engine, dtype, block_size, with_paths=False):
+    """
+    NumPy implementations of Floyd-Warshall used by floyd_warshall(engine="numpy" / "blocked").
+
+    Parameters:
+    graph: A 2D list or 2D NumPy array (adjacency matrix), with INF for missing edges.
+    engine: "numpy" for one whole-matrix broadcast per k, or "blocked" for the tiled version.
+    dtype: "float64" or "float32".
+    block_size: Tile width for the blocked engine.
+    with_paths: If True, also build an int32 next-hop matrix (always relaxing in plain k order).
+
+    Returns:
+    dist: A 2D NumPy array of shortest distances, or None if a negative-weight cycle is detected.
+    With with_paths, returns (dist, next_hop) instead.
+    """
+    import numpy as np
+
+    if engine not in ("numpy", "blocked"):
+        raise ValueError(f"Unknown engine {engine!r}, expected 'python', 'numpy' or 'blocked'.")
+
+    # Copy the graph into a contiguous array so the caller's matrix is left untouched
+    dist = np.array(graph, dtype=dtype)
+    n = dist.shape[0]
+
+    next_hop = None
+    if with_paths:
+        # Next hop is the destination itself for direct edges, -1 where there is no edge yet
+        next_hop = np.where(np.isfinite(dist), np.arange(n, dtype=np.int32), np.int32(-1)).astype(np.int32)
+        np.fill_diagonal(next_hop, np.arange(n, dtype=np.int32))
+
+    if engine == "numpy" or with_paths:
+        # One broadcast per intermediate vertex: dist = min(dist, dist[:, k] + dist[k, :])
+        _relax_blocks(dist, dist, dist, next_hop, next_hop)
+    else:
+        # Blocked Floyd-Warshall: for every diagonal tile K, first close the tile itself,
+        # then the tiles in its row and column, and finally every remaining tile.
+        for kb in range(0, n, block_size):
+            k = slice(kb, min(kb + block_size, n))
+
+            # Phase 1: the diagonal tile depends only on itself
+            _relax_blocks(dist[k, k], dist[k, k], dist[k, k])
+
+            # Phase 2: tiles in the same row and column as the diagonal tile
+            for jb in range(0, n, block_size):
+                if jb == kb:
+                    continue
+                j = slice(jb, min(jb + block_size, n))
+                _relax_blocks(dist[k, j], dist[k, k], dist[k, j])
+                _relax_blocks(dist[j, k], dist[j, k], dist[k, k])
+
+            # Phase 3: all other tiles, using the finished row and column tiles
+            for ib in range(0, n, block_size):
+                if ib == kb:
+                    continue
+                i = slice(ib, min(ib + block_size, n))
+                for jb in range(0, n, block_size):
+                    if jb == kb:
+                        continue
+                    j = slice(jb, min(jb + block_size, n))
+                    _relax_blocks(dist[i, j], dist[i, k], dist[k, j])
+
+    # Same negative-cycle check as the pure-Python version: look at the diagonal
+    if (np.diagonal(dist) < 0).any():
+        print("Graph contains a negative-weight cycle")
+        return None
+
+    if with_paths:
+        return dist, next_hop
+    return dist
+
+
+def johnson(graph, processes=None):
+    """
+    Johnson's algorithm for all-pairs shortest paths on sparse graphs.
+
+    Reweights the graph with one Bellman-Ford run so every edge becomes non-negative,
+    then runs a heap-based Dijkstra from every vertex. This is O(V E log V) instead of
+    O(V^3), and never builds a dense INF-padded matrix.
+
+    Parameters:
+    graph: A dictionary where the keys are vertices and the values are dictionaries of neighboring
+           vertices and edge weights (directed). Example: {'A': {'B': 3}, 'B': {'A': -1, 'C': 2}, 'C': {}}
+    processes: If greater than 1, the Dijkstra runs are fanned out across a process pool of that
+               many workers, split by source vertex.
+
+    Returns:
+    dist: A dictionary of dictionaries where dist[u][v] is the shortest distance from u to v.
+          Unreachable vertices are left out of dist[u].
+    If a negative-weight cycle is detected, returns None and prints a message.
+    """
+
+    # Map vertices to indices (vertices may only appear as a neighbor)
+    labels = list(graph)
+    index = {v: i for i, v in enumerate(labels)}
+    for neighbors in graph.values():
+        for v in neighbors:
+            if v not in index:
+                index[v] = len(labels)
+                labels.append(v)
+    n = len(labels)
+    adjacency = [[] for _ in range(n)]
+    for u, neighbors in graph.items():
+        adjacency[index[u]] = [(index[v], w) for v, w in neighbors.items()]
+
+    # Bellman-Ford from a virtual vertex joined to every vertex with weight 0,
+    # which is the same as starting every potential at 0.
+    h = [0] * n
+    for _ in range(n + 1):
+        changed = False
+        for u in range(n):
+            h_u = h[u]
+            for v, w in adjacency[u]:
+                if h_u + w < h[v]:
+                    h[v] = h_u + w
+                    changed = True
+        if not changed:
+            break
+    else:
+        # Still relaxing after n + 1 passes, so there must be a negative-weight cycle
+        print("Graph contains a negative-weight cycle")
+        return None
+
+    # Reweight every edge: w'(u, v) = w(u, v) + h[u] - h[v] >= 0
+    reweighted = [[(v, w + h[u] - h[v]) for v, w in adjacency[u]] for u in range(n)]
+
+    if processes is not None and processes > 1 and n > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # The graph is sent to every worker once, then only chunks of source indices travel
+        chunk = -(-n // (processes * 4))
+        chunks = [range(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+        with ProcessPoolExecutor(processes, initializer=_johnson_init, initargs=(reweighted, h)) as pool:
+            rows = [row for part in pool.map(_johnson_sources, chunks) for row in part]
+    else:
+        rows = [_dijkstra(reweighted, h, source) for source in range(n)]
+
+    return {labels[u]: {labels[v]: d for v, d in row} for u, row in enumerate(rows)}
+
+
+def _dijkstra(adjacency, h, source):
+    """
+    Heap-based Dijkstra on the reweighted graph used by johnson().
+
+    Parameters:
+    adjacency: List of (neighbor, non-negative weight) lists, indexed by vertex.
+    h: The Bellman-Ford potentials used to undo the reweighting.
+    source: The source vertex index.
+
+    Returns:
+    A list of (vertex, distance) pairs with the original (un-reweighted) distances.
+    """
+    dist = {source: 0}
+    done = set()
+    pq = [(0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u in done:
+            continue
+        done.add(u)
+        for v, w in adjacency[u]:
+            nd = d + w
+            if nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+
+    # Undo the reweighting: d(u, v) = d'(u, v) - h[u] + h[v]
+    return [(v, d - h[source] + h[v]) for v, d in dist.items()]
+
+
+# Per-worker copy of the reweighted graph, filled in by _johnson_init
+_johnson_graph = None
+
+
+def _johnson_init(adjacency, h):
+    """Process pool initializer: keep the reweighted graph for every later task in this worker."""
+    global _johnson_graph
+    _johnson_graph = (adjacency, h)
+
+
+def _johnson_sources(sources):
+    """Run _dijkstra for a chunk of source vertices inside a worker process."""
+    adjacency, h = _johnson_graph
+    return [_dijkstra(adjacency, h, source) for source in sources]
+
+
+def update_edge(dist, u, v, new_w, next_hop=None):
+    """
+    Repair an all-pairs distance matrix after the edge u -> v is inserted or its weight decreases.
+
+    Every improved path must use the new edge, so dist[i][j] only has to be compared against
+    dist[i][u] + new_w + dist[v][j]. That is O(n^2) instead of rerunning floyd_warshall in O(n^3).
+    Weight increases and deletions are not handled (they can invalidate paths that are still stored).
+
+    Parameters:
+    dist: A distance matrix produced by floyd_warshall (2D list or 2D NumPy array). Updated in place.
+    u: The tail of the edge.
+    v: The head of the edge.
+    new_w: The new (smaller) weight of the edge.
+    next_hop: Optional next-hop matrix from floyd_warshall(with_paths=True), also updated in place.
+
+    Returns:
+    dist: The repaired distance matrix.
+    If the new edge closes a negative-weight cycle, returns None and prints a message.
+    """
+
+    # The new edge creates a negative cycle exactly when going back from v to u is cheaper than -new_w
+    if dist[v][u] + new_w < 0:
+        print("Graph contains a negative-weight cycle")
+        return None
+
+    if not isinstance(dist, list):
+        import numpy as np
+
+        candidate = dist[:, u, None] + new_w + dist[None, v, :]
+        improved = candidate < dist
+        np.copyto(dist, candidate, where=improved)
+        if next_hop is not None:
+            # Paths that now go through u -> v leave i the same way they used to reach u
+            first_hop = next_hop[:, u].copy()
+            first_hop[u] = v
+            np.copyto(next_hop, first_hop[:, None], where=improved)
+        return dist
+
+    n = len(dist)
+    dist_v = dist[v]
+    for i in range(n):
+        via = dist[i][u] + new_w
+        if via == float('inf'):
+            continue  # u is unreachable from i, nothing to improve
+        dist_i = dist[i]
+        first_hop = v if i == u else (next_hop[i][u] if next_hop is not None else None)
+        for j in range(n):
+            candidate = via + dist_v[j]
+            if candidate < dist_i[j]:
+                dist_i[j] = candidate
+                if next_hop is not None:
+                    next_hop[i][j] = first_hop
+
+    return dist
+
+
+def update_edges(dist, updates, next_hop=None):
+    """
+    Apply many edge insertions / weight decreases to an all-pairs distance matrix at once.
+
+    Parameters:
+    dist: A distance matrix produced by floyd_warshall (2D list or 2D NumPy array). Updated in place.
+    updates: An iterable of (u, v, new_w) tuples.
+    next_hop: Optional next-hop matrix from floyd_warshall(with_paths=True), also updated in place.
+
+    Returns:
+    dist: The repaired distance matrix.
+    If the updates create a negative-weight cycle, returns None and prints a message; dist and
+    next_hop are then left exactly as they were.
+    """
+
+    # Only the smallest new weight per edge matters, and edges that don't beat the current distance are no-ops
+    best = {}
+    for u, v, new_w in updates:
+        if new_w < best.get((u, v), float('inf')):
+            best[(u, v)] = new_w
+    best = {edge: w for edge, w in best.items() if w < dist[edge[0]][edge[1]]}
+
+    if not best:
+        return dist
+
+    # A negative cycle may only show up after some edges were applied, so work on copies (O(n^2),
+    # no more than one repair) and write them back only once every update went through
+    n = len(dist)
+    work = _copy_matrix(dist)
+    if len(best) < n or next_hop is not None:
+        # Each repair is O(n^2), so this stays cheaper than a full recompute for fewer than n edges
+        work_next = _copy_matrix(next_hop) if next_hop is not None else None
+        for (u, v), new_w in best.items():
+            if update_edge(work, u, v, new_w, work_next) is None:
+                return None
+        if next_hop is not None:
+            _assign_matrix(next_hop, work_next)
+        _assign_matrix(dist, work)
+        return dist
+
+    # With n or more changed edges, one more O(n^3) pass over the already-closed matrix is cheaper
+    for (u, v), new_w in best.items():
+        work[u][v] = new_w
+
+    if not isinstance(dist, list):
+        import numpy as np
+
+        _relax_blocks(work, work, work)
+        if (np.diagonal(work) < 0).any():
+            print("Graph contains a negative-weight cycle")
+            return None
+    else:
+        work = floyd_warshall(work)
+        if work is None:
+            return None
+    _assign_matrix(dist, work)
+    return dist
+
+
+def _copy_matrix(matrix):
+    """Copy a 2D NumPy array, or a list of rows (lists or arrays) row by row."""
+    if isinstance(matrix, list):
+        return [row[:] for row in matrix]
+    return matrix.copy()
+
+
+def _assign_matrix(target, source):
+    """Overwrite target with source in place, keeping target's row objects."""
+    if isinstance(target, list):
+        for row, new_row in zip(target, source):
+            row[:] = new_row
+    else:
+        target[...] = source
+
+
+if __name__ == "__main__":
+    # Example usage
+    # Define 'INF' as the weight representing no path between vertices
+    INF = float('inf')
+
+    # Define a graph with 4 vertices and some weighted edges (infinite weight for non-edges)
+    graph = [
+        [0, 3, INF, 5],  # Distances from vertex 0 to others
+        [2, 0, INF, 4],  # Distances from vertex 1 to others
+        [INF, 1, 0, INF],  # Distances from vertex 2 to others
+        [INF, INF, 2, 0]  # Distances from vertex 3 to others
+    ]
+
+    # Call the Floyd-Warshall function and store the shortest path distances
+    distances = floyd_warshall(graph)
+
+    # Print the shortest path matrix if no negative-weight cycle is found
+    if distances:
+        print("Shortest distances between every pair of vertices:")
+        for row in distances:
+            print(row)  # Print each row of the distance matrix, representing distances from a vertex to all others
@@ -0,0 +1,193 @@
+from .csr import CSRGraph
+
+
+def boruvka_algorithm(graph, processes=None, chunk_edges=None):
+    """
+    Implements Boruvka's algorithm to find the Minimum Spanning Tree of a weighted, undirected graph,
+    optionally spreading the work over a process pool.
+
+    Every round, each component picks its cheapest outgoing edge and all of those edges are added at
+    once, so the number of components at least halves each round. The search for the cheapest edges
+    is split into chunks of the edge arrays; with processes > 1 the chunks are handled by worker
+    processes that read the edge arrays and component labels from shared memory.
+
+    Parameters:
+    graph: A dictionary where the keys are nodes, and the values are dictionaries of neighboring nodes and edge weights.
+           Example: {'A': {'B': 3, 'D': 1}, 'B': {'A': 3, 'D': 3, 'C': 1}, ...}
+           A CSRGraph is also accepted.
+    processes: Number of worker processes, or None to do everything in this process.
+    chunk_edges: Edges per chunk (defaults to splitting the edges into 4 chunks per process).
+
+    Returns:
+    mst: A list of edges that form the minimum spanning tree (a spanning forest if the graph is disconnected).
+         Each edge is represented as a tuple (node1, node2, weight).
+    total_weight: The total weight of all edges in the MST.
+    """
+    import numpy as np
+
+    # Number the nodes and list every undirected edge once, from its lower-index end (or its only end)
+    nodes = list(graph)
+    if isinstance(graph, CSRGraph):
+        tails, heads, weights = (array.tolist() for array in graph.undirected_edges())
+    else:
+        index = {node: i for i, node in enumerate(nodes)}
+        tails, heads, weights = [], [], []
+        for node in graph:
+            i = index[node]
+            for neighbor, weight in graph[node].items():
+                j = index[neighbor]
+                if i < j or (i > j and node not in graph[neighbor]):
+                    tails.append(i)
+                    heads.append(j)
+                    weights.append(weight)
+
+    n, m = len(nodes), len(weights)
+    if m == 0:
+        return [], 0
+
+    workers = processes if processes and processes > 1 else 1
+    chunk = chunk_edges or -(-m // (workers * 4))
+    chunks = [(start, min(start + chunk, m)) for start in range(0, m, chunk)]
+
+    arrays = {
+        "u": np.array(tails, dtype=np.int64),
+        "v": np.array(heads, dtype=np.int64),
+        "w": np.array(weights, dtype=np.float64),
+        "comp": np.arange(n, dtype=np.int64),  # Component label of each node (a node index)
+    }
+
+    pool = shared = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        # Copy the arrays into shared memory once; workers attach to the blocks by name
+        shared = {}
+        for name, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[:] = array
+            shared[name] = (block, view)
+        arrays = {name: view for name, (block, view) in shared.items()}
+        layout = {name: (block.name, view.shape, view.dtype.str) for name, (block, view) in shared.items()}
+        pool = ProcessPoolExecutor(workers, initializer=_attach_arrays, initargs=(layout,))
+
+    u, v, w, comp = arrays["u"], arrays["v"], arrays["w"], arrays["comp"]
+    chosen = []
+    try:
+        while True:
+            # Cheapest outgoing edge of every component, per chunk
+            if pool is None:
+                parts = [_cheapest_edges(arrays, start, end) for start, end in chunks]
+            else:
+                parts = list(pool.map(_cheapest_in_worker, chunks))
+            comps = np.concatenate([part[0] for part in parts])
+            edges = np.concatenate([part[1] for part in parts])
+            if len(edges) == 0:
+                break  # No edge leaves any component: done
+
+            comps, edges = _first_per_component(comps, edges, w)
+
+            # Hook every component onto the component at the other end of its cheapest edge.
+            # Ties are broken by edge index, so two components pointing at each other chose the same
+            # edge; the smaller label of such a pair stays a root.
+            other = np.where(comp[u[edges]] == comps, comp[v[edges]], comp[u[edges]])
+            hook = np.arange(n, dtype=np.int64)
+            hook[comps] = other
+            mutual = (hook[other] == comps) & (comps < other)
+            hook[comps[mutual]] = comps[mutual]
+
+            # Pointer jumping until every node points straight at its new root
+            while True:
+                jumped = hook[hook]
+                if np.array_equal(jumped, hook):
+                    break
+                hook = jumped
+            comp[:] = hook[comp]
+
+            chosen.append(np.unique(edges))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            for block, view in shared.values():
+                block.close()
+                block.unlink()
+
+    mst = []
+    total_weight = 0
+    for e in np.concatenate(chosen).tolist():
+        mst.append((nodes[tails[e]], nodes[heads[e]], weights[e]))
+        total_weight += weights[e]
+
+    return mst, total_weight
+
+
+def _cheapest_edges(arrays, start, end):
+    """
+    Find the cheapest edge leaving each component among edges start..end-1.
+
+    Returns:
+    (components, edges): two NumPy arrays, one entry per component that has an outgoing edge in the chunk.
+    """
+    import numpy as np
+
+    u, v, w, comp = arrays["u"], arrays["v"], arrays["w"], arrays["comp"]
+    cu = comp[u[start:end]]
+    cv = comp[v[start:end]]
+    crossing = np.nonzero(cu != cv)[0]
+
+    # Each crossing edge is a candidate for the components at both of its ends
+    comps = np.concatenate([cu[crossing], cv[crossing]])
+    edges = np.concatenate([crossing, crossing]) + start
+    return _first_per_component(comps, edges, w)
+
+
+def _first_per_component(comps, edges, w):
+    """Keep only the lightest edge (ties broken by edge index) for each component."""
+    import numpy as np
+
+    order = np.lexsort((edges, w[edges], comps))
+    comps, edges = comps[order], edges[order]
+    first = np.ones(len(comps), dtype=bool)
+    first[1:] = comps[1:] != comps[:-1]
+    return comps[first], edges[first]
+
+
+# Per-worker views of the shared arrays, set up by _attach_arrays
+_shared_arrays = None
+
+
+def _attach_arrays(layout):
+    """Process pool initializer: attach to the shared-memory blocks holding the edge arrays."""
+    global _shared_arrays
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    _shared_arrays = {}
+    for name, (block_name, shape, dtype) in layout.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _shared_arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        _shared_arrays[name + "_block"] = block  # Keep the block open while the view is in use
+
+
+def _cheapest_in_worker(bounds):
+    """Run _cheapest_edges on one chunk inside a worker process."""
+    return _cheapest_edges(_shared_arrays, *bounds)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 3, 'D': 1},
+        'B': {'A': 3, 'D': 3, 'C': 1},
+        'C': {'B': 1, 'D': 1, 'E': 5},
+        'D': {'A': 1, 'B': 3, 'C': 1, 'E': 6},
+        'E': {'C': 5, 'D': 6}
+    }
+
+    mst, total_weight = boruvka_algorithm(graph)
+
+    print("Edges in the Minimum Spanning Tree (MST):")
+    for edge in mst:
+        print(edge)
+
+    print(f"Total weight of the MST: {total_weight}")
@@ -0,0 +1,340 @@
+import heapq
+import time
+from collections import namedtuple
+
+
+def color_graph_with_steps(graph, max_colors=4):
+    """
+    Colors a graph using at most max_colors while printing each step.
+
+    Args:
+        graph (dict): Adjacency list representing the graph.
+                      Keys are nodes, and values are lists of adjacent nodes.
+        max_colors (int): Maximum number of colors allowed.
+
+    Returns:
+        dict: A dictionary mapping each node to its assigned color.
+    """
+    # Initialize color assignments
+    coloring = {node: None for node in graph}
+
+    def is_safe(node, color):
+        """Check if it's safe to assign `color` to `node`."""
+        for neighbor in graph[node]:
+            if coloring[neighbor] == color:
+                return False
+        return True
+
+    def assign_color(node):
+        """Attempt to assign a color to a node and log the process."""
+        for color in range(1, max_colors + 1):
+            print(f"  Trying color {color} for node {node}...")
+            if is_safe(node, color):
+                print(f"  Color {color} is safe for node {node}.")
+                return color
+            else:
+                print(f" Color {color} is not safe for use in node {node}.")
+        return None  # No valid color found
+
+    # Assign colors to all nodes
+    for node in graph:
+        print(f"Processing node {node}...")
+        color = assign_color(node)
+        if color is None:
+            raise ValueError(f"Graph cannot be colored with {max_colors} colors.")
+        coloring[node] = color
+        print(f"Assigned color {color} to node {node}. Current coloring: {coloring}\n")
+
+    return coloring
+
+
+def color_graph(graph, strategy="dsatur", max_colors=None):
+    """
+    Colors a graph silently with a greedy heuristic.
+
+    Each vertex keeps a bitmask of the colors already used by its neighbors (bit c - 1 for color c),
+    so the smallest safe color is found with a couple of integer operations and each assignment
+    only costs O(degree) to update the neighbors' masks.
+
+    Args:
+        graph (dict): Adjacency list representing the graph.
+                      Keys are nodes, and values are lists of adjacent nodes.
+        strategy (str): "dsatur" (always color the vertex with the most differently colored neighbors,
+                        ties broken by degree) or "largest_first" (Welsh-Powell: decreasing degree).
+        max_colors (int): Optional maximum number of colors allowed.
+
+    Returns:
+        dict: A dictionary mapping each node to its assigned color (starting from 1).
+
+    Raises:
+        ValueError: If max_colors is given and the heuristic needs more colors.
+    """
+    nodes, adjacency = _index_graph(graph)
+    colors = _greedy_colors(adjacency, strategy, max_colors)
+    return {node: colors[i] for i, node in enumerate(nodes)}
+
+
+def _greedy_colors(adjacency, strategy, max_colors=None, deadline=None):
+    """
+    The coloring loop behind color_graph, on an indexed adjacency list (see _index_graph).
+
+    If the perf_counter() deadline passes during DSatur, the remaining vertices are colored
+    first-fit in index order, which is O(V + E) and still gives a proper coloring.
+
+    Returns:
+        list: colors[v] for every vertex index v (starting from 1).
+    """
+    n = len(adjacency)
+    forbidden = [0] * n  # Bitmask of colors used by each vertex's neighbors
+    colors = [0] * n  # 0 means not colored yet
+
+    def assign(v):
+        mask = forbidden[v]
+        color = (~mask & (mask + 1)).bit_length()  # Lowest clear bit -> smallest safe color
+        if max_colors is not None and color > max_colors:
+            raise ValueError(f"Graph cannot be colored with {max_colors} colors.")
+        colors[v] = color
+        return 1 << (color - 1)
+
+    if strategy == "largest_first":
+        for v in sorted(range(n), key=lambda v: -len(adjacency[v])):
+            bit = assign(v)
+            for w in adjacency[v]:
+                forbidden[w] |= bit
+    elif strategy == "dsatur":
+        # Max-heap on (saturation, degree); stale entries are skipped when popped
+        heap = [(0, -len(adjacency[v]), v) for v in range(n)]
+        heapq.heapify(heap)
+        pops = 0
+        while heap:
+            pops += 1
+            if deadline is not None and pops % 256 == 0 and time.perf_counter() > deadline:
+                # Out of time: first-fit for everything left
+                for v in range(n):
+                    if not colors[v]:
+                        bit = assign(v)
+                        for w in adjacency[v]:
+                            forbidden[w] |= bit
+                break
+            saturation, degree, v = heapq.heappop(heap)
+            if colors[v] or -saturation != forbidden[v].bit_count():
+                continue
+            bit = assign(v)
+            for w in adjacency[v]:
+                if not colors[w] and not forbidden[w] & bit:
+                    forbidden[w] |= bit
+                    heapq.heappush(heap, (-forbidden[w].bit_count(), -len(adjacency[w]), w))
+    else:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected 'dsatur' or 'largest_first'.")
+
+    return colors
+
+
+def _index_graph(graph):
+    """
+    Number the nodes of an adjacency-list graph.
+
+    Returns:
+        tuple: (nodes, adjacency) where nodes[i] is the i-th node and adjacency[i] lists its
+               neighbors' indices, without self-loops or repeated neighbors. An edge listed from
+               only one end is added to both, since either list forbids the two sharing a color.
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [set() for _ in nodes]
+    for u, node in enumerate(nodes):
+        for v in graph[node]:
+            v = index[v]
+            if v != u:
+                neighbors[u].add(v)
+                neighbors[v].add(u)
+    adjacency = [list(adjacent) for adjacent in neighbors]
+    return nodes, adjacency
+
+
+# Result of exact_coloring.
+# optimal is True when num_colors is proven to be the chromatic number, and lower_bound is the best
+# proven lower bound (so lower_bound > k means the graph is not k-colorable).
+ColoringResult = namedtuple("ColoringResult", ["coloring", "num_colors", "lower_bound", "optimal"])
+
+
+def exact_coloring(graph, max_colors=None, time_limit=None, node_limit=None):
+    """
+    Finds an optimal coloring (or decides k-colorability) with DSatur branch and bound.
+
+    The search starts from the DSatur heuristic coloring as an upper bound and a greedy clique as a
+    lower bound. The clique's vertices are precolored 1..q and a branch may only open one new color,
+    which removes symmetric color permutations. Vertices are branched on in DSatur order.
+
+    Args:
+        graph (dict): Adjacency list representing the graph.
+                      Keys are nodes, and values are lists of adjacent nodes.
+        max_colors (int): If given, stop as soon as a coloring with at most this many colors is found
+                          (k-colorability) instead of minimizing.
+        time_limit (float): Optional wall-clock budget in seconds, counted from the call and checked
+                            during the setup too. Only indexing the graph and one greedy coloring pass,
+                            O(V + E) each, can run past it.
+        node_limit (int): Optional budget on the number of search nodes.
+
+    Returns:
+        ColoringResult: The best coloring found (node -> color, starting from 1), its number of colors,
+                        the proven lower bound and whether the coloring is proven optimal.
+                        On timeout the best coloring found so far is returned with optimal=False.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    def out_of_time():
+        return deadline is not None and time.perf_counter() > deadline
+
+    nodes, adjacency = _index_graph(graph)
+    n = len(nodes)
+    if n == 0:
+        return ColoringResult({}, 0, 0, True)
+
+    # Upper bound: the DSatur heuristic
+    best_colors = _greedy_colors(adjacency, "dsatur", deadline=deadline)
+    best = max(best_colors)
+
+    # Lower bound: a greedy clique grown from each of the highest-degree vertices
+    # (just an edge, or a single vertex, if the time is already up)
+    by_degree = sorted(range(n), key=lambda v: -len(adjacency[v]))
+    clique = [by_degree[0]] + adjacency[by_degree[0]][:1]
+    neighbor_sets = None if out_of_time() else [set(neighbors) for neighbors in adjacency]
+    for start in by_degree[:50] if neighbor_sets else []:
+        if out_of_time():
+            break
+        candidate = [start]
+        common = neighbor_sets[start]
+        while common:
+            v = max(common, key=lambda w: len(adjacency[w]))
+            candidate.append(v)
+            common = common & neighbor_sets[v]
+        if len(candidate) > len(clique):
+            clique = candidate
+    lower_bound = len(clique)
+
+    target = lower_bound if max_colors is None else max(lower_bound, max_colors)
+    if best <= target or (max_colors is not None and lower_bound > max_colors) or out_of_time():
+        # Already answered (the clique alone rules out max_colors colors), or no time left to search
+        return ColoringResult(dict(zip(nodes, best_colors)), best, lower_bound, best == lower_bound)
+
+    # For a k-colorability question only colorings with at most k colors are interesting
+    limit = best if max_colors is None else max_colors + 1
+
+    colors = [0] * n
+    # neighbor_count[v][c] = how many neighbors of v have color c; saturation[v] = distinct colors among them
+    neighbor_count = [[0] * (limit + 1) for _ in range(n)]
+    saturation = [0] * n
+
+    def assign(v, c):
+        colors[v] = c
+        for w in adjacency[v]:
+            if neighbor_count[w][c] == 0:
+                saturation[w] += 1
+            neighbor_count[w][c] += 1
+
+    def unassign(v):
+        c = colors[v]
+        colors[v] = 0
+        for w in adjacency[v]:
+            neighbor_count[w][c] -= 1
+            if neighbor_count[w][c] == 0:
+                saturation[w] -= 1
+
+    def select():
+        # DSatur rule: most saturated uncolored vertex, ties broken by degree
+        chosen, key = -1, None
+        for v in range(n):
+            if not colors[v]:
+                k = (saturation[v], len(adjacency[v]))
+                if key is None or k > key:
+                    chosen, key = v, k
+        return chosen
+
+    def candidates(v, used):
+        # Existing colors first, then at most one new color (symmetry breaking)
+        return [c for c in range(1, min(used + 1, limit - 1) + 1) if neighbor_count[v][c] == 0]
+
+    # Symmetry breaking: the clique's vertices get colors 1..q up front
+    for c, v in enumerate(clique, start=1):
+        assign(v, c)
+    colored = len(clique)
+    used = len(clique)
+
+    search_nodes = 0
+    finished = False
+
+    # Each frame is [vertex, candidate colors, next candidate position, colors used before the vertex]
+    v = select()
+    stack = [[v, candidates(v, used), 0, used]] if v >= 0 else []
+    while True:
+        if not stack:
+            finished = True
+            break
+        frame = stack[-1]
+        v, options, position, used_before = frame
+
+        # Undo the previous choice for this vertex before trying the next one
+        if colors[v]:
+            unassign(v)
+            colored -= 1
+            used = used_before
+
+        if position == len(options):
+            stack.pop()
+            continue
+        frame[2] += 1
+        c = options[position]
+        if c >= limit:
+            continue  # A better coloring was found since these options were generated
+
+        search_nodes += 1
+        if node_limit is not None and search_nodes > node_limit:
+            break
+        if out_of_time():
+            break  # Checked on every node: each one costs an O(n) select() anyway
+
+        assign(v, c)
+        colored += 1
+        used = max(used, c)
+
+        if colored == n:
+            # Every vertex colored with fewer than `limit` colors: new incumbent
+            best_colors = colors[:]
+            best = used
+            limit = best
+            if best <= target:
+                break
+            continue
+
+        u = select()
+        options = candidates(u, used)
+        if options:
+            stack.append([u, options, 0, used])
+
+    if finished:
+        # The whole tree below `limit` colors was searched without finding anything better
+        lower_bound = max(lower_bound, limit)
+
+    return ColoringResult(dict(zip(nodes, best_colors)), best, lower_bound, best <= lower_bound)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': ['B', 'C', 'D'],
+        'B': ['A', 'C', 'E'],
+        'C': ['A', 'B', 'D', 'E'],
+        'D': ['A', 'C', 'E'],
+        'E': ['B', 'C', 'D']
+    }
+
+    print("Attempting to color the graph with 4 colors...\n")
+    try:
+        coloring = color_graph_with_steps(graph, max_colors=4)
+        print("\nSuccessfully colored the graph with 4 colors:")
+        print(coloring)
+    except ValueError:
+        print("\nFailed to color the graph with 4 colors. Trying with 5 colors...\n")
+        coloring = color_graph_with_steps(graph, max_colors=5)
+        print("\nSuccessfully colored the graph with 5 colors:")
+        print(coloring)
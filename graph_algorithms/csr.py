@@ -0,0 +1,317 @@
+from collections.abc import Mapping
+
+
+class CSRGraph(Mapping):
+    """
+    An immutable graph in compressed sparse row (CSR) form, shared by all the algorithms.
+
+    The edges leaving node i are targets[offsets[i]:offsets[i + 1]], with their weights at the same
+    positions of weights, so the whole graph is three flat arrays: int32 offsets and targets and
+    float64 weights (about 12 bytes per edge instead of a Python dict entry). Nodes are numbered
+    0..n-1; labels[i] is the name of node i, or labels is None when the nodes are just 0..n-1.
+
+    The graph is also a read-only Mapping of node -> {neighbor: weight}: graph[node] is a view over
+    the node's slice of the arrays, so code written for the nested-dictionary graphs (kruskal,
+    prim, johnson, ...) and for the neighbor-list graphs (euler, coloring, prufer, ...) accepts a
+    CSRGraph as is. Undirected graphs store every edge in both directions, like those formats do.
+    """
+
+    __slots__ = ("offsets", "targets", "weights", "labels", "_index")
+
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        """
+        Wrap existing CSR arrays (no copy is made when they already have the right dtype, e.g. views
+        of a memory map). weights defaults to 1 for every edge.
+        """
+        import numpy as np
+
+        self.offsets = _frozen(np.asarray(offsets, dtype=_index_dtype(len(targets))))
+        self.targets = _frozen(np.asarray(targets, dtype=np.int32))
+        if weights is None:
+            weights = np.ones(len(self.targets))
+        self.weights = _frozen(np.asarray(weights, dtype=np.float64))
+        if len(self.offsets) == 0 or len(self.targets) != len(self.weights) \
+                or self.offsets[-1] != len(self.targets):
+            raise ValueError("offsets must have n + 1 entries ending at the number of edges, "
+                             "and targets and weights one entry per edge.")
+
+        self.labels = list(labels) if labels is not None else None
+        self._index = {label: i for i, label in enumerate(self.labels)} if labels is not None else None
+        if self._index is not None and len(self._index) != self.num_nodes:
+            raise ValueError("labels must hold one distinct label per node.")
+
+    @classmethod
+    def from_edges(cls, edges, num_nodes=None, labels=None, directed=False):
+        """
+        Build a graph from (u, v) or (u, v, weight) edges with a counting sort, O(n + m).
+
+        Parameters:
+        edges: An iterable of tuples, or an (m, 2) / (m, 3) NumPy array, over node indices
+               0..num_nodes-1 (or over labels, when labels is given).
+        num_nodes: Number of nodes (defaults to the largest index + 1, or len(labels)).
+        labels: Optional list of node labels.
+        directed: If False, every edge is stored from both ends.
+        """
+        import numpy as np
+
+        if isinstance(edges, np.ndarray):
+            array = edges
+        else:
+            edges = list(edges)
+            if labels is not None:
+                index = {label: i for i, label in enumerate(labels)}
+                edges = [(index[edge[0]], index[edge[1]]) + tuple(edge[2:]) for edge in edges]
+            array = np.array(edges, dtype=np.float64).reshape(len(edges), -1) if edges else np.zeros((0, 2))
+
+        sources = array[:, 0].astype(np.int64)
+        targets = array[:, 1].astype(np.int64)
+        weights = array[:, 2].astype(np.float64) if array.shape[1] > 2 else np.ones(len(array))
+        if not directed:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            weights = np.concatenate((weights, weights))
+
+        if num_nodes is None:
+            num_nodes = len(labels) if labels is not None else \
+                int(max(sources.max(), targets.max())) + 1 if len(sources) else 0
+        return cls._from_sorted_rows(sources, targets, weights, num_nodes, labels)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """
+        Build a graph from a dictionary of node -> {neighbor: weight} (like kruskal_algorithm takes)
+        or of node -> [neighbors] (like find_eulerian_circuit takes, every edge weighing 1). Nodes that
+        only appear as a neighbor are added at the end. The edges are stored exactly as listed.
+        """
+        import numpy as np
+
+        labels = list(graph)
+        index = {node: i for i, node in enumerate(labels)}
+        offsets = [0]
+        targets = []
+        weights = []
+        for node in list(labels):
+            neighbors = graph[node]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                targets.append(index[neighbor])
+            if isinstance(neighbors, Mapping):
+                weights.extend(neighbors.values())
+            else:
+                weights.extend([1.0] * len(neighbors))
+            offsets.append(len(targets))
+        offsets += [len(targets)] * (len(labels) + 1 - len(offsets))  # Neighbor-only nodes
+
+        identity = all(type(label) is int and label == i for i, label in enumerate(labels))
+        return cls(np.array(offsets), np.array(targets, dtype=np.int32), np.array(weights, dtype=np.float64),
+                   None if identity else labels)
+
+    @classmethod
+    def from_matrix(cls, matrix, no_edge=0):
+        """
+        Build a graph from an adjacency matrix (a 2D list or NumPy array). Entries equal to no_edge
+        are not edges (use float('inf') for distance matrices like floyd_warshall takes); zeros on
+        the diagonal are never edges.
+        """
+        import numpy as np
+
+        matrix = np.asarray(matrix, dtype=np.float64)
+        present = matrix != no_edge
+        np.fill_diagonal(present, present.diagonal() & (matrix.diagonal() != 0))
+        sources, targets = np.nonzero(present)  # Row-major, so already grouped by source
+        return cls._from_sorted_rows(sources, targets, matrix[sources, targets], len(matrix), None)
+
+    @classmethod
+    def _from_sorted_rows(cls, sources, targets, weights, num_nodes, labels):
+        """Group the edges by source (stable, so each node keeps its edges in input order)."""
+        import numpy as np
+
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+        return cls(offsets, targets[order], weights[order], labels)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        """Number of stored (directed) edges; an undirected graph stores each edge twice."""
+        return len(self.targets)
+
+    def index(self, node):
+        """Return the index of a node label."""
+        if self._index is not None:
+            return self._index[node]
+        if type(node) is int and 0 <= node < self.num_nodes:
+            return node
+        raise KeyError(node)
+
+    def label(self, i):
+        """Return the label of node index i."""
+        return self.labels[i] if self.labels is not None else i
+
+    def neighbors(self, i):
+        """Zero-copy view of the target indices of the edges leaving node index i."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def edge_weights(self, i):
+        """Zero-copy view of the weights of the edges leaving node index i."""
+        return self.weights[self.offsets[i]:self.offsets[i + 1]]
+
+    def degrees(self):
+        """Out-degree of every node as an array."""
+        import numpy as np
+
+        return np.diff(self.offsets)
+
+    def edge_arrays(self):
+        """Return (sources, targets, weights) arrays with one entry per stored edge."""
+        import numpy as np
+
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), self.degrees())
+        return sources, self.targets, self.weights
+
+    def undirected_edges(self):
+        """
+        Return (sources, targets, weights) with every undirected edge once: an edge is kept from its
+        lower-index end, or from its only end if it is listed from one end only (the same rule
+        kruskal_algorithm uses on dictionaries).
+        """
+        import numpy as np
+
+        sources, targets, weights = self.edge_arrays()
+        sources = sources.astype(np.int64)
+        targets = targets.astype(np.int64)
+        keep = sources < targets
+        backward = sources > targets
+        if backward.any():
+            n = self.num_nodes
+            listed = np.unique(sources * n + targets)
+            reverse = targets[backward] * n + sources[backward]
+            position = np.minimum(np.searchsorted(listed, reverse), len(listed) - 1)
+            keep[backward] = listed[position] != reverse
+        return sources[keep], targets[keep], weights[keep]
+
+    def to_dense(self, no_edge=float('inf'), diagonal=0.0, combine="min"):
+        """
+        Return the adjacency matrix as a 2D NumPy array.
+
+        Parameters:
+        no_edge: Value for missing edges (inf for distances, 0 for capacities).
+        diagonal: Value on the diagonal (a cheaper self-loop wins), or None to leave it to the edges.
+        combine: How parallel edges are merged: "min" (shortest) or "sum" (total capacity).
+        """
+        import numpy as np
+
+        n = self.num_nodes
+        sources, targets, weights = self.edge_arrays()
+        if combine == "min":
+            dense = np.full((n, n), np.inf)
+            np.minimum.at(dense, (sources, targets), weights)
+            if diagonal is not None:
+                dense[np.arange(n), np.arange(n)] = np.minimum(dense.diagonal(), diagonal)
+            if no_edge != float('inf'):
+                dense[np.isinf(dense)] = no_edge
+        elif combine == "sum":
+            present = np.zeros((n, n), dtype=bool)
+            present[sources, targets] = True
+            dense = np.zeros((n, n))
+            np.add.at(dense, (sources, targets), weights)
+            dense[~present] = no_edge
+            if diagonal is not None:
+                dense[np.arange(n), np.arange(n)] = diagonal
+        else:
+            raise ValueError(f"Unknown combine {combine!r}, expected 'min' or 'sum'.")
+        return dense
+
+    def __getitem__(self, node):
+        return _Neighbors(self, self.index(node))
+
+    def __iter__(self):
+        return iter(self.labels) if self.labels is not None else iter(range(self.num_nodes))
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __contains__(self, node):
+        try:
+            self.index(node)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __repr__(self):
+        return f"CSRGraph(num_nodes={self.num_nodes}, num_edges={self.num_edges})"
+
+
+class _Neighbors(Mapping):
+    """
+    Read-only view of one node's edges as a {neighbor: weight} mapping.
+
+    Iterating yields every stored edge's neighbor, so a multigraph's repeated neighbors show up
+    repeatedly, just like in a neighbor list; looking up a neighbor gives its first edge's weight.
+    """
+
+    __slots__ = ("_graph", "_start", "_end")
+
+    def __init__(self, graph, i):
+        self._graph = graph
+        self._start = int(graph.offsets[i])
+        self._end = int(graph.offsets[i + 1])
+
+    def _targets(self):
+        targets = self._graph.targets[self._start:self._end].tolist()
+        labels = self._graph.labels
+        return targets if labels is None else [labels[j] for j in targets]
+
+    def __iter__(self):
+        return iter(self._targets())
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, neighbor):
+        import numpy as np
+
+        try:
+            j = self._graph.index(neighbor)
+        except TypeError:
+            raise KeyError(neighbor) from None
+        hits = np.flatnonzero(self._graph.targets[self._start:self._end] == j)
+        if not len(hits):
+            raise KeyError(neighbor)
+        return float(self._graph.weights[self._start + hits[0]])
+
+    def __contains__(self, neighbor):
+        try:
+            self[neighbor]
+        except KeyError:
+            return False
+        return True
+
+    # Walk the slices directly instead of looking every neighbor up again
+    def items(self):
+        return list(zip(self._targets(), self.values()))
+
+    def values(self):
+        return self._graph.weights[self._start:self._end].tolist()
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _index_dtype(num_edges):
+    """int32 offsets, unless the graph has too many edges for them."""
+    import numpy as np
+
+    return np.int32 if num_edges < 2 ** 31 else np.int64
+
+
+def _frozen(array):
+    """Make an array read-only (a view is made first, so the caller's array stays writable)."""
+    array = array.view()
+    array.flags.writeable = False
+    return array
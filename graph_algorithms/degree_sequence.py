@@ -0,0 +1,197 @@
+def hakimi_havel(degree_sequence):
+    """
+    Implementation the Hakimi-Havel algorithm to check if a given degree sequence
+    can form a simple undirected graph.
+
+    Parameters:
+    degree_sequence: A list of non-negative integers representing the degree sequence.
+
+    Returns:
+    True if the sequence is graphical (can form a simple graph), False otherwise.
+    """
+
+    # Remove all zeros from the sequence (since nodes with degree 0 are already handled)
+    degree_sequence = [deg for deg in degree_sequence if deg > 0]
+
+    # Sort the degree sequence in non-increasing order
+    degree_sequence.sort(reverse=True)
+
+    # Continue the process until the sequence is empty or found invalid
+    while degree_sequence:
+        # If the largest degree is greater than the length of the sequence, it's invalid
+        largest_degree = degree_sequence.pop(0)  # Take the largest degree
+
+        # If largest degree is greater than the length of the remaining sequence, return False
+        if largest_degree > len(degree_sequence):
+            return False
+
+        # Subtract 1 from the next 'largest_degree' elements
+        for i in range(largest_degree):
+            degree_sequence[i] -= 1
+            # If any degree goes negative, the sequence is invalid
+            if degree_sequence[i] < 0:
+                return False
+
+        # Remove all zeros and sort again
+        degree_sequence = [deg for deg in degree_sequence if deg > 0]
+        degree_sequence.sort(reverse=True)
+
+    # If we successfully reduced the sequence to all zeros, it's graphical
+    return True
+
+
+def is_graphical(degree_sequence):
+    """
+    Check if a degree sequence can form a simple undirected graph using the Erdos-Gallai criterion.
+
+    The sequence is sorted with a counting sort (every valid degree is below n) and the
+    Erdos-Gallai inequality is checked for every k with prefix sums, so the whole test runs in O(n)
+    instead of the O(n^2 log n) of repeatedly re-sorting in hakimi_havel.
+
+    Parameters:
+    degree_sequence: A list of non-negative integers representing the degree sequence.
+
+    Returns:
+    True if the sequence is graphical (can form a simple graph), False otherwise.
+    """
+    n = len(degree_sequence)
+
+    # Counting sort; a degree of n or more (or a negative one) can never be realized
+    count = [0] * (n + 1)
+    total = 0
+    for deg in degree_sequence:
+        if deg < 0 or deg >= n:
+            return False
+        count[deg] += 1
+        total += deg
+
+    # The degrees of a graph always add up to an even number (twice the edges)
+    if total % 2:
+        return False
+
+    # at_least[k] = how many degrees are >= k, prefix[i] = sum of the i largest degrees
+    at_least = [0] * (n + 2)
+    for deg in range(n, -1, -1):
+        at_least[deg] = at_least[deg + 1] + count[deg]
+    prefix = [0] * (n + 1)
+    i = 0
+    for deg in range(n - 1, -1, -1):
+        for _ in range(count[deg]):
+            prefix[i + 1] = prefix[i] + deg
+            i += 1
+
+    # Erdos-Gallai: for every k, the k largest degrees sum to at most k(k-1) + sum(min(d_i, k) for i > k)
+    for k in range(1, n + 1):
+        # Past position k, the degrees >= k sit at positions k+1..split and each count as k
+        split = max(k, at_least[k])
+        right = k * (k - 1) + k * (split - k) + (total - prefix[split])
+        if prefix[k] > right:
+            return False
+
+    return True
+
+
+def is_graphical_batch(sequences):
+    """
+    Vectorized Erdos-Gallai check for many degree sequences of the same length at once.
+
+    Parameters:
+    sequences: A 2D NumPy array (or list of equal-length lists) with one degree sequence per row.
+
+    Returns:
+    A 1D NumPy boolean array, True where the row is graphical.
+    """
+    import numpy as np
+
+    d = np.asarray(sequences, dtype=np.int64)
+    m, n = d.shape
+
+    # Rows with a degree outside 0..n-1 or an odd total can't be graphical
+    valid = ((d >= 0) & (d < n)).all(axis=1)
+    total = d.sum(axis=1)
+    valid &= total % 2 == 0
+    d = np.clip(d, 0, n)
+
+    # Sort every row in non-increasing order and take prefix sums (prefix[:, i] = sum of the i largest)
+    d = -np.sort(-d, axis=1)
+    prefix = np.zeros((m, n + 1), dtype=np.int64)
+    np.cumsum(d, axis=1, out=prefix[:, 1:])
+
+    # at_least[:, k] = how many degrees in the row are >= k, via one bincount over all rows
+    count = np.bincount((d + (n + 1) * np.arange(m)[:, None]).ravel(), minlength=m * (n + 1)).reshape(m, n + 1)
+    at_least = np.cumsum(count[:, ::-1], axis=1)[:, ::-1]
+
+    # Erdos-Gallai for every k = 1..n at once
+    k = np.arange(1, n + 1)
+    split = np.maximum(k, at_least[:, 1:])
+    right = k * (k - 1) + k * (split - k) + (total[:, None] - np.take_along_axis(prefix, split, axis=1))
+    return valid & (prefix[:, 1:] <= right).all(axis=1)
+
+
+def realize_degree_sequence(degree_sequence):
+    """
+    Build a simple graph with the given degree sequence (Havel-Hakimi), yielding its edges one by one.
+
+    Vertices are kept in buckets by their remaining degree, so each step takes the vertex with the
+    largest remaining degree d and joins it to the d next-largest vertices without re-sorting.
+    Edges are yielded as soon as they are decided, so huge graphs can be streamed to disk.
+
+    Parameters:
+    degree_sequence: A list of non-negative integers; vertex i gets degree degree_sequence[i].
+
+    Returns:
+    A generator of (u, v) edges between vertex indices.
+    Raises a ValueError (before yielding anything) if the sequence is not graphical.
+    """
+
+    # Checking up front means a consumer never receives half a graph
+    if not is_graphical(degree_sequence):
+        raise ValueError("Degree sequence is not graphical.")
+
+    return _havel_hakimi_edges(list(degree_sequence))
+
+
+def _havel_hakimi_edges(residual):
+    """Generator behind realize_degree_sequence; residual holds the remaining degree of each vertex."""
+    n = len(residual)
+
+    # buckets[d] holds the vertices whose remaining degree is d
+    buckets = [[] for _ in range(n)]
+    for vertex, deg in enumerate(residual):
+        if deg > 0:
+            buckets[deg].append(vertex)
+    top = n - 1
+
+    while True:
+        # Find the largest remaining degree
+        while top > 0 and not buckets[top]:
+            top -= 1
+        if top <= 0:
+            return
+
+        vertex = buckets[top].pop()
+        deg = residual[vertex]
+        residual[vertex] = 0
+
+        # Take the deg vertices with the largest remaining degrees
+        chosen = []
+        level = top
+        while len(chosen) < deg:
+            while not buckets[level]:
+                level -= 1
+            chosen.append(buckets[level].pop())
+
+        # Connect them and put them back one bucket lower
+        for neighbor in chosen:
+            yield vertex, neighbor
+            residual[neighbor] -= 1
+            if residual[neighbor] > 0:
+                buckets[residual[neighbor]].append(neighbor)
+
+
+if __name__ == "__main__":
+    degree_seq_1 = [3, 3, 3, 3, 3, 3]
+    degree_seq_2 = [3, 3, 3, 3, 2, 2]
+
+    print(f"Degree sequence {degree_seq_1} is graphical: {hakimi_havel(degree_seq_1)}")
+    print(f"Degree sequence {degree_seq_2} is graphical: {hakimi_havel(degree_seq_2)}")
@@ -0,0 +1,131 @@
+from .kruskal import kruskal_algorithm
+
+
+class DynamicMST:
+    """
+    A minimum spanning forest that is kept up to date as edges are inserted or get cheaper.
+
+    Only the forest itself is stored (as an adjacency dictionary). Inserting an edge (u, v) either
+    joins two trees, or closes a cycle with the tree path from u to v; in that case the heaviest
+    edge on the cycle is dropped (the cycle property). Finding the path is a walk over the tree, so
+    every update is O(V) instead of recomputing the MST from scratch.
+    """
+
+    def __init__(self, graph=None, mst=None):
+        """
+        Start from a graph (its minimum spanning forest is computed with Kruskal's algorithm) or from
+        an already computed MST given as a list of (node1, node2, weight) edges.
+        """
+        if graph is not None and mst is None:
+            mst, _ = kruskal_algorithm(graph)
+
+        self.tree = {node: {} for node in graph} if graph is not None else {}
+        self.total_weight = 0
+        for node1, node2, weight in mst or []:
+            self._link(node1, node2, weight)
+
+    def edges(self):
+        """
+        Return the current forest as a list of (node1, node2, weight) edges.
+        """
+        seen = set()
+        edges = []
+        for node, neighbors in self.tree.items():
+            seen.add(node)
+            for neighbor, weight in neighbors.items():
+                if neighbor not in seen:
+                    edges.append((node, neighbor, weight))
+        return edges
+
+    def insert_edge(self, node1, node2, weight):
+        """
+        Insert the edge node1 - node2, or lower its weight, and repair the forest.
+
+        Parameters:
+        node1, node2: The endpoints (new nodes are added on the fly).
+        weight: The edge's new weight. For an edge already in the forest the weight may only go down.
+
+        Returns:
+        The (node1, node2, weight) edge that is not part of the forest after the update: the replaced
+        heaviest edge on the cycle, or the inserted edge itself if it doesn't improve the forest.
+        None if no edge had to be left out.
+        """
+        if node1 == node2:
+            return node1, node2, weight  # A self-loop is never in a spanning forest
+
+        self.tree.setdefault(node1, {})
+        self.tree.setdefault(node2, {})
+
+        # An edge already in the forest: a cheaper weight keeps it optimal
+        old_weight = self.tree[node1].get(node2)
+        if old_weight is not None:
+            if weight > old_weight:
+                raise ValueError("Only insertions and weight decreases are supported.")
+            self._cut(node1, node2)
+            self._link(node1, node2, weight)
+            return None
+
+        path = self._tree_path(node1, node2)
+        if path is None:
+            # Different trees: the edge simply joins them
+            self._link(node1, node2, weight)
+            return None
+
+        # Heaviest edge on the tree path between the endpoints
+        heaviest = max(zip(path, path[1:]), key=lambda pair: self.tree[pair[0]][pair[1]])
+        heaviest_weight = self.tree[heaviest[0]][heaviest[1]]
+        if weight >= heaviest_weight:
+            return node1, node2, weight
+
+        self._cut(*heaviest)
+        self._link(node1, node2, weight)
+        return heaviest[0], heaviest[1], heaviest_weight
+
+    # A non-tree edge getting cheaper is handled exactly like inserting it with the new weight
+    decrease_weight = insert_edge
+
+    def _link(self, node1, node2, weight):
+        self.tree.setdefault(node1, {})[node2] = weight
+        self.tree.setdefault(node2, {})[node1] = weight
+        self.total_weight += weight
+
+    def _cut(self, node1, node2):
+        self.total_weight -= self.tree[node1].pop(node2)
+        del self.tree[node2][node1]
+
+    def _tree_path(self, start, goal):
+        """
+        Return the list of nodes on the tree path from start to goal, or None if they are in different trees.
+        """
+        parent = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                return path[::-1]
+            for neighbor in self.tree[node]:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    stack.append(neighbor)
+        return None
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 3, 'D': 1},
+        'B': {'A': 3, 'D': 3, 'C': 1},
+        'C': {'B': 1, 'D': 1, 'E': 5},
+        'D': {'A': 1, 'B': 3, 'C': 1, 'E': 6},
+        'E': {'C': 5, 'D': 6}
+    }
+
+    dynamic = DynamicMST(graph)
+    print(f"Initial MST: {dynamic.edges()} (total weight {dynamic.total_weight})")
+
+    # The D-E link gets cheaper than C-E, so it replaces C-E in the tree
+    removed = dynamic.decrease_weight('D', 'E', 2)
+    print(f"After D-E drops to 2, {removed} leaves the tree: {dynamic.edges()} (total weight {dynamic.total_weight})")
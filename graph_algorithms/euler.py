@@ -0,0 +1,146 @@
+def find_eulerian_circuit(graph):
+    """
+    Finds an Eulerian circuit in a graph, if it exists.
+    An Eulerian circuit is a cycle that visits every edge exactly once and returns to the starting node.
+
+    Parameters:
+    graph: A dictionary representing the graph as an adjacency list.
+           Each key is a node, and the corresponding value is a list of neighbors (edges).
+
+    Returns:
+    A list representing the Eulerian circuit, if it exists.
+    Raises a ValueError if the graph doesn't have an Eulerian circuit.
+    """
+
+    # Verify that the graph has an Eulerian circuit
+    # For a graph to have an Eulerian circuit, all vertices must have an even degree
+    for node in graph:
+        if len(graph[node]) % 2 != 0:
+            # If any node has an odd degree, raise an error
+            raise ValueError("Graph doesn't have an Eulerian circuit: vertex {} has odd degree.".format(node))
+
+    # Walk the circuit without touching the caller's adjacency lists
+    return find_eulerian_trail(graph)
+
+
+def find_eulerian_trail(graph, directed=False):
+    """
+    Finds an Eulerian circuit or path (a walk that uses every edge exactly once) in O(E) time.
+
+    Every edge gets an id, used edges are marked in a bitmap and each vertex keeps a cursor into its
+    edge list, so no adjacency list is ever searched or modified and the input graph is left untouched.
+    Multigraphs (repeated neighbors) and self-loops are supported.
+
+    Parameters:
+    graph: A dictionary representing the graph as an adjacency list.
+           Each key is a node, and the corresponding value is a list of neighbors (edges).
+           For undirected graphs every edge must be listed from both ends (a self-loop appears
+           twice in its own list); for directed graphs each entry is one edge node -> neighbor.
+    directed: Whether the edges are directed.
+
+    Returns:
+    A list of nodes along the trail. It is a circuit (first node == last node) when every vertex is
+    balanced, otherwise a path between the two odd (or unbalanced) vertices.
+    Raises a ValueError if the graph has no Eulerian circuit or path.
+    """
+
+    # Number the nodes, including any that only appear as a neighbor
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for v in neighbors:
+            if v not in index:
+                index[v] = len(nodes)
+                nodes.append(v)
+    n = len(nodes)
+
+    # adjacency[u] holds (edge id, other end) pairs for the edges that can be taken from u
+    adjacency = [[] for _ in range(n)]
+    m = 0
+    if directed:
+        in_degree = [0] * n
+        for node, neighbors in graph.items():
+            u = index[node]
+            for v in neighbors:
+                v = index[v]
+                adjacency[u].append((m, v))
+                in_degree[v] += 1
+                m += 1
+    else:
+        # Pair each listing u -> v with a matching v -> u listing so both share one edge id
+        unmatched = {}
+        for node, neighbors in graph.items():
+            u = index[node]
+            for v in neighbors:
+                v = index[v]
+                waiting = unmatched.get((v, u))
+                if waiting:
+                    waiting.pop()
+                    adjacency[u].append((m, v))
+                    adjacency[v].append((m, u))
+                    m += 1
+                else:
+                    unmatched.setdefault((u, v), []).append(None)
+        if any(unmatched.values()):
+            raise ValueError("Graph adjacency lists are not symmetric: some edges are only listed from one end.")
+
+    if m == 0:
+        return nodes[:1]
+
+    # Pick the start vertex from the degree conditions
+    if directed:
+        starts = [u for u in range(n) if len(adjacency[u]) - in_degree[u] == 1]
+        ends = [u for u in range(n) if in_degree[u] - len(adjacency[u]) == 1]
+        balanced = all(abs(len(adjacency[u]) - in_degree[u]) <= 1 for u in range(n))
+        if not balanced or len(starts) != len(ends) or len(starts) > 1:
+            raise ValueError("Graph doesn't have an Eulerian circuit or path: too many unbalanced vertices.")
+    else:
+        starts = [u for u in range(n) if len(adjacency[u]) % 2 != 0]
+        if len(starts) not in (0, 2):
+            raise ValueError(
+                "Graph doesn't have an Eulerian circuit or path: {} vertices have odd degree.".format(len(starts)))
+    start = starts[0] if starts else next(u for u in range(n) if adjacency[u])
+
+    # Hierholzer: follow unused edges until stuck, then backtrack onto the trail
+    used = bytearray(m)
+    cursor = [len(edges) for edges in adjacency]  # Edges are taken from the end of each list
+    stack = [start]
+    trail = []
+    while stack:
+        u = stack[-1]
+        edges = adjacency[u]
+        i = cursor[u]
+        while i > 0 and used[edges[i - 1][0]]:
+            i -= 1  # Skip edges already used from the other end
+        if i > 0:
+            e, v = edges[i - 1]
+            cursor[u] = i - 1
+            used[e] = 1
+            stack.append(v)
+        else:
+            cursor[u] = 0
+            trail.append(stack.pop())
+
+    if len(trail) != m + 1:
+        raise ValueError("Graph doesn't have an Eulerian circuit or path: its edges are not connected.")
+
+    # Reverse the trail to get the correct order (since we backtracked)
+    trail.reverse()
+    return [nodes[u] for u in trail]
+
+
+if __name__ == "__main__":
+    # Example graph represented as an adjacency list
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D'],
+        'C': ['A', 'D'],
+        'D': ['B', 'C']
+    }
+
+    # Try to find the Eulerian circuit in the graph
+    try:
+        eulerian_circuit = find_eulerian_circuit(graph)
+        print("Eulerian Circuit:", eulerian_circuit)
+    except ValueError as e:
+        print(e)
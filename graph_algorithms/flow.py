@@ -0,0 +1,841 @@
+import numbers
+import time
+from collections import deque, namedtuple
+
+from .csr import CSRGraph
+
+
+# A single step of ford_fulkerson, handed to the trace callback.
+# kind is "augment" after every augmenting path and "done" once at the end.
+# residual_graph is the live residual matrix (not a copy), so callbacks should not keep it around.
+FlowEvent = namedtuple("FlowEvent", ["kind", "step", "path", "path_flow", "max_flow", "residual_graph"])
+
+
+class FlowCounters:
+    """
+    Counter-only instrumentation for ford_fulkerson.
+
+    Pass an instance as counters= and read the fields afterwards:
+    augmentations, bfs_runs, nodes_visited, edges_scanned and phase_times
+    (wall-clock seconds spent in the "bfs" and "augment" phases).
+    """
+
+    __slots__ = ("augmentations", "bfs_runs", "nodes_visited", "edges_scanned", "phase_times")
+
+    def __init__(self):
+        self.augmentations = 0
+        self.bfs_runs = 0
+        self.nodes_visited = 0
+        self.edges_scanned = 0
+        self.phase_times = {"bfs": 0.0, "augment": 0.0}
+
+    def as_dict(self):
+        """Return the counters as a plain dictionary, e.g. for logging or JSON export."""
+        return {
+            "augmentations": self.augmentations,
+            "bfs_runs": self.bfs_runs,
+            "nodes_visited": self.nodes_visited,
+            "edges_scanned": self.edges_scanned,
+            "phase_times": dict(self.phase_times),
+        }
+
+
+def print_trace(event):
+    """
+    Trace callback that prints every step, the way ford_fulkerson always used to.
+
+    Args:
+        event (FlowEvent): The step to print.
+    """
+    if event.kind == "augment":
+        print(f"\n--- Augmenting Path Step {event.step} ---")
+        print(f"Augmenting Path: {event.path}")
+        print(f"Path Flow: {event.path_flow}")
+        print(f"Updated Max Flow: {event.max_flow}")
+        print("Residual Graph:")
+        for row in event.residual_graph:
+            print(row)
+    elif event.kind == "done":
+        print("\n--- Final Result ---")
+        print(f"Maximum Flow: {event.max_flow}")
+
+
+def check_source_sink(graph, source, sink):
+    """
+    Checks to make sure that the given source has in-degree 0 and the given sink has out-degree 0.
+
+    Args:
+        graph: The adjacency matrix of the graph.
+        source: The source node.
+        sink: The sink node.
+
+    Returns:
+        bool: True if both conditions are met, False otherwise.
+    """
+    # Check in-degree of the source
+    for row in graph:
+        if row[source] > 0:
+            print(f"Error: Source node {source} has a non-zero in-degree.")
+            return False
+
+    # Check out-degree of the sink
+    for capacity in graph[sink]:
+        if capacity > 0:
+            print(f"Error: Sink node {sink} has a non-zero out-degree.")
+            return False
+
+    return True
+
+
+def bfs_capacity(residual_graph, source, sink, parent, counters=None):
+    """
+    Perform BFS to find an augmenting path in the residual graph.
+
+    Args:
+        residual_graph: The residual capacity graph.
+        source: The source node.
+        sink: The sink node.
+        parent: List to store the path.
+        counters (FlowCounters): Optional counters for visited nodes and scanned edges.
+
+    Returns:
+        bool: True if an augmenting path is found, False otherwise.
+    """
+    visited = [False] * len(residual_graph)
+    queue = deque([source])
+    visited[source] = True
+
+    if counters is not None:
+        counters.bfs_runs += 1
+
+    while queue:
+        current_node = queue.popleft()
+
+        if counters is not None:
+            counters.nodes_visited += 1
+            counters.edges_scanned += len(residual_graph[current_node])
+
+        for next_node, capacity in enumerate(residual_graph[current_node]):
+            if not visited[next_node] and capacity > 0:  # Positive capacity indicates a possible path
+                queue.append(next_node)
+                visited[next_node] = True
+                parent[next_node] = current_node
+                if next_node == sink:
+                    return True
+    return False
+
+
+def ford_fulkerson(graph, source, sink, trace=None, counters=None):
+    """
+    Implements the Ford-Fulkerson algorithm to find the maximum flow in a network.
+
+    Args:
+        graph (list of list): The adjacency matrix representing the capacities of the graph.
+                              A CSRGraph is turned into one (parallel edges add up).
+        source (int): The source node.
+        sink (int): The sink node.
+        trace (callable): Optional callback receiving a FlowEvent for every step.
+                          Nothing is printed by default, pass print_trace for the step-by-step output.
+        counters (FlowCounters): Optional counters filled in while the algorithm runs.
+
+    Returns:
+        int: The maximum flow from source to sink.
+    """
+
+    if isinstance(graph, CSRGraph):
+        dense = graph.to_dense(no_edge=0, combine="sum")
+        graph = (dense.astype(int) if (dense == dense.round()).all() else dense).tolist()
+
+    # Check to make sure source and sink are valid, with proper in and out degrees
+    if not check_source_sink(graph, source, sink):
+        return
+
+    # Create a residual graph and initialize it with the capacities of the original graph
+    residual_graph = [row[:] for row in graph]
+    parent = [-1] * len(graph)  # To store the path
+    max_flow = 0
+
+    step = 1
+    clock = time.perf_counter if counters is not None else None
+    started = clock() if clock else 0.0
+
+    # Augment the flow while there is an augmenting path
+    while bfs_capacity(residual_graph, source, sink, parent, counters):
+        if clock:
+            now = clock()
+            counters.phase_times["bfs"] += now - started
+            started = now
+
+        # Trace back the path from sink to source to find the minimum capacity (path flow)
+        path_flow = float('Inf')
+        current_node = sink
+        path = []  # To store the current augmenting path
+        while current_node != source:
+            path.append((parent[current_node], current_node))
+            path_flow = min(path_flow, residual_graph[parent[current_node]][current_node])
+            current_node = parent[current_node]
+        path.reverse()
+
+        # Update the residual graph capacities along the path
+        current_node = sink
+        while current_node != source:
+            prev_node = parent[current_node]
+            residual_graph[prev_node][current_node] -= path_flow
+            residual_graph[current_node][prev_node] += path_flow
+            current_node = parent[current_node]
+
+        # Add path flow to the overall flow
+        max_flow += path_flow
+
+        # Report the step
+        if trace is not None:
+            trace(FlowEvent("augment", step, path, path_flow, max_flow, residual_graph))
+        if clock:
+            counters.augmentations += 1
+            now = clock()
+            counters.phase_times["augment"] += now - started
+            started = now
+
+        step += 1
+
+    if clock:
+        counters.phase_times["bfs"] += clock() - started
+
+    if trace is not None:
+        trace(FlowEvent("done", step - 1, None, None, max_flow, residual_graph))
+
+    return max_flow
+
+
+class FlowNetwork:
+    """
+    A flow network stored as flat edge arrays for the max-flow engines.
+
+    Every edge added with add_edge gets an index e, and its reverse (residual) edge is always e ^ 1,
+    so the pair is found without any lookups. to[e] is the head of edge e, cap[e] its remaining
+    residual capacity and capacity[e] its original capacity (0 for reverse edges). adjacency[u]
+    lists the indices of the edges leaving u, so a BFS only looks at real edges instead of
+    scanning a whole matrix row.
+    """
+
+    def __init__(self, num_nodes):
+        self.num_nodes = num_nodes
+        self.adjacency = [[] for _ in range(num_nodes)]  # Edge indices leaving each node
+        self.to = []  # Head node of each edge
+        self.cap = []  # Residual capacity of each edge
+        self.capacity = []  # Original capacity of each edge (0 for the reverse edges)
+        self.source_edges = {}  # Terminal -> its super-source edge (see with_terminals)
+        self.sink_edges = {}  # Terminal -> its super-sink edge
+
+    @classmethod
+    def from_matrix(cls, graph):
+        """
+        Build a network from a capacity adjacency matrix, like the one ford_fulkerson takes.
+        Only the non-zero entries become edges.
+        """
+        network = cls(len(graph))
+        for u, row in enumerate(graph):
+            for v, capacity in enumerate(row):
+                if capacity > 0:
+                    network.add_edge(u, v, capacity)
+        return network
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges):
+        """
+        Build a network from an iterable of (u, v, capacity) tuples over nodes 0..num_nodes-1.
+        """
+        network = cls(num_nodes)
+        for u, v, capacity in edges:
+            network.add_edge(u, v, capacity)
+        return network
+
+    @classmethod
+    def from_csr(cls, graph):
+        """
+        Build a network from a CSRGraph whose weights are the capacities (node indices, not labels).
+        Integral capacities are kept as ints so the flow stays exact; with an unbounded (inf)
+        capacity they all stay floats.
+        """
+        import numpy as np
+
+        sources, targets, weights = graph.edge_arrays()
+        to = np.empty(2 * len(targets), dtype=np.int64)
+        to[0::2] = targets
+        to[1::2] = sources
+        capacity = np.zeros(2 * len(targets), dtype=weights.dtype)
+        capacity[0::2] = weights
+        if np.isfinite(weights).all() and np.array_equal(weights, np.round(weights)):
+            capacity = capacity.astype(np.int64)
+        return cls.from_arrays(graph.num_nodes, to.tolist(), capacity.tolist())
+
+    @classmethod
+    def from_arrays(cls, num_nodes, to, capacity):
+        """
+        Build a fresh (zero-flow) network from the to/capacity edge arrays of another network,
+        e.g. views of a shared-memory block. The arrays are copied, so the source is never modified.
+        """
+        network = cls(num_nodes)
+        network.to = list(to)
+        network.capacity = list(capacity)
+        network.cap = list(network.capacity)
+        adjacency = network.adjacency
+        to = network.to
+        for e in range(len(to)):
+            # Edge e leaves the node its partner points to
+            adjacency[to[e ^ 1]].append(e)
+        return network
+
+    def copy(self):
+        """Return an independent copy of the network, including its current flow."""
+        network = FlowNetwork(self.num_nodes)
+        network.adjacency = [edges[:] for edges in self.adjacency]
+        network.to = self.to[:]
+        network.cap = self.cap[:]
+        network.capacity = self.capacity[:]
+        network.source_edges = dict(self.source_edges)
+        network.sink_edges = dict(self.sink_edges)
+        return network
+
+    def with_terminals(self, sources, sinks):
+        """
+        Return a copy of the network with a super-source joined to every node in sources and every
+        node in sinks joined to a super-sink, so several sources and sinks can be solved as one.
+
+        The joining edges get the total capacity around each terminal, which they can never exceed,
+        so they never limit the flow. They are recorded in source_edges and sink_edges, so that
+        MaxFlowResult can widen them when a capacity around a terminal grows.
+
+        Returns:
+            tuple: (network, super_source, super_sink), the super nodes being num_nodes and num_nodes + 1.
+        """
+        network = self.copy()
+        super_source, super_sink = network.num_nodes, network.num_nodes + 1
+        network.num_nodes += 2
+        network.adjacency += ([], [])
+        for s in sources:
+            network.source_edges[s] = network.add_edge(super_source, s, self._capacity_around(s))
+        for t in sinks:
+            network.sink_edges[t] = network.add_edge(t, super_sink, self._capacity_around(t, incoming=True))
+        return network, super_source, super_sink
+
+    def _capacity_around(self, node, incoming=False, skip=()):
+        """
+        Total original capacity of the edges leaving node (or entering it if incoming is True),
+        leaving out the edges to or from the nodes in skip.
+        """
+        to, capacity = self.to, self.capacity
+        if incoming:
+            # Odd entries of adjacency[node] are the reverse halves of the edges into node
+            return sum(capacity[e ^ 1] for e in self.adjacency[node] if e % 2 and to[e] not in skip)
+        return sum(capacity[e] for e in self.adjacency[node] if e % 2 == 0 and to[e] not in skip)
+
+    def add_edge(self, u, v, capacity):
+        """
+        Add the edge u -> v with the given capacity, together with its reverse residual edge.
+
+        Returns:
+            int: The index of the forward edge (the reverse edge is that index ^ 1).
+        """
+        e = len(self.to)
+        self.to += (v, u)
+        self.cap += (capacity, 0)
+        self.capacity += (capacity, 0)
+        self.adjacency[u].append(e)
+        self.adjacency[v].append(e + 1)
+        return e
+
+    def flow(self, e):
+        """Return the flow currently sent along the forward edge e."""
+        return self.capacity[e] - self.cap[e]
+
+    def find_edge(self, u, v):
+        """
+        Return the index of the first forward edge u -> v, or None if there is no such edge.
+        """
+        to = self.to
+        for e in self.adjacency[u]:
+            if e % 2 == 0 and to[e] == v:
+                return e
+        return None
+
+    def set_capacity(self, e, capacity, source, sink):
+        """
+        Change the capacity of forward edge e while keeping the current source -> sink flow valid.
+
+        If the edge carries more flow than its new capacity, the excess is first rerouted around
+        the edge. Whatever can't be rerouted is sent back from the tail to the source and from the
+        sink back to the head, which lowers the flow value.
+
+        Args:
+            e (int): The forward edge index (as returned by add_edge or find_edge).
+            capacity: The new capacity.
+            source (int): The source node of the current flow.
+            sink (int): The sink node of the current flow.
+
+        Returns:
+            The amount by which the flow value dropped (0 unless the edge was over capacity).
+        """
+        flow = self.flow(e)
+        self.capacity[e] = capacity
+        if flow <= capacity:
+            self.cap[e] = capacity - flow
+            return 0
+
+        # Take the excess off the edge, leaving the tail with too much flow and the head with too little
+        excess = flow - capacity
+        self.cap[e] = 0
+        self.cap[e ^ 1] -= excess
+        u, v = self.to[e ^ 1], self.to[e]
+
+        # Try to send the excess from u to v along other edges first
+        lost = excess - self._dinic(u, v, excess)
+
+        # Anything left is cancelled along the flow paths that went through the edge
+        if lost:
+            if u != source:
+                self._dinic(u, source, lost)
+            if v != sink:
+                self._dinic(sink, v, lost)
+        return lost
+
+    def min_cut(self, source):
+        """
+        Return the minimum cut after a max-flow computation.
+
+        Returns:
+            tuple: (source_side, cut_edges) where source_side is the set of nodes still reachable
+                   from the source in the residual graph, and cut_edges is a list of
+                   (u, v, capacity) tuples for the saturated edges leaving that set.
+        """
+        level = self._levels(source)
+        to, capacity = self.to, self.capacity
+        source_side = {v for v, d in enumerate(level) if d >= 0}
+        cut_edges = [
+            (to[e ^ 1], to[e], capacity[e])
+            for e in range(0, len(to), 2)
+            if level[to[e ^ 1]] >= 0 and level[to[e]] < 0
+        ]
+        return source_side, cut_edges
+
+    def max_flow(self, source, sink, method="dinic"):
+        """
+        Compute the maximum flow from source to sink, starting from the flow already in the network.
+
+        Args:
+            source (int): The source node.
+            sink (int): The sink node.
+            method (str): "dinic" for Dinic's level-graph blocking flow, or
+                          "push_relabel" for highest-label push-relabel with the gap heuristic.
+
+        Returns:
+            int: The amount of flow added by this call (the maximum flow on a fresh network).
+        """
+        if method == "dinic":
+            return self._dinic(source, sink)
+        if method == "push_relabel":
+            return self._push_relabel(source, sink)
+        raise ValueError(f"Unknown max-flow method {method!r}, expected 'dinic' or 'push_relabel'.")
+
+    def _levels(self, start, reverse=False):
+        """
+        BFS distances in the residual graph from start (or towards start if reverse is True).
+        Unreachable nodes get -1.
+        """
+        adjacency, to, cap = self.adjacency, self.to, self.cap
+        level = [-1] * self.num_nodes
+        level[start] = 0
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            next_level = level[u] + 1
+            for e in adjacency[u]:
+                v = to[e]
+                # Going backwards, the residual edge we need is v -> u, which is e's partner
+                if level[v] < 0 and cap[e ^ 1 if reverse else e] > 0:
+                    level[v] = next_level
+                    queue.append(v)
+        return level
+
+    def _dinic(self, source, sink, limit=float('inf')):
+        """
+        Dinic's algorithm: repeatedly build the BFS level graph and saturate it with a blocking flow.
+        Stops early once limit units have been sent.
+        """
+        if source == sink:
+            return 0
+
+        adjacency, to, cap = self.adjacency, self.to, self.cap
+        total = 0
+
+        while total < limit:
+            level = self._levels(source)
+            if level[sink] < 0:
+                break  # Sink no longer reachable, the flow is maximum
+
+            # Current-arc pointers: edges before it[u] are known to be useless in this phase
+            it = [0] * self.num_nodes
+            path = []  # Edge indices from source to the current node
+            u = source
+            while True:
+                if u == sink:
+                    # Push the bottleneck capacity along the path found
+                    pushed = limit - total
+                    for e in path:
+                        if cap[e] < pushed:
+                            pushed = cap[e]
+                    for e in path:
+                        cap[e] -= pushed
+                        cap[e ^ 1] += pushed
+                    total += pushed
+                    if total >= limit:
+                        break
+                    path.clear()
+                    u = source
+                    continue
+
+                edges = adjacency[u]
+                i = it[u]
+                while i < len(edges):
+                    e = edges[i]
+                    if cap[e] > 0 and level[to[e]] == level[u] + 1:
+                        break
+                    i += 1
+                it[u] = i
+
+                if i < len(edges):
+                    # Advance along an admissible edge
+                    path.append(edges[i])
+                    u = to[edges[i]]
+                elif u == source:
+                    break  # Blocking flow reached for this level graph
+                else:
+                    # Dead end: remove u from the level graph and retreat one edge
+                    level[u] = -1
+                    e = path.pop()
+                    u = to[e ^ 1]
+                    it[u] += 1
+
+        return total
+
+    def _push_relabel(self, source, sink):
+        """
+        Highest-label push-relabel with the gap heuristic.
+        Heights start at the exact BFS distances to the sink.
+        """
+        if source == sink:
+            return 0
+
+        n = self.num_nodes
+        adjacency, to, cap = self.adjacency, self.to, self.cap
+
+        height = [d if d >= 0 else n for d in self._levels(sink, reverse=True)]
+        height[source] = n
+        excess = [0] * n
+        count = [0] * (2 * n + 1)  # Number of nodes at each height, for the gap heuristic
+        for h in height:
+            count[h] += 1
+        active = [[] for _ in range(2 * n + 1)]  # Active nodes bucketed by height
+        highest = 0
+
+        # Saturate every edge out of the source
+        for e in adjacency[source]:
+            pushed = cap[e]
+            if pushed > 0:
+                v = to[e]
+                cap[e] = 0
+                cap[e ^ 1] += pushed
+                if excess[v] == 0 and v != sink and v != source:
+                    active[height[v]].append(v)
+                    highest = max(highest, height[v])
+                excess[v] += pushed
+
+        it = [0] * n
+        while highest >= 0:
+            if not active[highest]:
+                highest -= 1
+                continue
+            u = active[highest].pop()
+            edges = adjacency[u]
+
+            # Discharge u: push its excess along admissible edges, relabelling when stuck
+            while excess[u] > 0:
+                if it[u] == len(edges):
+                    old = height[u]
+                    new = 2 * n
+                    for e in edges:
+                        if cap[e] > 0 and height[to[e]] + 1 < new:
+                            new = height[to[e]] + 1
+                    count[old] -= 1
+                    if count[old] == 0 and old < n:
+                        # Gap: nothing left at this height, so nodes above it can't reach the sink
+                        for v in range(n):
+                            if old < height[v] < n:
+                                count[height[v]] -= 1
+                                height[v] = n + 1
+                                count[n + 1] += 1
+                        new = max(new, n + 1)
+                    height[u] = new
+                    count[new] += 1
+                    it[u] = 0
+                    continue
+
+                e = edges[it[u]]
+                v = to[e]
+                if cap[e] > 0 and height[u] == height[v] + 1:
+                    pushed = min(excess[u], cap[e])
+                    cap[e] -= pushed
+                    cap[e ^ 1] += pushed
+                    excess[u] -= pushed
+                    if excess[v] == 0 and v != sink and v != source:
+                        active[height[v]].append(v)
+                        highest = max(highest, height[v])
+                    excess[v] += pushed
+                else:
+                    it[u] += 1
+
+        return excess[sink]
+
+
+class MaxFlowResult:
+    """
+    A solved max-flow problem that can be inspected and warm-restarted.
+
+    Attributes:
+        network (FlowNetwork): The network holding the current flow in its residual capacities.
+        source (int): The source node.
+        sink (int): The sink node.
+        method (str): The max-flow method used to (re)augment.
+        value: The current maximum flow value.
+    """
+
+    def __init__(self, network, source, sink, method="dinic"):
+        self.network = network
+        self.source = source
+        self.sink = sink
+        self.method = method
+        self.value = network.max_flow(source, sink, method)
+        self._cut = None
+
+    @property
+    def source_side(self):
+        """The set of nodes on the source side of the minimum cut."""
+        return self._min_cut()[0]
+
+    @property
+    def cut_edges(self):
+        """The (u, v, capacity) edges crossing the minimum cut; their capacities add up to value."""
+        return self._min_cut()[1]
+
+    def _min_cut(self):
+        if self._cut is None:
+            self._cut = self.network.min_cut(self.source)
+        return self._cut
+
+    def set_capacity(self, u, v, capacity):
+        """
+        Change the capacity of edge u -> v (adding the edge if it doesn't exist yet).
+        The flow is kept valid but isn't maximal again until resume() is called.
+        """
+        e = self.network.find_edge(u, v)
+        if e is None:
+            self.network.add_edge(u, v, capacity)
+        else:
+            self.value -= self.network.set_capacity(e, capacity, self.source, self.sink)
+        self._widen_terminal_edges(u, v)
+        self._cut = None
+
+    def _widen_terminal_edges(self, u, v):
+        """
+        With several sources or sinks, raise the super-source edge into u and the super-sink edge out
+        of v to the capacity now around them, so they still never limit the flow.
+        """
+        network = self.network
+        skip = (self.source, self.sink)
+        e = network.source_edges.get(u)
+        if e is not None:
+            needed = network._capacity_around(u, skip=skip)
+            if needed > network.capacity[e]:
+                network.set_capacity(e, needed, self.source, self.sink)  # Growing never changes the flow
+        e = network.sink_edges.get(v)
+        if e is not None:
+            needed = network._capacity_around(v, incoming=True, skip=skip)
+            if needed > network.capacity[e]:
+                network.set_capacity(e, needed, self.source, self.sink)
+
+    def resume(self):
+        """
+        Augment from the current flow back to a maximum flow instead of restarting from zero.
+
+        Returns:
+            The new maximum flow value.
+        """
+        self.value += self.network.max_flow(self.source, self.sink, self.method)
+        self._cut = None
+        return self.value
+
+    def update_capacities(self, changes):
+        """
+        Apply several (u, v, capacity) changes and resume once.
+
+        Returns:
+            The new maximum flow value.
+        """
+        for u, v, capacity in changes:
+            self.set_capacity(u, v, capacity)
+        return self.resume()
+
+
+def _as_network(graph):
+    """Return graph itself if it is a FlowNetwork, else a new network built from a matrix or CSRGraph."""
+    if isinstance(graph, FlowNetwork):
+        return graph
+    if isinstance(graph, CSRGraph):
+        return FlowNetwork.from_csr(graph)
+    return FlowNetwork.from_matrix(graph)
+
+
+def _with_terminals(network, source, sink):
+    """
+    Return (network, source, sink), adding a super-source / super-sink on a copy of the
+    network when source or sink is a collection of nodes rather than a single node.
+    """
+    # numbers.Integral so that NumPy integers (e.g. from np.argmax) count as single nodes too
+    if isinstance(source, numbers.Integral) and isinstance(sink, numbers.Integral):
+        return network, int(source), int(sink)
+    sources = [source] if isinstance(source, numbers.Integral) else list(source)
+    sinks = [sink] if isinstance(sink, numbers.Integral) else list(sink)
+    return network.with_terminals([int(s) for s in sources], [int(t) for t in sinks])
+
+
+def solve_max_flow(graph, source, sink, method="dinic"):
+    """
+    Like max_flow, but returns a MaxFlowResult with the minimum cut and warm-restart support.
+
+    Args:
+        graph: An adjacency matrix of capacities, a CSRGraph or a FlowNetwork (which is solved in place).
+        source: The source node, or a collection of source nodes.
+        sink: The sink node, or a collection of sink nodes.
+        method (str): "dinic" or "push_relabel".
+
+    Returns:
+        MaxFlowResult: The solved flow. With several sources or sinks it is solved on a copy of the
+                       network with a super-source and super-sink added as its last two nodes.
+    """
+    network = _as_network(graph)
+    network, source, sink = _with_terminals(network, source, sink)
+    return MaxFlowResult(network, source, sink, method)
+
+
+def max_flow(graph, source, sink, method="dinic"):
+    """
+    Computes the maximum flow with Dinic's algorithm or push-relabel on a compact edge-array network.
+    Unlike ford_fulkerson, this doesn't print anything, runs in time proportional to the edges and
+    doesn't require the source to have in-degree 0 or the sink out-degree 0.
+
+    Args:
+        graph: An adjacency matrix of capacities (like ford_fulkerson takes), a CSRGraph or a FlowNetwork.
+        source: The source node, or a collection of source nodes.
+        sink: The sink node, or a collection of sink nodes.
+        method (str): "dinic" or "push_relabel".
+
+    Returns:
+        int: The maximum flow from the sources to the sinks.
+    """
+    network = _as_network(graph)
+    network, source, sink = _with_terminals(network, source, sink)
+    return network.max_flow(source, sink, method)
+
+
+def batch_max_flow(graph, queries, method="dinic", processes=None):
+    """
+    Solves many independent max-flow queries over one read-only network.
+
+    With processes > 1 the queries are spread over a process pool. The network's edge arrays are
+    written once into a shared-memory block that every worker attaches to, instead of being
+    pickled for every task; each query then runs on the worker's own residual copy.
+
+    Args:
+        graph: An adjacency matrix of capacities, a CSRGraph or a FlowNetwork (left unchanged; every
+               query starts from zero flow, even if the network already carries some).
+        queries: A list of (sources, sinks) pairs; each side is a node or a collection of nodes.
+        method (str): "dinic" or "push_relabel".
+        processes (int): Number of worker processes, or None to solve the queries in this process.
+
+    Returns:
+        list: The maximum flow value of each query, in the same order.
+    """
+    network = _as_network(graph)
+
+    if not processes or processes <= 1:
+        # Zero-flow copies, the same networks the workers rebuild from shared memory
+        return [max_flow(FlowNetwork.from_arrays(network.num_nodes, network.to, network.capacity),
+                         sources, sinks, method)
+                for sources, sinks in queries]
+
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    # Layout: [num_nodes, num_edges, is_float] then to[num_edges] then capacity[num_edges], 8 bytes each
+    m = len(network.to)
+    is_float = any(isinstance(c, float) for c in network.capacity)
+    shm = shared_memory.SharedMemory(create=True, size=8 * (3 + 2 * m))
+    try:
+        words = shm.buf.cast('q')
+        words[0:3] = array('q', (network.num_nodes, m, int(is_float)))
+        words[3:3 + m] = array('q', network.to)
+        words.release()
+        capacities = shm.buf[8 * (3 + m):8 * (3 + 2 * m)].cast('d' if is_float else 'q')
+        capacities[:] = array('d' if is_float else 'q', network.capacity)
+        capacities.release()
+
+        with ProcessPoolExecutor(processes, initializer=_batch_init, initargs=(shm.name,)) as pool:
+            chunk = max(1, len(queries) // (processes * 4))
+            return list(pool.map(_batch_query, [(s, t, method) for s, t in queries], chunksize=chunk))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Per-worker network rebuilt from shared memory by _batch_init
+_batch_network = None
+
+
+def _batch_init(name):
+    """Process pool initializer: attach to the shared network block and build the edge arrays once."""
+    global _batch_network
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    words = shm.buf.cast('q')
+    num_nodes, m, is_float = words[0], words[1], words[2]
+    to = words[3:3 + m]
+    capacities = shm.buf[8 * (3 + m):8 * (3 + 2 * m)].cast('d' if is_float else 'q')
+    _batch_network = FlowNetwork.from_arrays(num_nodes, to, capacities)
+    to.release()
+    capacities.release()
+    words.release()
+    shm.close()
+
+
+def _batch_query(query):
+    """Solve one (sources, sinks, method) query on a residual copy of the worker's network."""
+    sources, sinks, method = query
+    return max_flow(_batch_network.copy(), sources, sinks, method)
+
+
+if __name__ == "__main__":
+    graph = [
+        [0, 16, 13, 0, 0, 0],
+        [0, 0, 10, 12, 0, 0],
+        [0, 4, 0, 0, 14, 0],
+        [0, 0, 9, 0, 0, 20],
+        [0, 0, 0, 7, 0, 4],
+        [0, 0, 0, 0, 0, 0]
+    ]
+
+    source = 0
+    sink = 5
+
+    ford_fulkerson(graph, source, sink, trace=print_trace)
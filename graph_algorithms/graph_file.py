@@ -0,0 +1,211 @@
+import struct
+
+from .csr import CSRGraph, _index_dtype
+
+# File layout (little-endian):
+#   64-byte header: magic, version, offset width (4 or 8 bytes), num_nodes, num_edges, label bytes
+#   offsets[num_nodes + 1]  int32 or int64
+#   targets[num_edges]      int32
+#   weights[num_edges]      float64
+#   labels                  UTF-8 JSON list (only if the graph has labels)
+# Every array starts on an 8-byte boundary so it can be memory-mapped in place.
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")
+HEADER_SIZE = 64
+
+
+def save_graph(path, graph):
+    """
+    Write a graph to a binary file that load_graph can memory-map.
+
+    Parameters:
+    path: The file to write.
+    graph: A CSRGraph, or anything CSRGraph.from_dict accepts. Labels (if any) must be JSON values.
+    """
+    import json
+
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+
+    labels = json.dumps(graph.labels).encode("utf-8") if graph.labels is not None else b""
+    offset_width = graph.offsets.dtype.itemsize
+    layout = _layout(offset_width, graph.num_nodes, graph.num_edges)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, offset_width, graph.num_nodes, graph.num_edges,
+                             len(labels)).ljust(HEADER_SIZE, b"\0"))
+        for array, (dtype, _, _) in zip((graph.offsets, graph.targets, graph.weights), layout):
+            data = array.astype(dtype).tobytes()
+            f.write(data + b"\0" * (-len(data) % 8))
+        f.write(labels)
+
+
+def load_graph(path, mmap=True):
+    """
+    Open a graph written by save_graph or convert_edge_list.
+
+    With mmap=True (default) the arrays are read-only memory maps of the file, so opening takes
+    constant time and memory no matter how big the graph is; pages are only read when an algorithm
+    touches them. The returned CSRGraph wraps the maps without copying them.
+
+    Parameters:
+    path: The file to open.
+    mmap: If False, the arrays are read into memory instead.
+
+    Returns:
+    A CSRGraph.
+    """
+    import json
+
+    import numpy as np
+
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or header[:8] != MAGIC:
+        raise ValueError(f"{path} is not a graph file.")
+    _, version, offset_width, n, m, label_bytes = _HEADER.unpack_from(header)
+    if version != VERSION:
+        raise ValueError(f"Unsupported graph file version {version}.")
+
+    layout = _layout(offset_width, n, m)
+    arrays = []
+    for dtype, start, count in layout:
+        if mmap and count:
+            arrays.append(np.memmap(path, dtype=dtype, mode="r", offset=start, shape=(count,)))
+        else:
+            arrays.append(np.fromfile(path, dtype=dtype, count=count, offset=start))
+
+    labels = None
+    if label_bytes:
+        with open(path, "rb") as f:
+            f.seek(layout[-1][1] + _padded(8 * m))
+            labels = json.loads(f.read(label_bytes).decode("utf-8"))
+    return CSRGraph(*arrays, labels=labels)
+
+
+def convert_edge_list(source, path, directed=False, num_nodes=None, delimiter=None, comments="#",
+                      skip_rows=0, chunk_lines=1_000_000):
+    """
+    Convert a text edge list (one "u v [weight]" per line, or CSV with delimiter=",") into a graph
+    file, streaming the text in chunks so memory stays at O(num_nodes + chunk_lines).
+
+    The file is read twice: the first pass counts the degree of every node to get the offsets, the
+    second pass drops every edge straight into its slot of the memory-mapped output.
+
+    Parameters:
+    source: Path of the text file. Nodes must be integers 0..num_nodes-1; a missing weight is 1.
+    path: The graph file to write.
+    directed: If False, every edge is stored from both ends.
+    num_nodes: Number of nodes (defaults to the largest node + 1).
+    delimiter, comments: Passed to numpy.loadtxt for each chunk.
+    skip_rows: Lines to skip at the top (e.g. a CSV header).
+    chunk_lines: Lines parsed per chunk.
+
+    Returns:
+    The converted graph, memory-mapped from path.
+    """
+    import numpy as np
+
+    # Pass 1: degrees
+    degrees = np.zeros(num_nodes or 0, dtype=np.int64)
+    for sources, targets, _ in _edge_chunks(source, directed, delimiter, comments, skip_rows, chunk_lines):
+        counts = np.bincount(sources, minlength=len(degrees))
+        if len(counts) > len(degrees):
+            counts[:len(degrees)] += degrees
+            degrees = counts
+        else:
+            degrees += counts
+        top = int(targets.max()) + 1 if len(targets) else 0
+        if top > len(degrees):
+            degrees = np.concatenate((degrees, np.zeros(top - len(degrees), dtype=np.int64)))
+    n = len(degrees)
+    if num_nodes is not None and n > num_nodes:
+        raise ValueError(f"The edge list has nodes beyond num_nodes={num_nodes}.")
+    m = int(degrees.sum())
+
+    # Pass 2: write the header and offsets, then place the edges through memory maps of the arrays
+    offset_width = np.dtype(_index_dtype(m)).itemsize
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    layout = _layout(offset_width, n, m)
+    end = layout[-1][1] + _padded(8 * m)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, offset_width, n, m, 0).ljust(HEADER_SIZE, b"\0"))
+        f.write(offsets.astype(layout[0][0]).tobytes())
+        f.truncate(end)
+
+    if m:
+        out_targets = np.memmap(path, dtype=layout[1][0], mode="r+", offset=layout[1][1], shape=(m,))
+        out_weights = np.memmap(path, dtype=layout[2][0], mode="r+", offset=layout[2][1], shape=(m,))
+        cursor = offsets[:-1].copy()  # Next free slot of every node
+        for sources, targets, weights in _edge_chunks(source, directed, delimiter, comments, skip_rows,
+                                                      chunk_lines):
+            # Rank each edge among the chunk's edges with the same source, keeping the file order
+            order = np.argsort(sources, kind="stable")
+            grouped = sources[order]
+            rank = np.arange(len(grouped)) - np.searchsorted(grouped, grouped)
+            slots = cursor[grouped] + rank
+            out_targets[slots] = targets[order]
+            out_weights[slots] = weights[order]
+            cursor += np.bincount(sources, minlength=n)
+        out_targets.flush()
+        out_weights.flush()
+        del out_targets, out_weights
+
+    return load_graph(path)
+
+
+def _edge_chunks(source, directed, delimiter, comments, skip_rows, chunk_lines):
+    """Like _text_edge_chunks, but with every edge also listed from its head if not directed."""
+    import numpy as np
+
+    for sources, targets, weights in _text_edge_chunks(source, delimiter, comments, skip_rows, chunk_lines):
+        if not directed:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            weights = np.concatenate((weights, weights))
+        yield sources, targets, weights
+
+
+def _text_edge_chunks(source, delimiter=None, comments="#", skip_rows=0, chunk_lines=1_000_000):
+    """
+    Yield (sources, targets, weights) arrays for every chunk of lines of a text edge list: one
+    "u v [weight]" per line (split on delimiter, whitespace by default), integer endpoints, a missing
+    weight is 1, and blank lines and comments are skipped. Shared with kruskal_from_file.
+    """
+    import itertools
+    import warnings
+
+    import numpy as np
+
+    with open(source) as f:
+        for _ in range(skip_rows):
+            next(f, None)
+        while True:
+            lines = list(itertools.islice(f, chunk_lines))
+            if not lines:
+                return
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # A chunk of only comments is fine
+                table = np.loadtxt(lines, delimiter=delimiter, comments=comments, ndmin=2)
+            if not len(table):
+                continue
+            if table.shape[1] < 2:
+                raise ValueError(f"{source}: every edge needs at least two columns (u and v).")
+            sources = table[:, 0].astype(np.int64)
+            targets = table[:, 1].astype(np.int64)
+            weights = table[:, 2] if table.shape[1] > 2 else np.ones(len(table))
+            yield sources, targets, weights
+
+
+def _layout(offset_width, n, m):
+    """(dtype, byte offset, count) of the offsets, targets and weights arrays."""
+    offsets_at = HEADER_SIZE
+    targets_at = offsets_at + _padded(offset_width * (n + 1))
+    weights_at = targets_at + _padded(4 * m)
+    return [("<i4" if offset_width == 4 else "<i8", offsets_at, n + 1), ("<i4", targets_at, m),
+            ("<f8", weights_at, m)]
+
+
+def _padded(nbytes):
+    """Round a byte count up to a multiple of 8."""
+    return nbytes + (-nbytes % 8)
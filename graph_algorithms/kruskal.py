@@ -0,0 +1,339 @@
+import heapq
+import itertools
+import os
+import tempfile
+from array import array
+
+from .csr import CSRGraph
+
+# Record layout of binary edge files: little-endian int32 endpoints and a float64 weight (16 bytes per edge)
+EDGE_RECORD = [("u", "<i4"), ("v", "<i4"), ("w", "<f8")]
+
+
+class UnionFind:
+    """
+    A class to represent the Union-Find data structure.
+    It supports the union and find operations with path halving and union by rank.
+
+    Nodes are numbered 0..n-1 and the parents and ranks are kept in contiguous integer arrays,
+    so large graphs don't need a dictionary entry per node for each of them.
+    find_index / union_index work on those indices directly.
+    """
+
+    __slots__ = ("nodes", "index", "parent", "rank")
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)  # Index -> node
+        self.index = {node: i for i, node in enumerate(self.nodes)}  # Node -> index
+        self.parent = array('q', range(len(self.nodes)))  # Initially, each node is its own parent
+        self.rank = bytearray(len(self.nodes))  # Initially, each node has rank 0
+
+    @classmethod
+    def of_size(cls, n):
+        """
+        Create a Union-Find over the integers 0..n-1 without the node <-> index maps,
+        for callers that only use find_index / union_index (e.g. very large edge files).
+        """
+        uf = cls.__new__(cls)
+        uf.nodes = None
+        uf.index = None
+        uf.parent = array('q', range(n))
+        uf.rank = bytearray(n)
+        return uf
+
+    def find(self, node):
+        """
+        Find the root of the set containing the node.
+        """
+        return self.nodes[self.find_index(self.index[node])]
+
+    def union(self, node1, node2):
+        """
+        Unite the sets containing node1 and node2.
+        Returns True if they were in different sets.
+        """
+        return self.union_index(self.index[node1], self.index[node2])
+
+    def find_index(self, i):
+        """
+        Find the root index of the set containing index i.
+        Iterative path halving: every visited node is pointed at its grandparent,
+        so long chains never hit the recursion limit.
+        """
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union_index(self, i, j):
+        """
+        Unite the sets containing indices i and j.
+        Returns True if they were in different sets.
+        """
+        root1 = self.find_index(i)
+        root2 = self.find_index(j)
+        if root1 == root2:
+            return False
+
+        # Union by rank: attach the smaller tree under the larger tree
+        rank = self.rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1  # Increase rank if they were the same height
+        return True
+
+
+def kruskal_algorithm(graph):
+    """
+    Implements Kruskal's algorithm to find the Minimum Spanning Tree of a weighted, undirected graph.
+
+    Parameters:
+    graph: A dictionary where the keys are nodes, and the values are dictionaries of neighboring nodes and edge weights.
+           Example: {'A': {'B': 3, 'D': 1}, 'B': {'A': 3, 'D': 3, 'C': 1}, ...}
+           A CSRGraph is also accepted; its edges are then sorted as arrays.
+
+    Returns:
+    mst: A list of edges that form the minimum spanning tree. Each edge is represented as a tuple (node1, node2, weight).
+    total_weight: The total weight of all edges in the MST.
+    """
+
+    if isinstance(graph, CSRGraph):
+        return _kruskal_csr(graph)
+
+    # Initialize the Union-Find data structure
+    nodes = list(graph.keys())  # Get all the nodes in the graph
+    uf = UnionFind(nodes)
+    index = uf.index
+
+    # Create a list of all edges in the graph, where each edge is represented as a tuple (weight, index1, index2).
+    # Each undirected edge is listed from both ends, so only keep it from the end with the smaller index
+    # (or from the only end that lists it). This is O(1) per edge instead of searching the list.
+    edges = []
+    for node in graph:
+        i = index[node]
+        for neighbor, weight in graph[node].items():
+            j = index[neighbor]
+            if i < j or (i > j and node not in graph[neighbor]):
+                edges.append((weight, i, j))
+
+    # Sort all edges in non-decreasing order of their weight
+    edges.sort()
+
+    # List to store the edges in the Minimum Spanning Tree
+    mst = []
+
+    # Total weight of the MST
+    total_weight = 0
+
+    # Process each edge in the sorted list
+    for weight, i, j in edges:
+        # Union the sets containing both ends; this fails if the edge would form a cycle
+        if uf.union_index(i, j):
+            # If no cycle is formed, add this edge to the MST
+            mst.append((nodes[i], nodes[j], weight))
+            total_weight += weight
+
+            # A spanning tree has exactly n - 1 edges
+            if len(mst) == len(nodes) - 1:
+                break
+
+    return mst, total_weight
+
+
+def _kruskal_csr(graph):
+    """
+    kruskal_algorithm on a CSRGraph: the edge list comes straight from the CSR arrays and is sorted
+    with one lexsort (same order as sorting (weight, index1, index2) tuples).
+    """
+    import numpy as np
+
+    n = graph.num_nodes
+    uf = UnionFind.of_size(n)
+    tails, heads, weights = graph.undirected_edges()
+    order = np.lexsort((heads, tails, weights))
+
+    mst = []
+    total_weight = 0
+    for i, j, weight in zip(tails[order].tolist(), heads[order].tolist(), weights[order].tolist()):
+        if uf.union_index(i, j):
+            mst.append((graph.label(i), graph.label(j), weight))
+            total_weight += weight
+            if len(mst) == n - 1:
+                break
+
+    return mst, total_weight
+
+
+def write_edge_file(path, edges, chunk_edges=1_000_000):
+    """
+    Write (u, v, weight) edges to a binary edge file readable by kruskal_from_file.
+
+    Parameters:
+    path: Output file path.
+    edges: An iterable of (u, v, weight) tuples with integer endpoints.
+    chunk_edges: How many edges to buffer before writing.
+    """
+    import numpy as np
+
+    dtype = np.dtype(EDGE_RECORD)
+    edges = iter(edges)
+    with open(path, "wb") as f:
+        while True:
+            chunk = list(itertools.islice(edges, chunk_edges))
+            if not chunk:
+                break
+            np.array(chunk, dtype=dtype).tofile(f)
+
+
+def kruskal_from_file(path, num_nodes=None, fmt=None, chunk_edges=10_000_000, temp_dir=None):
+    """
+    External-memory Kruskal's algorithm for edge lists that don't fit in RAM.
+
+    The edge file is read in chunks (binary files are memory-mapped), each chunk is sorted by weight
+    and written to a temporary run file, and the runs are merged lazily while feeding the array-backed
+    UnionFind. Only one chunk and the union-find arrays are ever held in memory.
+
+    Three formats are read. The binary edge file (EDGE_RECORD records, see write_edge_file) is a flat
+    stream of edges that can be appended to without knowing the number of nodes or the degrees, so it
+    suits edges produced on the fly. A graph file from save_graph / convert_edge_list (CSR layout)
+    needs the degrees up front, but also gives every other algorithm neighbor access; its edges are
+    used as stored, so an undirected graph file feeds every edge twice (the copy is skipped by the
+    union-find), and the endpoints are node indices (CSRGraph.label maps them back). CSV is parsed
+    with the same chunked reader as convert_edge_list.
+
+    Parameters:
+    path: The edge file. Binary files hold EDGE_RECORD records; CSV files hold one "u,v[,weight]"
+          line per edge, with integer endpoints, '#' comments and a missing weight of 1.
+    num_nodes: Number of nodes (endpoints are 0..num_nodes-1). Found from the data if not given.
+    fmt: "binary", "csv" or "graph". If not given, a file starting with the graph file magic is a
+         graph file, and otherwise the extension decides (.csv / .txt mean CSV).
+    chunk_edges: How many edges are sorted in memory at once.
+    temp_dir: Where to put the sorted runs (defaults to the system temporary directory).
+
+    Returns:
+    A generator of MST edges (u, v, weight) in non-decreasing order of weight. For a disconnected
+    graph this is a minimum spanning forest.
+    Raises a ValueError for an unknown fmt and a FileNotFoundError for a missing file when called,
+    not on the first next().
+    """
+
+    if fmt not in (None, "binary", "csv", "graph"):
+        raise ValueError(f"Unknown edge file format {fmt!r}, expected 'binary', 'csv' or 'graph'.")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No such edge file: {path!r}")
+    if fmt is None:
+        from .graph_file import MAGIC
+
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) == MAGIC:
+                fmt = "graph"
+            else:
+                fmt = "csv" if os.path.splitext(path)[1].lower() in (".csv", ".txt") else "binary"
+    if chunk_edges < 1:
+        raise ValueError("chunk_edges must be at least 1.")
+
+    return _external_kruskal(path, num_nodes, fmt, chunk_edges, temp_dir)
+
+
+def _external_kruskal(path, num_nodes, fmt, chunk_edges, temp_dir):
+    """Generator behind kruskal_from_file; the arguments have already been checked."""
+    import numpy as np
+
+    dtype = np.dtype(EDGE_RECORD)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as workdir:
+        # Pass 1: cut the input into sorted runs on disk
+        runs = []
+        max_node = -1
+        for chunk in _edge_chunks(path, fmt, dtype, chunk_edges):
+            if len(chunk) == 0:
+                continue
+            max_node = max(max_node, int(chunk["u"].max()), int(chunk["v"].max()))
+            run = os.path.join(workdir, f"run{len(runs)}.bin")
+            chunk[np.argsort(chunk["w"], kind="stable")].tofile(run)
+            runs.append(run)
+
+        n = num_nodes if num_nodes is not None else max_node + 1
+        if n <= 1:
+            return
+
+        # Pass 2: merge the runs in weight order and keep every edge that joins two components
+        uf = UnionFind.of_size(n)
+        found = 0
+        merged = heapq.merge(*(_read_run(run, dtype) for run in runs))
+        for weight, u, v in merged:
+            if uf.union_index(u, v):
+                yield u, v, weight
+                found += 1
+                if found == n - 1:
+                    return  # The spanning tree is complete, the remaining edges can't be used
+
+
+def _edge_chunks(path, fmt, dtype, chunk_edges):
+    """Yield the edges of an edge file as structured NumPy arrays of at most chunk_edges records."""
+    import numpy as np
+
+    if fmt == "binary":
+        if os.path.getsize(path) == 0:
+            return
+        edges = np.memmap(path, dtype=dtype, mode="r")
+        for start in range(0, len(edges), chunk_edges):
+            yield np.array(edges[start:start + chunk_edges])
+        return
+
+    if fmt == "graph":
+        from .graph_file import load_graph
+
+        graph = load_graph(path)
+        for start in range(0, graph.num_edges, chunk_edges):
+            stop = min(start + chunk_edges, graph.num_edges)
+            sources = np.searchsorted(graph.offsets, np.arange(start, stop), side="right") - 1
+            yield _edge_records(sources, graph.targets[start:stop], graph.weights[start:stop], dtype)
+        return
+
+    from .graph_file import _text_edge_chunks
+
+    for sources, targets, weights in _text_edge_chunks(path, delimiter=",", chunk_lines=chunk_edges):
+        yield _edge_records(sources, targets, weights, dtype)
+
+
+def _edge_records(sources, targets, weights, dtype):
+    """Pack edge arrays into an EDGE_RECORD array, dropping self-loops (they never join two trees)."""
+    import numpy as np
+
+    keep = sources != targets
+    chunk = np.empty(int(keep.sum()), dtype=dtype)
+    chunk["u"], chunk["v"], chunk["w"] = sources[keep], targets[keep], weights[keep]
+    return chunk
+
+
+def _read_run(path, dtype, block_edges=65536):
+    """Yield the (weight, u, v) records of a sorted run file, reading it block by block."""
+    import numpy as np
+
+    run = np.memmap(path, dtype=dtype, mode="r")
+    for start in range(0, len(run), block_edges):
+        block = run[start:start + block_edges]
+        yield from zip(block["w"].tolist(), block["u"].tolist(), block["v"].tolist())
+    del run  # Drop the memory map before the run file is deleted
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 3, 'D': 1},
+        'B': {'A': 3, 'D': 3, 'C': 1},
+        'C': {'B': 1, 'D': 1, 'E': 5},
+        'D': {'A': 1, 'B': 3, 'C': 1, 'E': 6},
+        'E': {'C': 5, 'D': 6}
+    }
+
+    mst, total_weight = kruskal_algorithm(graph)
+
+    print("Edges in the Minimum Spanning Tree (MST):")
+    for edge in mst:
+        print(edge)
+
+    print(f"Total weight of the MST: {total_weight}")
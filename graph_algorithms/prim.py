@@ -0,0 +1,302 @@
+import heapq
+
+
+class IndexedMinHeap:
+    """
+    A binary min-heap of vertices 0..n-1 keyed by a priority, with decrease-key.
+
+    pos[v] is the position of vertex v in the heap array (-1 if it isn't in the heap), so a vertex is
+    never stored twice and the heap never grows past n entries.
+    """
+
+    __slots__ = ("heap", "key", "pos")
+
+    def __init__(self, n):
+        self.heap = []  # Vertices in heap order
+        self.key = [None] * n  # Priority of each vertex in the heap
+        self.pos = [-1] * n  # Position of each vertex in self.heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, v):
+        return self.pos[v] >= 0
+
+    def push(self, v, key):
+        """
+        Insert vertex v with the given key, or lower its key if it is already in the heap.
+        Returns True if the heap changed.
+        """
+        if self.pos[v] >= 0:
+            if key >= self.key[v]:
+                return False
+            self.key[v] = key
+            self._sift_up(self.pos[v])
+            return True
+        self.key[v] = key
+        self.pos[v] = len(self.heap)
+        self.heap.append(v)
+        self._sift_up(self.pos[v])
+        return True
+
+    def pop(self):
+        """
+        Remove and return (key, vertex) for the vertex with the smallest key.
+        """
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return self.key[top], top
+
+    def _sift_up(self, i):
+        heap, key, pos = self.heap, self.key, self.pos
+        v = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if key[heap[parent]] <= key[v]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i):
+        heap, key, pos = self.heap, self.key, self.pos
+        n = len(heap)
+        v = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            if key[v] <= key[heap[child]]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+
+def prim_algorithm(graph, start_node=None, method="auto", forest=False):
+    """
+    Implementation of Prim's algorithm to find the Minimum Spanning Tree (MST) of a weighted, undirected graph.
+
+    Parameters:
+    graph: A dictionary where the keys are nodes, and the values are dictionaries of neighboring nodes and edge weights.
+           Example: {'A': {'B': 3, 'D': 1}, 'B': {'A': 3, 'D': 3, 'C': 1}, ...}
+    start_node: The node from which to start building the MST (defaults to the first node of the graph).
+    method: "lazy" pushes every edge onto a heap and skips stale entries (heap grows to O(E)),
+            "indexed" keeps one entry per vertex in an IndexedMinHeap with decrease-key (O(V) heap),
+            "dense" scans an array of vertex keys instead of using a heap (O(V^2), best for dense graphs),
+            "auto" (default) picks "dense" or "indexed" from the graph's density.
+    forest: If False, only start_node's connected component is spanned. If True, every component is,
+            giving a minimum spanning forest of a disconnected graph.
+
+    Returns:
+    mst: A list of edges that form the minimum spanning tree. Each edge is represented as a tuple (node1, node2, weight).
+    total_weight: The total weight of all edges in the MST.
+    """
+
+    if not graph:
+        return [], 0
+    if start_node is None:
+        start_node = next(iter(graph))
+
+    if method == "auto":
+        # The heap costs about E log V, the array scan V^2
+        n = len(graph)
+        m = sum(len(neighbors) for neighbors in graph.values()) // 2
+        method = "dense" if m * max(1, n.bit_length()) >= n * n else "indexed"
+    if method in ("indexed", "dense"):
+        return _prim_keyed(graph, start_node, method == "dense", forest)
+    if method != "lazy":
+        raise ValueError(f"Unknown method {method!r}, expected 'auto', 'lazy', 'indexed' or 'dense'.")
+
+    # Priority queue to select the edge with the smallest weight
+    pq = []  # Formatting is: (weight, start_node, end_node)
+
+    # Set of nodes that have been added to the MST
+    visited = set()
+
+    # List to store the edges of the Minimum Spanning Tree (MST)
+    mst = []
+
+    # Total weight of all edges in the MST
+    total_weight = 0
+
+    # Roots to grow trees from: just start_node, or every node not reached yet for a forest
+    roots = [start_node] + list(graph) if forest else [start_node]
+
+    for root in roots:
+        if root in visited:
+            continue
+
+        # Initialize the priority queue with the starting node's edges
+        for neighbor, weight in graph[root].items():
+            heapq.heappush(pq, (weight, root, neighbor))  # Add edges to the priority queue
+
+        visited.add(root)  # Mark the start node as visited
+
+        while pq:
+            # Get the edge with the smallest weight
+            weight, node1, node2 = heapq.heappop(pq)
+
+            # If node2 has already been visited, we skip it to avoid cycles
+            if node2 in visited:
+                continue
+
+            # Add this edge to the MST
+            mst.append((node1, node2, weight))
+            total_weight += weight  # Add the edge's weight to the total weight
+
+            # Mark the new node as visited
+            visited.add(node2)
+
+            # For the newly added node, add all its edges to the priority queue if the other node isn't visited yet
+            for neighbor, edge_weight in graph[node2].items():
+                if neighbor not in visited:
+                    heapq.heappush(pq, (edge_weight, node2, neighbor))
+
+    return mst, total_weight
+
+
+def _prim_keyed(graph, start_node, dense, forest=False):
+    """
+    Prim's algorithm keeping one key per vertex: the weight of its cheapest edge into the tree.
+
+    With dense=False the keys live in an IndexedMinHeap; with dense=True the next vertex is found by
+    scanning the keys of the vertices still outside the tree. With forest=True a new tree is started
+    from an unreached vertex whenever the current one can't grow any more.
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    key = [None] * n  # Cheapest known edge weight into the tree (None = no edge seen yet)
+    parent = [-1] * n  # Tree vertex at the other end of that edge
+    in_tree = bytearray(n)
+
+    start = index[start_node]
+    heap = None if dense else IndexedMinHeap(n)
+    outside = [v for v in range(n) if v != start]  # Vertices not in the tree yet (only used by the dense scan)
+
+    mst = []
+    total_weight = 0
+    next_root = 0  # Scan position for the next unreached vertex (forest mode, heap version)
+    u = start
+    while u is not None:
+        # Add u to the tree through its cheapest edge
+        in_tree[u] = 1
+        if parent[u] >= 0:
+            mst.append((nodes[parent[u]], nodes[u], key[u]))
+            total_weight += key[u]
+
+        # Relax the edges from u to vertices outside the tree
+        for neighbor, weight in graph[nodes[u]].items():
+            v = index[neighbor]
+            if not in_tree[v] and (key[v] is None or weight < key[v]):
+                key[v] = weight
+                parent[v] = u
+                if heap is not None:
+                    heap.push(v, weight)
+
+        # Pick the next vertex
+        if heap is not None:
+            u = heap.pop()[1] if heap else None
+        else:
+            best = -1
+            for position in range(len(outside)):
+                v = outside[position]
+                if key[v] is not None and (best < 0 or key[v] < key[outside[best]]):
+                    best = position
+            if best < 0:
+                u = None  # Nothing left that is connected to the tree
+            else:
+                # Swap-remove the chosen vertex from the scan list
+                u = outside[best]
+                outside[best] = outside[-1]
+                outside.pop()
+
+        # The tree is finished; for a forest, start the next one from any unreached vertex
+        if u is None and forest:
+            if dense:
+                u = outside.pop() if outside else None
+            else:
+                while next_root < n and in_tree[next_root]:
+                    next_root += 1
+                u = next_root if next_root < n else None
+
+    return mst, total_weight
+
+
+def prim_matrix(matrix, start_node=0):
+    """
+    O(V^2) array-scan version of Prim's algorithm for a dense adjacency matrix.
+
+    Parameters:
+    matrix: A 2D list (or 2D NumPy array) where matrix[i][j] is the weight of the edge between i and j.
+            Use float('inf') for no edge, like floyd_warshall. The diagonal is ignored.
+    start_node: The vertex index from which to start building the MST.
+
+    Returns:
+    mst: A list of edges (i, j, weight) that form the minimum spanning tree of start_node's component.
+    total_weight: The total weight of all edges in the MST.
+    """
+    n = len(matrix)
+    inf = float('inf')
+    key = [inf] * n  # Cheapest edge weight from each vertex into the tree
+    parent = [-1] * n
+    in_tree = bytearray(n)
+    key[start_node] = 0
+
+    mst = []
+    total_weight = 0
+    for _ in range(n):
+        # Scan for the closest vertex outside the tree
+        u, best = -1, inf
+        for v in range(n):
+            if not in_tree[v] and key[v] < best:
+                u, best = v, key[v]
+        if u < 0:
+            break  # The rest of the graph isn't connected to start_node
+
+        in_tree[u] = 1
+        if parent[u] >= 0:
+            mst.append((parent[u], u, matrix[parent[u]][u]))
+            total_weight += matrix[parent[u]][u]
+
+        # Update the keys from u's row
+        row = matrix[u]
+        for v in range(n):
+            if not in_tree[v] and row[v] < key[v]:
+                key[v] = row[v]
+                parent[v] = u
+
+    return mst, total_weight
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 3, 'D': 1},
+        'B': {'A': 3, 'D': 3, 'C': 1},
+        'C': {'B': 1, 'D': 1, 'E': 5},
+        'D': {'A': 1, 'B': 3, 'C': 1, 'E': 6},
+        'E': {'C': 5, 'D': 6}
+    }
+
+    mst, total_weight = prim_algorithm(graph, 'A')
+
+    # Output the resulting Minimum Spanning Tree and its total weight
+    print("Edges in the Minimum Spanning Tree (MST):")
+    for edge in mst:
+        print(edge)
+
+    print(f"Total weight of the MST: {total_weight}")
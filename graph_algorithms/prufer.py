@@ -0,0 +1,233 @@
+def generate_prufer_sequence(tree):
+    """
+    Generate the Prüfer sequence from a given tree.
+
+    Runs in linear time without a heap: the tree is rooted at its largest vertex, which turns "the
+    neighbor of a leaf" into "the parent of a leaf", and the smallest leaf is tracked with a pointer
+    that only ever moves forward. The input tree is not modified.
+
+    Parameters:
+    tree: A dictionary representing the tree as an adjacency list, where the keys are vertices and
+          the values are lists of neighboring vertices.
+
+    Returns:
+    prufer_sequence: A list containing the Prüfer sequence for the input tree.
+    """
+
+    # Number the vertices in sorted order (no sort needed when they are already consecutive integers)
+    labels = _sorted_labels(tree)
+    index = {label: i for i, label in enumerate(labels)}
+    n = len(labels)
+    if n <= 2:
+        return []
+
+    # Root the tree at the largest vertex and record every vertex's parent
+    parent = [-1] * n
+    seen = bytearray(n)
+    seen[n - 1] = 1
+    stack = [n - 1]
+    while stack:
+        u = stack.pop()
+        for neighbor in tree[labels[u]]:
+            v = index[neighbor]
+            if not seen[v]:
+                seen[v] = 1
+                parent[v] = u
+                stack.append(v)
+
+    return [labels[v] for v in _encode_parents(parent)]
+
+
+def decode_prufer_sequence(prufer_sequence, labels=None):
+    """
+    Rebuild the tree described by a Prüfer sequence, in linear time.
+
+    Parameters:
+    prufer_sequence: A list of vertices of length n - 2.
+    labels: The n vertex labels in sorted order. Defaults to 1..n, the labelling used in the example.
+
+    Returns:
+    tree: A dictionary representing the tree as an adjacency list.
+    """
+    n = len(prufer_sequence) + 2
+    if labels is None:
+        labels = list(range(1, n + 1))
+    index = {label: i for i, label in enumerate(labels)}
+
+    tree = {label: [] for label in labels}
+    parent = _decode_to_parents([index[v] for v in prufer_sequence], n)
+    for v in range(n - 1):
+        tree[labels[v]].append(labels[parent[v]])
+        tree[labels[parent[v]]].append(labels[v])
+    return tree
+
+
+def _sorted_labels(tree):
+    """Return the vertices in sorted order, in O(n) when they are consecutive integers."""
+    labels = list(tree)
+    if labels and all(type(label) is int for label in labels):
+        low = min(labels)
+        if max(labels) - low == len(labels) - 1:
+            return list(range(low, low + len(labels)))
+    return sorted(labels)
+
+
+def _encode_parents(parent):
+    """
+    Linear-time Prüfer encoding of a tree on vertices 0..n-1 given as a parent array rooted at n - 1.
+    """
+    n = len(parent)
+
+    # A vertex is a leaf once all of its children are gone
+    children = [0] * n
+    for v in range(n - 1):
+        children[parent[v]] += 1
+
+    sequence = []
+    pointer = children.index(0)  # Smallest leaf we haven't passed yet
+    leaf = pointer
+    for _ in range(n - 2):
+        next_vertex = parent[leaf]
+        sequence.append(next_vertex)
+        children[next_vertex] -= 1
+        if children[next_vertex] == 0 and next_vertex < pointer:
+            # Removing the leaf made its parent the smallest leaf
+            leaf = next_vertex
+        else:
+            pointer += 1
+            while children[pointer]:
+                pointer += 1
+            leaf = pointer
+    return sequence
+
+
+def _decode_to_parents(sequence, n):
+    """
+    Linear-time Prüfer decoding to a parent array on vertices 0..n-1 rooted at n - 1 (parent -1).
+    """
+    parent = [-1] * n
+    if n < 2:
+        return parent
+
+    # Every vertex appears in the sequence once per child it has when rooted at n - 1
+    children = [0] * n
+    for v in sequence:
+        children[v] += 1
+
+    pointer = children.index(0)
+    leaf = pointer
+    for v in sequence:
+        parent[leaf] = v
+        children[v] -= 1
+        if children[v] == 0 and v < pointer:
+            leaf = v
+        else:
+            pointer += 1
+            while children[pointer]:
+                pointer += 1
+            leaf = pointer
+
+    # The last two vertices left are this leaf and the root
+    parent[leaf] = n - 1
+    parent[n - 1] = -1
+    return parent
+
+
+def encode_prufer_batch(parents):
+    """
+    Encode many labelled trees at once.
+
+    Parameters:
+    parents: A 2D NumPy array of shape (m, n), one tree per row on vertices 0..n-1, where
+             parents[r, v] is the parent of v in a tree rooted at n - 1 (parents[r, n - 1] is ignored).
+
+    Returns:
+    A 2D NumPy array of shape (m, n - 2) holding the Prüfer sequence of each tree.
+    """
+    import numpy as np
+
+    parents = np.asarray(parents, dtype=np.int64)
+    m, n = parents.shape
+    rows = np.arange(m)
+    if n <= 2:
+        return np.zeros((m, 0), dtype=np.int64)
+
+    # Number of children of every vertex, for all rows with one bincount
+    children = np.bincount((parents[:, :n - 1] + n * rows[:, None]).ravel(), minlength=m * n).reshape(m, n)
+
+    sequences = np.empty((m, n - 2), dtype=np.int64)
+    pointer = np.argmax(children == 0, axis=1)
+    leaf = pointer.copy()
+    for i in range(n - 2):
+        # The same pointer-scan step as _encode_parents, for every row at once
+        next_vertex = parents[rows, leaf]
+        sequences[:, i] = next_vertex
+        children[rows, next_vertex] -= 1
+        take_parent = (children[rows, next_vertex] == 0) & (next_vertex < pointer)
+        leaf = np.where(take_parent, next_vertex, leaf)
+        leaf = _advance(children, rows, pointer, leaf, ~take_parent)
+
+    return sequences
+
+
+def decode_prufer_batch(sequences):
+    """
+    Decode many Prüfer sequences at once.
+
+    Parameters:
+    sequences: A 2D NumPy array of shape (m, n - 2), one sequence over vertices 0..n-1 per row.
+
+    Returns:
+    A 2D NumPy array of shape (m, n) of parent arrays rooted at n - 1 (whose parent is -1).
+    """
+    import numpy as np
+
+    sequences = np.asarray(sequences, dtype=np.int64)
+    m, length = sequences.shape
+    n = length + 2
+    rows = np.arange(m)
+
+    children = np.bincount((sequences + n * rows[:, None]).ravel(), minlength=m * n).reshape(m, n)
+    parents = np.full((m, n), -1, dtype=np.int64)
+
+    pointer = np.argmax(children == 0, axis=1)
+    leaf = pointer.copy()
+    for i in range(length):
+        v = sequences[:, i]
+        parents[rows, leaf] = v
+        children[rows, v] -= 1
+        take_parent = (children[rows, v] == 0) & (v < pointer)
+        leaf = np.where(take_parent, v, leaf)
+        leaf = _advance(children, rows, pointer, leaf, ~take_parent)
+
+    parents[rows, leaf] = n - 1
+    parents[:, n - 1] = -1
+    return parents
+
+
+def _advance(children, rows, pointer, leaf, moving):
+    """
+    Move pointer (in place) to the next vertex without children in the rows selected by `moving`,
+    and return the updated leaves.
+    """
+    import numpy as np
+
+    last = children.shape[1] - 1
+    pointer[moving] += 1
+    waiting = moving & (children[rows, np.minimum(pointer, last)] != 0)
+    while waiting.any():
+        pointer[waiting] += 1
+        waiting &= children[rows, np.minimum(pointer, last)] != 0
+    return np.where(moving, pointer, leaf)
+
+
+if __name__ == "__main__":
+    tree = {
+        1: [2, 3],  # Vertex 1 is connected to vertices 2 and 3
+        2: [1, 4],  # Vertex 2 is connected to vertices 1 and 4
+        3: [1],  # Vertex 3 is a leaf
+        4: [2]}  # Vertex 4 is a leaf
+
+    sequence = generate_prufer_sequence(tree)
+    print(f"Prüfer sequence: {sequence}")
+    print(f"Decoded tree: {decode_prufer_sequence(sequence)}")
@@ -0,0 +1,355 @@
+from collections import deque
+
+
+def allocate_items(preferences):
+    """
+    Allocates items to players based on their preferences using an adaptation of the Gale-Shapley algorithm.
+    Logs each step of the process.
+
+    Args:
+        preferences (dict): A dictionary where keys are player names and values are lists of items in preference order.
+
+    Returns:
+        dict: A dictionary with player names as keys and their allocated item as values.
+        
+    """
+    # Create a dictionary to store the allocation result
+    allocation = {player: None for player in preferences.keys()}
+
+    # Create a list of all items
+    items = set(item for pref_list in preferences.values() for item in pref_list)
+
+    # Reverse mapping to track which items are "proposed to"
+    proposed_to = {item: None for item in items}  # item -> player
+
+    # Create a queue of players who still need an item
+    free_players = list(preferences.keys())
+
+    # Keep track of the next item each player will propose to
+    next_proposal = {player: 0 for player in preferences.keys()}
+
+    step = 1  # Step counter for debugging
+
+    while free_players:
+        print(f"\n--- Step {step} ---")
+        player = free_players.pop(0)  # Get a free player
+        player_prefs = preferences[player]
+
+        # Get the next item on the player's preference list
+        if next_proposal[player] < len(player_prefs):
+            item = player_prefs[next_proposal[player]]
+            next_proposal[player] += 1  # Increment the proposal index for this player
+
+            print(f"{player} proposes to {item}")
+
+            if proposed_to[item] is None:  # Item is free
+                allocation[player] = item
+                proposed_to[item] = player
+                print(f"{item} is free and now belongs to {player}")
+            else:  # Item is already proposed to someone else
+                current_holder = proposed_to[item]
+                current_holder_prefs = preferences[current_holder]
+
+                # Compare preferences
+                if current_holder_prefs.index(item) > player_prefs.index(item):  # New player is preferred
+                    allocation[player] = item
+                    allocation[current_holder] = None
+                    proposed_to[item] = player
+                    print(f"{item} switches from {current_holder} to {player}")
+                    free_players.append(current_holder)  # Current holder becomes free
+                else:
+                    free_players.append(player)  # Player stays free
+                    print(f"{item} rejects {player}, stays with {current_holder}")
+        else:
+            print(f"{player} has no more items to propose to")
+
+        step += 1  # Increment step counter
+
+    print("\n--- Final Allocation ---")
+    for player, item in allocation.items():
+        print(f"{player} gets {item}")
+
+    return allocation
+
+
+def allocate_items_fast(preferences):
+    """
+    Silent, fast version of allocate_items that gives the same allocation.
+
+    Args:
+        preferences (dict): A dictionary where keys are player names and values are lists of items in preference order.
+
+    Returns:
+        dict: A dictionary with player names as keys and their allocated item (or None) as values.
+    """
+    import numpy as np
+
+    # Number the items in order of first appearance and pack the lists into one -1 padded array
+    players = list(preferences)
+    item_index = {}
+    for pref_list in preferences.values():
+        for item in pref_list:
+            item_index.setdefault(item, len(item_index))
+    items = list(item_index)
+
+    width = max((len(pref_list) for pref_list in preferences.values()), default=0)
+    dtype = np.int16 if len(items) < 2 ** 15 else np.int32
+    prefs = np.full((len(players), width), -1, dtype=dtype)
+    for p, player in enumerate(players):
+        prefs[p, :len(preferences[player])] = [item_index[item] for item in preferences[player]]
+
+    assigned = stable_allocation(prefs, len(items))
+    return {player: items[x] if x >= 0 else None for player, x in zip(players, assigned.tolist())}
+
+
+def stable_allocation(prefs, num_items=None):
+    """
+    Array engine behind allocate_items_fast: Gale-Shapley with O(1) work per proposal.
+
+    An item prefers the player who ranks it higher, so the only rank it ever has to compare is
+    the position of the item in its current holder's list. That position is the one the holder
+    proposed at, so it is stored when the item is accepted. This replaces the two list.index calls
+    per contested proposal, and no players x items table is needed, so memory stays at the size of
+    the preference array plus O(players + items). Free players wait in a deque (FIFO, like the
+    original queue, so ties are resolved the same way).
+
+    Args:
+        prefs: A 2D NumPy int array with one row per player listing item indices (0..num_items-1) in
+               preference order, padded with -1.
+        num_items (int): Number of items (defaults to the largest index + 1).
+
+    Returns:
+        A 1D NumPy int array with the item allocated to each player, or -1.
+    """
+    import numpy as np
+
+    prefs = np.asarray(prefs)
+    num_players, width = prefs.shape
+    if num_items is None:
+        num_items = int(prefs.max()) + 1 if prefs.size else 0
+
+    holder = [-1] * num_items  # Player currently holding each item
+    holder_rank = [0] * num_items  # Position of the item in its holder's list
+    next_proposal = [0] * num_players
+    allocation = [-1] * num_players
+    free_players = deque(range(num_players))
+    item_at = prefs.item  # Plain-int element access, much cheaper than prefs[p, k]
+
+    while free_players:
+        player = free_players.popleft()
+        k = next_proposal[player]
+        if k >= width:
+            continue  # No more items to propose to
+        item = item_at(player, k)
+        if item < 0:
+            next_proposal[player] = width  # Reached the padding
+            continue
+        next_proposal[player] = k + 1
+
+        current_holder = holder[item]
+        if current_holder < 0:
+            # Item is free
+            holder[item] = player
+            holder_rank[item] = k
+            allocation[player] = item
+        elif holder_rank[item] > k:
+            # New player ranks the item higher: the current holder becomes free
+            holder[item] = player
+            holder_rank[item] = k
+            allocation[player] = item
+            allocation[current_holder] = -1
+            free_players.append(current_holder)
+        else:
+            free_players.append(player)  # Player stays free
+
+    return np.array(allocation, dtype=np.int64)
+
+
+class IncrementalAllocation:
+    """
+    A stable allocation that is repaired, not recomputed, when players join, leave or change their
+    preferences.
+
+    The state of the Gale-Shapley run is kept between updates: the holder of every item, every
+    player's next proposal position and, for every item, the players that list it. A new player
+    just starts proposing. When an item is released (its holder leaves or moves on), only the
+    players that prefer that item to what they have now are woken up: their pointer is rewound to
+    the item and they propose upward again, which may release another item in turn (a vacancy
+    chain). Everybody else keeps their item, so an update costs the length of the chain instead of a
+    whole new run.
+
+    The repaired allocation is always stable, but after a removal it is not necessarily the one a
+    fresh allocate_items run on the new market would return.
+    """
+
+    _ABSENT = object()  # "Old item" of a player that was just added
+
+    def __init__(self, preferences=None):
+        """
+        Start from a dictionary of player -> list of items in preference order (may be empty). The
+        initial allocation is the one allocate_items gives.
+        """
+        self.preferences = {}
+        self.allocation = {}
+        self._rank = {}  # player -> {item: first position in the player's list}
+        self._next = {}  # player -> position of the next proposal
+        self._holder = {}  # item -> player holding it (or None)
+        self._listers = {}  # item -> players that list it (a dict used as an insertion-ordered set)
+        self._queue = deque()
+        self._queued = set()
+        self._changed = {}  # player -> item held before the current update
+
+        for player, pref_list in (preferences or {}).items():
+            self._insert(player, pref_list)
+        self._propose()
+
+    def add_player(self, player, pref_list):
+        """
+        Add a player and repair the allocation.
+
+        Returns:
+            dict: The players whose allocation changed (including the new player), with their new
+                  item (or None).
+        """
+        if player in self.preferences:
+            raise ValueError(f"Player {player!r} is already in the market.")
+        self._insert(player, pref_list)
+        self._changed[player] = self._ABSENT  # Always reported, even if they get nothing
+        return self._propose()
+
+    def remove_player(self, player):
+        """
+        Remove a player, release their item and repair the allocation.
+
+        Returns:
+            dict: The remaining players whose allocation changed, with their new item (or None).
+        """
+        self._delete(player)
+        return self._propose()
+
+    def update_preferences(self, player, pref_list):
+        """
+        Replace a player's preference list and repair the allocation (a removal plus an addition,
+        repaired in one go).
+
+        Returns:
+            dict: The players whose allocation changed, with their new item (or None).
+        """
+        old_item = self.allocation.get(player)
+        self._delete(player)
+        self._insert(player, pref_list)
+        self._changed.setdefault(player, old_item)
+        return self._propose()
+
+    def _insert(self, player, pref_list):
+        """
+        Register a player with an empty allocation and queue them to propose.
+        """
+        self.preferences[player] = list(pref_list)
+        rank = {}
+        for position, item in enumerate(pref_list):
+            rank.setdefault(item, position)
+        self._rank[player] = rank
+        self._next[player] = 0
+        self.allocation[player] = None
+        for item in rank:
+            self._listers.setdefault(item, {})[player] = None
+            self._holder.setdefault(item, None)
+        self._enqueue(player)
+
+    def _delete(self, player):
+        """
+        Forget a player; the item they held (if any) becomes vacant.
+        """
+        if player not in self.preferences:
+            raise KeyError(player)
+        item = self.allocation.pop(player)
+        for listed in self._rank.pop(player):
+            self._listers[listed].pop(player, None)
+        del self.preferences[player]
+        del self._next[player]
+        self._queued.discard(player)
+        self._changed.pop(player, None)
+        if item is not None:
+            self._holder[item] = None
+            self._vacate(item)
+
+    def _enqueue(self, player):
+        if player not in self._queued:
+            self._queued.add(player)
+            self._queue.append(player)
+
+    def _stop(self, player):
+        """
+        Position at which a player stops proposing: their current item, or the end of their list.
+        """
+        item = self.allocation[player]
+        return self._rank[player][item] if item is not None else len(self.preferences[player])
+
+    def _vacate(self, item):
+        """
+        Wake up the players that would rather have the (now free) item than what they hold.
+
+        They are queued in the item's own preference order (the players ranking it highest first,
+        ties in the order they joined), so the repair never depends on hashing or set order.
+        """
+        rank = self._rank
+        for player in sorted(self._listers[item], key=lambda p: rank[p][item]):
+            position = rank[player][item]
+            if position < self._stop(player) and position < self._next[player]:
+                self._next[player] = position  # Rewind to the released item
+                self._enqueue(player)
+
+    def _propose(self):
+        """
+        Run proposals (one per turn, in queue order, like allocate_items) until nobody is queued.
+        """
+        while self._queue:
+            player = self._queue.popleft()
+            if player not in self._queued:
+                continue  # Removed while waiting
+            self._queued.discard(player)
+
+            pref_list = self.preferences[player]
+            rank = self._rank[player]
+            stop = self._stop(player)
+            k = self._next[player]
+            if k >= stop:
+                # Nothing better left to try: settle just past the current item
+                self._next[player] = stop + 1 if self.allocation[player] is not None else stop
+                continue
+
+            item = pref_list[k]
+            self._next[player] = k + 1
+            current_holder = self._holder[item]
+            if current_holder is None or self._rank[current_holder][item] > rank[item]:
+                # Accepted: a displaced holder becomes free, the player's old item becomes vacant
+                if current_holder is not None:
+                    self._changed.setdefault(current_holder, item)
+                    self.allocation[current_holder] = None
+                    self._enqueue(current_holder)
+                old_item = self.allocation[player]
+                self._changed.setdefault(player, old_item)
+                self._holder[item] = player
+                self.allocation[player] = item
+                if old_item is not None:
+                    self._holder[old_item] = None
+                    self._vacate(old_item)
+            else:
+                self._enqueue(player)  # Rejected, try the next item on a later turn
+
+        changes = {player: self.allocation[player] for player, old_item in self._changed.items()
+                   if self.allocation[player] != old_item}
+        self._changed = {}
+        return changes
+
+
+if __name__ == "__main__":
+    preferences = {
+        "Dark Urge": ["Duelist's Peragative", "Rhapsody + DJ Scimitar", "Shar Spear", "Hellfire Greataxe"],
+        "Karlach": ["Hellfire Greataxe", "Shar Spear", "Duelist's Peragative", "Duelist's Peragative"],
+        "Astarion": ["Duelist's Peragative", "Rhapsody + DJ Scimitar", "Shar Spear", "Hellfire Greataxe"],
+        "Shadowheart": ["Shar Spear", "Duelist's Peragative", "Rhapsody + DJ Scimitar", "Hellfire Greataxe"]
+    }
+
+    allocation_result = allocate_items(preferences)
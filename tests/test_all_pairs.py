@@ -0,0 +1,145 @@
+import random
+
+import pytest
+
+from graph_algorithms.all_pairs import floyd_warshall, johnson, path, update_edge, update_edges
+
+np = pytest.importorskip("numpy")
+
+INF = float('inf')
+
+
+def random_matrix(rng, n, density=0.4, low=-2, high=5):
+    """Random weighted digraph as an INF-padded matrix; negative and zero weights included."""
+    graph = [[0 if i == j else INF for j in range(n)] for i in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() < density:
+                graph[i][j] = rng.randint(low, high)
+    return graph
+
+
+def path_weight(graph, route):
+    return sum(graph[u][v] for u, v in zip(route, route[1:]))
+
+
+def test_zero_weight_cycle_paths_match_python_engine():
+    graph = [[0, INF, INF, 2, 3], [INF, 0, INF, INF, INF], [0, INF, 0, -1, INF], [-2, 2, INF, 0, INF],
+             [INF, -2, 2, INF, 0]]
+    dist, next_hop = floyd_warshall(graph, with_paths=True)
+    blocked_dist, blocked_next = floyd_warshall(graph, engine="blocked", block_size=3, with_paths=True)
+    assert blocked_dist.tolist() == dist
+    assert blocked_next.tolist() == [list(row) for row in next_hop]
+    assert path(blocked_next, 0, 1) == [0, 4, 1]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "blocked"])
+def test_engines_match_python_engine(engine):
+    rng = random.Random(2)
+    for _ in range(200):
+        n = rng.randint(1, 9)
+        graph = random_matrix(rng, n)
+        expected = floyd_warshall(graph, with_paths=True)
+        result = floyd_warshall(graph, engine=engine, block_size=rng.randint(1, 4), with_paths=True)
+        if expected is None:
+            assert result is None
+            continue
+        dist, next_hop = result
+        assert dist.tolist() == expected[0]
+        assert next_hop.tolist() == [list(row) for row in expected[1]]
+        for i in range(n):
+            for j in range(n):
+                route = path(next_hop, i, j)
+                if dist[i][j] == INF:
+                    assert route == []
+                else:
+                    assert route[0] == i and route[-1] == j
+                    assert path_weight(graph, route) == dist[i][j]
+
+
+def test_blocked_distances_match_python_engine():
+    rng = random.Random(3)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        graph = random_matrix(rng, n, low=0)
+        assert floyd_warshall(graph, engine="blocked", block_size=rng.randint(1, 5)).tolist() == floyd_warshall(graph)
+
+
+def test_path_raises_on_cyclic_table():
+    next_hop = [[0, 2, 2], [1, 1, 1], [0, 0, 2]]  # 0 -> 2 -> 0 -> ... never reaches 1
+    with pytest.raises(ValueError):
+        path(next_hop, 0, 1)
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+@pytest.mark.parametrize("with_paths", [False, True])
+def test_update_edges_leaves_inputs_untouched_on_negative_cycle(as_array, with_paths):
+    n = 4
+    graph = [[0 if i == j else INF for j in range(n)] for i in range(n)]
+    for i in range(n - 1):
+        graph[i][i + 1] = 1
+    # The first update only shortens paths, the second closes 0 -> 1 -> 2 -> 3 -> 0 with weight -1
+    updates = [(0, 2, 1), (3, 0, -3)] + ([(1, 0, 5), (2, 1, 5)] if not with_paths else [])
+    if with_paths:
+        dist, next_hop = floyd_warshall(graph, engine="numpy" if as_array else "python", with_paths=True)
+    else:
+        dist, next_hop = floyd_warshall(graph, engine="numpy" if as_array else "python"), None
+    before = np.array(dist).tolist(), None if next_hop is None else np.array(next_hop).tolist()
+
+    assert update_edges(dist, updates, next_hop) is None
+    assert np.array(dist).tolist() == before[0]
+    if next_hop is not None:
+        assert np.array(next_hop).tolist() == before[1]
+
+
+def test_update_edges_matches_recompute():
+    rng = random.Random(4)
+    for _ in range(100):
+        n = rng.randint(2, 8)
+        graph = random_matrix(rng, n, low=0)
+        dist, next_hop = floyd_warshall(graph, with_paths=True)
+        updates = [(rng.randrange(n), rng.randrange(n), rng.randint(-1, 3)) for _ in range(rng.randint(1, 2 * n))]
+        updates = [(u, v, w) for u, v, w in updates if u != v]
+        for u, v, w in updates:
+            graph[u][v] = min(graph[u][v], w)
+        expected = floyd_warshall(graph)
+        result = update_edges(dist, updates, next_hop)
+        if expected is None:
+            assert result is None
+            continue
+        assert result == expected
+        for i in range(n):
+            for j in range(n):
+                if dist[i][j] != INF:
+                    assert path_weight(graph, path(next_hop, i, j)) == dist[i][j]
+
+
+def test_johnson_matches_floyd_warshall():
+    rng = random.Random(5)
+    for _ in range(150):
+        n = rng.randint(1, 9)
+        graph = random_matrix(rng, n, density=0.3, low=-1)
+        expected = floyd_warshall(graph)
+        adjacency = {i: {j: graph[i][j] for j in range(n) if i != j and graph[i][j] != INF} for i in range(n)}
+        result = johnson(adjacency)
+        if expected is None:
+            assert result is None
+            continue
+        assert result == {i: {j: expected[i][j] for j in range(n) if expected[i][j] != INF} for i in range(n)}
+
+
+def test_update_edge_matches_recompute():
+    rng = random.Random(6)
+    for _ in range(100):
+        n = rng.randint(2, 8)
+        graph = random_matrix(rng, n, low=0)
+        dist = np.array(floyd_warshall(graph)) if rng.random() < 0.5 else floyd_warshall(graph)
+        u, v = rng.sample(range(n), 2)
+        w = rng.randint(-2, 3)
+        graph[u][v] = min(graph[u][v], w)
+        expected = floyd_warshall(graph)
+        result = update_edge(dist, u, v, w) if w < dist[u][v] else dist
+        if expected is None:
+            assert result is None
+        else:
+            assert np.array(result).tolist() == expected
@@ -0,0 +1,39 @@
+from benchmarks import generators
+from benchmarks.harness import CASES, compare, measure
+
+
+def report(seconds, iqr=0.0, peak=1000, counters=None):
+    return {"results": [{"name": "case", "size": 1, "seconds": seconds, "iqr": iqr, "peak_bytes": peak,
+                         "counters": counters or {}}]}
+
+
+def test_compare_gates_only_slow_noisy_free_regressions():
+    [row] = compare(report(0.2), report(0.1))
+    assert row["gated"] and row["regressed"]
+    # Within the tolerance
+    assert not compare(report(0.12), report(0.1))[0]["regressed"]
+    # Larger than the tolerance, but within the run-to-run noise
+    assert not compare(report(0.2, iqr=0.06), report(0.1))[0]["regressed"]
+    # Too fast to gate at all
+    [row] = compare(report(0.008), report(0.002))
+    assert not row["gated"] and not row["regressed"]
+
+
+def test_compare_reports_memory_and_counter_changes():
+    [row] = compare(report(0.1, peak=10 ** 7, counters={"edges": 3}), report(0.1, peak=10 ** 6, counters={"edges": 2}))
+    assert row["regressed"]
+    assert row["changed_counters"] == {"edges": (2, 3)}
+
+
+def test_generators_are_deterministic():
+    assert generators.random_graph(50, 200, seed=1) == generators.random_graph(50, 200, seed=1)
+    assert generators.power_law_graph(50, 2, seed=1) == generators.power_law_graph(50, 2, seed=1)
+    assert generators.preference_profile(5, 5, seed=1) == generators.preference_profile(5, 5, seed=1)
+    eulerian = generators.eulerian_graph(30, 5, 6, seed=1)
+    assert all(len(neighbors) % 2 == 0 for neighbors in eulerian.values())
+
+
+def test_every_case_runs():
+    for case in CASES:
+        result = measure(case, case.sizes[0], repeat=1)
+        assert result["seconds"] >= 0 and result["peak_bytes"] > 0
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import itertools
+import random
+import time
+
+from graph_algorithms.coloring import color_graph, color_graph_with_steps, exact_coloring
+
+WHEEL_5 = {0: [1, 2, 3, 4, 5], 1: [0, 2, 5], 2: [0, 1, 3], 3: [0, 2, 4], 4: [0, 3, 5], 5: [0, 4, 1]}
+
+
+def random_graph(rng, n, p):
+    graph = {v: [] for v in range(n)}
+    for u, v in itertools.combinations(range(n), 2):
+        if rng.random() < p:
+            graph[u].append(v)
+            graph[v].append(u)
+    return graph
+
+
+def is_proper(graph, coloring):
+    return all(coloring[u] != coloring[v] for u in graph for v in graph[u])
+
+
+def chromatic_number(graph):
+    """Plain backtracking for k = 1, 2, ... colors, independent of exact_coloring."""
+    nodes = list(graph)
+
+    def colorable(k, coloring, i):
+        if i == len(nodes):
+            return True
+        for c in range(k):
+            if all(coloring.get(w) != c for w in graph[nodes[i]]):
+                coloring[nodes[i]] = c
+                if colorable(k, coloring, i + 1):
+                    return True
+                del coloring[nodes[i]]
+        return False
+
+    return next((k for k in range(len(nodes) + 1) if colorable(k, {}, 0)), 0)
+
+
+def test_heuristics_give_proper_colorings():
+    rng = random.Random(0)
+    for _ in range(100):
+        graph = random_graph(rng, rng.randint(1, 15), 0.3)
+        for strategy in ("dsatur", "largest_first"):
+            coloring = color_graph(graph, strategy)
+            assert is_proper(graph, coloring)
+            assert max(coloring.values()) <= max(len(neighbors) for neighbors in graph.values()) + 1
+        # Whenever the printing version succeeds with some budget, a budget that large is enough
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                slow = color_graph_with_steps(graph, max_colors=len(graph))
+            except ValueError:
+                continue
+        assert is_proper(graph, slow)
+
+
+def test_exact_coloring_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(60):
+        graph = random_graph(rng, rng.randint(0, 8), rng.choice([0.2, 0.5, 0.8]))
+        result = exact_coloring(graph)
+        assert result.optimal
+        assert is_proper(graph, result.coloring)
+        assert result.num_colors == chromatic_number(graph)
+
+
+def test_k_colorability():
+    rng = random.Random(2)
+    for _ in range(60):
+        graph = random_graph(rng, rng.randint(1, 8), 0.5)
+        chi = chromatic_number(graph)
+        for k in range(1, chi + 2):
+            result = exact_coloring(graph, max_colors=k)
+            assert is_proper(graph, result.coloring)
+            if k >= chi:
+                assert result.num_colors <= k
+            else:
+                assert result.num_colors > k and result.lower_bound > k
+
+
+def test_clique_larger_than_max_colors():
+    result = exact_coloring(WHEEL_5, max_colors=1)
+    assert result.lower_bound > 1 and result.num_colors > 1
+    assert exact_coloring(WHEEL_5, max_colors=3).lower_bound == 4
+    assert exact_coloring(WHEEL_5).num_colors == 4
+
+
+def test_time_limit_is_honored():
+    rng = random.Random(3)
+    n = 3000
+    graph = {v: set() for v in range(n)}
+    for _ in range(10 * n):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u].add(v)
+            graph[v].add(u)
+    graph = {v: list(neighbors) for v, neighbors in graph.items()}
+
+    start = time.perf_counter()
+    result = exact_coloring(graph, time_limit=0.1)
+    elapsed = time.perf_counter() - start
+    assert is_proper(graph, result.coloring)
+    assert not result.optimal
+    assert elapsed < 0.5
+
+
+def test_edges_listed_from_one_end():
+    rng = random.Random(5)
+    for _ in range(100):
+        graph = random_graph(rng, rng.randint(1, 12), 0.4)
+        one_sided = {v: [] for v in graph}
+        for u in graph:
+            for v in graph[u]:
+                if u < v:
+                    a, b = (u, v) if rng.random() < 0.5 else (v, u)
+                    one_sided[a].append(b)
+        for strategy in ("dsatur", "largest_first"):
+            assert is_proper(graph, color_graph(one_sided, strategy))
+        result = exact_coloring(one_sided)
+        assert is_proper(graph, result.coloring) and result.num_colors == chromatic_number(graph)
+
+
+def test_node_limit():
+    rng = random.Random(4)
+    graph = random_graph(rng, 40, 0.5)
+    result = exact_coloring(graph, node_limit=10)
+    assert is_proper(graph, result.coloring)
+    assert result.lower_bound <= result.num_colors
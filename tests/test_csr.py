@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from graph_algorithms.csr import CSRGraph
+
+np = pytest.importorskip("numpy")
+
+INF = float('inf')
+
+
+def random_graph(rng, n, m, labels=None):
+    labels = labels or list(range(n))
+    graph = {label: {} for label in labels}
+    for _ in range(m):
+        u, v = rng.sample(labels, 2) if n > 1 else (labels[0], labels[0])
+        if u != v:
+            graph[u][v] = graph[v][u] = float(rng.randint(1, 9))
+    return graph
+
+
+def as_dict(graph):
+    return {node: dict(neighbors.items()) for node, neighbors in graph.items()}
+
+
+def test_from_dict_is_a_view_of_the_same_graph():
+    rng = random.Random(0)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        labels = None if rng.random() < 0.5 else [f"n{k}" for k in range(n)]
+        graph = random_graph(rng, n, rng.randint(0, 30), labels)
+        csr = CSRGraph.from_dict(graph)
+        assert as_dict(csr) == graph
+        assert csr.num_nodes == n and csr.num_edges == sum(map(len, graph.values()))
+        dense = csr.to_dense()
+        for u, neighbors in graph.items():
+            for v in graph:
+                expected = 0.0 if u == v else neighbors.get(v, INF)
+                assert dense[csr.index(u), csr.index(v)] == expected
+
+
+def test_from_edges_and_matrix_agree():
+    rng = random.Random(1)
+    for _ in range(100):
+        n = rng.randint(1, 10)
+        graph = random_graph(rng, n, rng.randint(0, 25))
+        edges = [(u, v, w) for u in graph for v, w in graph[u].items() if u < v]
+        from_edges = CSRGraph.from_edges(edges, num_nodes=n)
+        from_matrix = CSRGraph.from_matrix(CSRGraph.from_dict(graph).to_dense(no_edge=0, diagonal=0))
+        assert as_dict(from_edges) == graph == as_dict(from_matrix)
+
+
+
+def test_algorithms_accept_csr_input():
+    from graph_algorithms.boruvka import boruvka_algorithm
+    from graph_algorithms.flow import ford_fulkerson, max_flow
+    from graph_algorithms.kruskal import kruskal_algorithm
+
+    rng = random.Random(4)
+    for _ in range(50):
+        n = rng.randint(1, 12)
+        graph = random_graph(rng, n, rng.randint(0, 30))
+        csr = CSRGraph.from_dict(graph)
+        expected = kruskal_algorithm(graph)[1]
+        assert kruskal_algorithm(csr)[1] == expected
+        assert boruvka_algorithm(csr)[1] == expected
+
+        if n >= 2:
+            capacities = [[int(graph[u].get(v, 0)) if u != n - 1 and v != 0 else 0 for v in range(n)]
+                          for u in range(n)]
+            flow = ford_fulkerson(capacities, 0, n - 1)
+            assert max_flow(CSRGraph.from_matrix(capacities), 0, n - 1) == flow
+            assert ford_fulkerson(CSRGraph.from_matrix(capacities), 0, n - 1) == flow
+
+
+def test_unbounded_capacities_in_flow_networks():
+    from graph_algorithms.flow import FlowNetwork, max_flow
+
+    csr = CSRGraph.from_edges([(0, 1, INF), (1, 2, 3), (0, 2, 2)], num_nodes=3, directed=True)
+    assert FlowNetwork.from_csr(csr).capacity[0] == INF
+    assert max_flow(csr, 0, 2) == 5
+    assert type(FlowNetwork.from_csr(CSRGraph.from_edges([(0, 1, 2)], directed=True)).capacity[0]) is int
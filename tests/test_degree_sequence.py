@@ -0,0 +1,40 @@
+import random
+from collections import Counter
+
+import pytest
+
+from graph_algorithms.degree_sequence import hakimi_havel, is_graphical, is_graphical_batch, realize_degree_sequence
+
+
+def random_sequences(rng, count):
+    for _ in range(count):
+        n = rng.randint(0, 12)
+        yield [rng.randint(0, n) for _ in range(n)]
+
+
+def test_is_graphical_matches_hakimi_havel():
+    rng = random.Random(0)
+    for sequence in random_sequences(rng, 2000):
+        assert is_graphical(sequence) == hakimi_havel(sequence)
+
+
+def test_batch_matches_single():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(1)
+    for n in range(1, 10):
+        rows = [[rng.randint(0, n) for _ in range(n)] for _ in range(50)]
+        assert is_graphical_batch(np.array(rows)).tolist() == [hakimi_havel(row) for row in rows]
+
+
+def test_realized_graph_is_simple_with_the_given_degrees():
+    rng = random.Random(2)
+    for sequence in random_sequences(rng, 500):
+        if not hakimi_havel(sequence):
+            with pytest.raises(ValueError):
+                realize_degree_sequence(sequence)  # Raised on the call, not on the first next()
+            continue
+        edges = list(realize_degree_sequence(sequence))
+        assert all(u != v for u, v in edges)
+        assert len({frozenset(edge) for edge in edges}) == len(edges)
+        degrees = Counter(v for edge in edges for v in edge)
+        assert [degrees[v] for v in range(len(sequence))] == sequence
@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+import pytest
+
+from graph_algorithms.euler import find_eulerian_circuit, find_eulerian_trail
+
+
+def random_multigraph(rng, n, m, directed=False):
+    """Random connected-by-construction walk, so the graph has an Eulerian trail."""
+    graph = {v: [] for v in range(n)}
+    walk = [rng.randrange(n)]
+    for _ in range(m):
+        walk.append(rng.randrange(n))
+    for u, v in zip(walk, walk[1:]):
+        graph[u].append(v)
+        if not directed:
+            graph[v].append(u)
+    return graph, walk
+
+
+def edge_multiset(graph, directed):
+    if directed:
+        return Counter((u, v) for u in graph for v in graph[u])
+    # Every undirected edge is listed from both ends (a self-loop twice in its own list)
+    return Counter(frozenset((u, v)) if u != v else (u,) for u in graph for v in graph[u])
+
+
+def trail_edges(trail, directed):
+    if directed:
+        return Counter(zip(trail, trail[1:]))
+    edges = Counter()
+    for u, v in zip(trail, trail[1:]):
+        edges[frozenset((u, v)) if u != v else (u,)] += 2  # Counted like the doubly listed input
+    return edges
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_trail_uses_every_edge_once(directed):
+    rng = random.Random(0 if directed else 1)
+    for _ in range(300):
+        graph, walk = random_multigraph(rng, rng.randint(1, 8), rng.randint(0, 20), directed)
+        snapshot = {v: list(neighbors) for v, neighbors in graph.items()}
+        trail = find_eulerian_trail(graph, directed=directed)
+        assert graph == snapshot  # The input is left untouched
+        assert trail_edges(trail, directed) == edge_multiset(graph, directed)
+        if walk[0] == walk[-1]:
+            assert trail[0] == trail[-1]
+
+
+def test_circuit_and_errors():
+    rng = random.Random(2)
+    for _ in range(100):
+        graph, walk = random_multigraph(rng, rng.randint(2, 8), rng.randint(1, 15))
+        graph[walk[-1]].append(walk[0])
+        graph[walk[0]].append(walk[-1])
+        circuit = find_eulerian_circuit(graph)
+        assert circuit[0] == circuit[-1]
+        assert trail_edges(circuit, False) == edge_multiset(graph, False)
+
+    with pytest.raises(ValueError):
+        find_eulerian_circuit({0: [1], 1: [0, 2], 2: [1]})
+    with pytest.raises(ValueError):
+        find_eulerian_trail({0: [1], 1: [0], 2: [3], 3: [2]})  # Two components
+    with pytest.raises(ValueError):
+        find_eulerian_trail({0: [1], 1: []})  # Only listed from one end
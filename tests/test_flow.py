@@ -0,0 +1,151 @@
+import random
+
+import pytest
+
+from graph_algorithms.flow import (FlowCounters, FlowNetwork, batch_max_flow, ford_fulkerson, max_flow, print_trace,
+                                   solve_max_flow)
+
+CLRS = [
+    [0, 16, 13, 0, 0, 0],
+    [0, 0, 10, 12, 0, 0],
+    [0, 4, 0, 0, 14, 0],
+    [0, 0, 9, 0, 0, 20],
+    [0, 0, 0, 7, 0, 4],
+    [0, 0, 0, 0, 0, 0],
+]
+
+
+def random_network(rng, n, density=0.4, high=10):
+    """Random capacity matrix with no edges into the source (0) or out of the sink (n - 1)."""
+    graph = [[0] * n for _ in range(n)]
+    for u in range(n - 1):
+        for v in range(1, n):
+            if u != v and rng.random() < density:
+                graph[u][v] = rng.randint(1, high)
+    return graph
+
+
+def test_numpy_integer_terminals():
+    np = pytest.importorskip("numpy")
+    assert max_flow(CLRS, np.int64(0), np.int32(5)) == 23
+    assert max_flow(CLRS, np.array([0]), [np.int64(5)]) == 23
+    assert max_flow(CLRS, np.int64(0), np.array([3, 4])) == max_flow(CLRS, 0, [3, 4])
+
+
+@pytest.mark.parametrize("capacity", [1, 1.5])
+def test_batch_in_processes_matches_serial(capacity):
+    np = pytest.importorskip("numpy")
+    graph = [[c * capacity for c in row] for row in CLRS]
+    queries = [(0, 5), (np.int64(1), 5), ([0, 1], [4, 5]), (2, 3)]
+    assert batch_max_flow(graph, queries, processes=2) == batch_max_flow(graph, queries)
+
+
+@pytest.mark.parametrize("method", ["dinic", "push_relabel"])
+def test_max_flow_matches_ford_fulkerson(method):
+    rng = random.Random(0)
+    for _ in range(150):
+        n = rng.randint(2, 10)
+        graph = random_network(rng, n)
+        assert max_flow(graph, 0, n - 1, method) == ford_fulkerson(graph, 0, n - 1)
+        # Float capacities, and an edge out of the sink (which ford_fulkerson refuses, but can't carry flow)
+        graph = [[c / 4 for c in row] for row in graph]
+        expected = ford_fulkerson(graph, 0, n - 1)
+        graph[n - 1][0] = 1.0
+        assert max_flow(graph, 0, n - 1, method) == expected
+
+
+def test_ford_fulkerson_is_quiet_and_traceable(capsys):
+    events = []
+    counters = FlowCounters()
+    assert ford_fulkerson(CLRS, 0, 5, trace=events.append, counters=counters) == 23
+    assert capsys.readouterr().out == ""
+
+    augments = [event for event in events if event.kind == "augment"]
+    assert events[-1].kind == "done" and events[-1].max_flow == 23
+    assert [event.step for event in augments] == list(range(1, len(augments) + 1))
+    assert sum(event.path_flow for event in augments) == 23
+    assert all(event.path[0][0] == 0 and event.path[-1][1] == 5 for event in augments)
+    assert counters.augmentations == len(augments) and counters.bfs_runs == len(augments) + 1
+
+    # print_trace reproduces the old step-by-step output
+    ford_fulkerson(CLRS, 0, 5, trace=print_trace)
+    output = capsys.readouterr().out
+    assert output.count("--- Augmenting Path Step") == len(augments)
+    assert output.rstrip().endswith("Maximum Flow: 23")
+
+
+@pytest.mark.parametrize("method", ["dinic", "push_relabel"])
+def test_min_cut_matches_flow_value(method):
+    rng = random.Random(3)
+    for _ in range(100):
+        n = rng.randint(2, 10)
+        graph = random_network(rng, n)
+        result = solve_max_flow(graph, 0, n - 1, method)
+        assert result.value == ford_fulkerson(graph, 0, n - 1)
+        assert sum(capacity for _, _, capacity in result.cut_edges) == result.value
+        side = result.source_side
+        assert 0 in side and n - 1 not in side
+        assert all(u in side and v not in side and graph[u][v] == capacity for u, v, capacity in result.cut_edges)
+
+
+def test_warm_restart_matches_fresh_solve():
+    rng = random.Random(1)
+    for _ in range(100):
+        n = rng.randint(2, 9)
+        graph = random_network(rng, n)
+        result = solve_max_flow(graph, 0, n - 1)
+        changes = []
+        for _ in range(rng.randint(1, 5)):
+            u, v = rng.randrange(n - 1), rng.randrange(1, n)
+            if u != v:
+                graph[u][v] = rng.randint(0, 10)
+                changes.append((u, v, graph[u][v]))
+        assert result.update_capacities(changes) == ford_fulkerson(graph, 0, n - 1)
+
+
+def test_several_sources_and_sinks_match_super_terminals():
+    rng = random.Random(2)
+    for _ in range(50):
+        n = rng.randint(4, 9)
+        graph = random_network(rng, n)
+        sources = rng.sample(range(n - 1), 2)
+        sinks = [v for v in rng.sample(range(1, n), 2) if v not in sources] or [n - 1]
+        # Build the super-source / super-sink network by hand for ford_fulkerson
+        big = sum(map(sum, graph)) + 1
+        padded = [row + [0, 0] for row in graph] + [[0] * (n + 2) for _ in range(2)]
+        for s in sources:
+            padded[n][s] = big
+        for t in sinks:
+            padded[t][n + 1] = big
+        for row in padded:
+            row[n] = 0  # ford_fulkerson wants no edges into the source
+        padded[n + 1] = [0] * (n + 2)
+        assert max_flow(graph, sources, sinks) == ford_fulkerson(padded, n, n + 1)
+
+
+def test_multi_terminal_warm_restart_matches_fresh_solve():
+    assert solve_max_flow([[0, 0, 1], [0, 0, 1], [0, 0, 0]], [0, 1], 2).update_capacities([(0, 2, 10)]) == 11
+    rng = random.Random(4)
+    for _ in range(100):
+        n = rng.randint(4, 9)
+        graph = random_network(rng, n)
+        sources, sinks = [0, 1], [n - 2, n - 1]
+        method = rng.choice(["dinic", "push_relabel"])
+        result = solve_max_flow(graph, sources, sinks, method)
+        for _ in range(rng.randint(1, 3)):
+            changes = []
+            for _ in range(rng.randint(1, 4)):
+                u, v = rng.randrange(n), rng.randrange(n)
+                if u != v:
+                    graph[u][v] = rng.randint(0, 15)
+                    changes.append((u, v, graph[u][v]))
+            assert result.update_capacities(changes) == max_flow(graph, sources, sinks, method)
+
+
+def test_batch_ignores_existing_flow():
+    pytest.importorskip("numpy")
+    network = FlowNetwork.from_matrix([[0, 3, 0], [0, 0, 3], [0, 0, 0]])
+    assert network.max_flow(0, 2) == 3  # The network now carries a flow
+    queries = [(0, 2), ([0], [1, 2])]
+    assert batch_max_flow(network, queries) == batch_max_flow(network, queries, processes=2) == [3, 3]
+    assert network.max_flow(0, 2) == 0  # And still does
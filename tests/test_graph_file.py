@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from graph_algorithms.csr import CSRGraph
+from graph_algorithms.graph_file import convert_edge_list, load_graph, save_graph
+
+np = pytest.importorskip("numpy")
+
+
+def random_graph(rng, n, m, labels=None):
+    labels = labels or list(range(n))
+    graph = {label: {} for label in labels}
+    for _ in range(m):
+        u, v = rng.sample(labels, 2) if n > 1 else (labels[0], labels[0])
+        if u != v:
+            graph[u][v] = graph[v][u] = float(rng.randint(1, 9))
+    return graph
+
+
+def as_dict(graph):
+    return {node: dict(neighbors.items()) for node, neighbors in graph.items()}
+
+
+def test_graph_file_round_trip(tmp_path):
+    rng = random.Random(2)
+    for trial in range(30):
+        n = rng.randint(1, 15)
+        labels = None if trial % 2 else [f"n{k}" for k in range(n)]
+        graph = random_graph(rng, n, rng.randint(0, 40), labels)
+        path = tmp_path / f"g{trial}.graph"
+        save_graph(str(path), graph)
+        for mmap in (True, False):
+            loaded = load_graph(str(path), mmap=mmap)
+            assert as_dict(loaded) == graph
+            assert loaded.labels == labels
+
+
+def test_convert_edge_list_matches_from_edges(tmp_path):
+    rng = random.Random(3)
+    for trial in range(30):
+        n = rng.randint(1, 20)
+        edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 9)) for _ in range(rng.randint(0, 40))]
+        directed = trial % 2 == 0
+        text = tmp_path / f"e{trial}.txt"
+        text.write_text("# u v w\n" + "".join(f"{u} {v} {w}\n" for u, v, w in edges))
+        converted = convert_edge_list(str(text), str(tmp_path / f"e{trial}.graph"), directed=directed,
+                                      num_nodes=n, chunk_lines=rng.randint(1, 8))
+        expected = CSRGraph.from_edges(edges, num_nodes=n, directed=directed)
+        assert converted.offsets.tolist() == expected.offsets.tolist()
+        for i in range(n):
+            # Same edges per node; the order within a node may differ for undirected graphs
+            assert sorted(zip(converted.neighbors(i).tolist(), converted.edge_weights(i).tolist())) == \
+                sorted(zip(expected.neighbors(i).tolist(), expected.edge_weights(i).tolist()))
+
+
+def test_load_graph_maps_the_file(tmp_path):
+    path = tmp_path / "g.graph"
+    save_graph(str(path), {0: {1: 2.0}, 1: {0: 2.0}})
+    loaded = load_graph(str(path))
+    for array in (loaded.offsets, loaded.targets, loaded.weights):
+        base = array
+        while not isinstance(base, np.memmap) and base.base is not None:
+            base = base.base
+        assert isinstance(base, np.memmap)
+    assert not isinstance(load_graph(str(path), mmap=False).targets.base, np.memmap)
+    with pytest.raises(ValueError):
+        load_graph(__file__)  # Not a graph file
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+import graph_algorithms
+from graph_algorithms.kruskal import kruskal_algorithm, kruskal_from_file, write_edge_file
+
+np = pytest.importorskip("numpy")
+
+
+def random_edges(rng, n, m):
+    return [(rng.randrange(n), rng.randrange(n), float(rng.randint(1, 20))) for _ in range(m)]
+
+
+def as_dict(n, edges):
+    graph = {v: {} for v in range(n)}
+    for u, v, w in edges:
+        if u != v:
+            graph[u][v] = graph[v][u] = min(w, graph[u].get(v, w))
+    return graph
+
+
+def test_exported_from_package():
+    assert graph_algorithms.kruskal_from_file is kruskal_from_file
+    assert graph_algorithms.write_edge_file is write_edge_file
+
+
+def test_bad_arguments_raise_on_call(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        kruskal_from_file(str(tmp_path / "missing.bin"))
+    path = tmp_path / "edges.bin"
+    write_edge_file(str(path), [(0, 1, 1.0)])
+    with pytest.raises(ValueError):
+        kruskal_from_file(str(path), fmt="parquet")
+
+
+@pytest.mark.parametrize("fmt", ["binary", "csv"])
+def test_file_total_matches_in_memory(tmp_path, fmt):
+    rng = random.Random(0)
+    for trial in range(20):
+        n = rng.randint(2, 30)
+        edges = random_edges(rng, n, rng.randint(0, 80))
+        path = tmp_path / f"edges{trial}.{'csv' if fmt == 'csv' else 'bin'}"
+        if fmt == "csv":
+            path.write_text("".join(f"{u},{v},{w}\n" for u, v, w in edges))
+        else:
+            write_edge_file(str(path), edges)
+        mst = list(kruskal_from_file(str(path), num_nodes=n, chunk_edges=rng.randint(1, 16)))
+        expected, total = kruskal_algorithm(as_dict(n, edges))
+        assert len(mst) == len(expected)
+        assert sum(w for _, _, w in mst) == total
+        assert [w for _, _, w in mst] == sorted(w for _, _, w in mst)
+
+
+def test_graph_files_and_unweighted_csv(tmp_path):
+    from graph_algorithms.csr import CSRGraph
+    from graph_algorithms.graph_file import convert_edge_list, save_graph
+
+    rng = random.Random(1)
+    for trial in range(10):
+        n = rng.randint(2, 25)
+        edges = random_edges(rng, n, rng.randint(1, 60))
+        _, total = kruskal_algorithm(as_dict(n, edges))
+
+        saved = tmp_path / f"saved{trial}.graph"
+        save_graph(str(saved), CSRGraph.from_edges(edges, num_nodes=n))
+        text = tmp_path / f"edges{trial}.txt"
+        text.write_text("# u v weight\n" + "".join(f"{u} {v} {w}\n" for u, v, w in edges))
+        converted = tmp_path / f"converted{trial}.bin"
+        convert_edge_list(str(text), str(converted), num_nodes=n)
+        for path in (saved, converted):  # Recognised by their header, whatever the extension
+            mst = list(kruskal_from_file(str(path), chunk_edges=rng.randint(1, 16)))
+            assert sum(w for _, _, w in mst) == total
+
+    unweighted = tmp_path / "unweighted.csv"
+    unweighted.write_text("0,1\n1,2\n0,2\n")
+    assert [w for _, _, w in kruskal_from_file(str(unweighted))] == [1.0, 1.0]
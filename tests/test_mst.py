@@ -0,0 +1,139 @@
+import random
+
+import pytest
+
+from graph_algorithms.boruvka import boruvka_algorithm
+from graph_algorithms.dynamic_mst import DynamicMST
+from graph_algorithms.kruskal import UnionFind, kruskal_algorithm
+from graph_algorithms.prim import prim_algorithm, prim_matrix
+
+
+def random_graph(rng, n, m, connected=False):
+    graph = {v: {} for v in range(n)}
+    edges = [(v, rng.randrange(v)) for v in range(1, n)] if connected else []
+    edges += [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+    for u, v in edges:
+        if u != v:
+            graph[u][v] = graph[v][u] = rng.randint(1, 20)
+    return graph
+
+
+def is_forest(n, edges):
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+    for u, v, _ in edges:
+        ru, rv = find(u), find(v)
+        if ru == rv:
+            return False
+        parent[ru] = rv
+    return True
+
+
+def test_kruskal_matches_lazy_prim():
+    rng = random.Random(4)
+    for _ in range(150):
+        n = rng.randint(1, 15)
+        graph = random_graph(rng, n, rng.randint(0, 40), connected=True)
+        mst, total = kruskal_algorithm(graph)
+        assert total == prim_algorithm(graph, method="lazy")[1]
+        assert len(mst) == n - 1 and is_forest(n, mst)
+        assert all(graph[u][v] == w for u, v, w in mst)
+
+
+def test_kruskal_edges_listed_from_one_end():
+    # Each edge is listed once (from either end), which kruskal_algorithm accepts like the symmetric form
+    rng = random.Random(5)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        graph = random_graph(rng, n, rng.randint(0, 30))
+        one_sided = {v: {} for v in graph}
+        for u in graph:
+            for v, w in graph[u].items():
+                if u < v:
+                    a, b = (u, v) if rng.random() < 0.5 else (v, u)
+                    one_sided[a][b] = w
+        assert kruskal_algorithm(one_sided)[1] == kruskal_algorithm(graph)[1]
+
+
+def test_union_find_matches_naive_partition():
+    rng = random.Random(6)
+    nodes = [f"n{k}" for k in range(30)]
+    uf = UnionFind(nodes)
+    group = {node: {node} for node in nodes}
+    for _ in range(60):
+        a, b = rng.sample(nodes, 2)
+        merged = group[a] is not group[b]
+        assert uf.union(a, b) == merged
+        if merged:
+            union = group[a] | group[b]
+            for node in union:
+                group[node] = union
+        for node in nodes:
+            assert (uf.find(node) == uf.find(a)) == (node in group[a])
+
+
+def test_boruvka_matches_kruskal():
+    pytest.importorskip("numpy")
+    rng = random.Random(2)
+    for _ in range(100):
+        n = rng.randint(1, 15)
+        graph = random_graph(rng, n, rng.randint(0, 40))
+        mst, total = boruvka_algorithm(graph, chunk_edges=rng.randint(1, 8))
+        assert total == kruskal_algorithm(graph)[1] and is_forest(n, mst)
+
+    graph = random_graph(rng, 200, 800)
+    assert boruvka_algorithm(graph, processes=2)[1] == kruskal_algorithm(graph)[1]
+
+
+@pytest.mark.parametrize("method", ["indexed", "dense", "auto"])
+def test_keyed_prim_matches_lazy_prim(method):
+    rng = random.Random(0)
+    for _ in range(150):
+        n = rng.randint(1, 15)
+        graph = random_graph(rng, n, rng.randint(0, 40), connected=True)
+        start = rng.randrange(n)
+        mst, total = prim_algorithm(graph, start, method=method)
+        assert total == prim_algorithm(graph, start, method="lazy")[1]
+        assert len(mst) == n - 1 and is_forest(n, mst)
+
+
+def test_prim_matrix_matches_kruskal():
+    rng = random.Random(1)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        graph = random_graph(rng, n, rng.randint(0, 30), connected=True)
+        matrix = [[graph[i].get(j, float('inf')) for j in range(n)] for i in range(n)]
+        mst, total = prim_matrix(matrix, rng.randrange(n))
+        assert total == kruskal_algorithm(graph)[1] and len(mst) == n - 1
+
+
+def test_prim_forest_matches_kruskal():
+    rng = random.Random(7)
+    for _ in range(150):
+        n = rng.randint(1, 15)
+        graph = random_graph(rng, n, rng.randint(0, 20))  # Usually disconnected
+        expected_edges, expected = kruskal_algorithm(graph)
+        for method in ("lazy", "indexed", "dense"):
+            mst, total = prim_algorithm(graph, method=method, forest=True)
+            assert total == expected and len(mst) == len(expected_edges) and is_forest(n, mst)
+
+
+def test_dynamic_mst_matches_recompute():
+    rng = random.Random(3)
+    for _ in range(50):
+        n = rng.randint(2, 12)
+        graph = {v: {} for v in range(n)}
+        dynamic = DynamicMST(graph={v: {} for v in range(n)})
+        for _ in range(rng.randint(1, 40)):
+            u, v = rng.sample(range(n), 2)
+            weight = rng.randint(1, 20)
+            if v in graph[u]:
+                weight = min(weight, graph[u][v])  # Weights may only go down
+            graph[u][v] = graph[v][u] = weight
+            dynamic.insert_edge(u, v, weight)
+            assert dynamic.total_weight == kruskal_algorithm(graph)[1]
+        assert is_forest(n, dynamic.edges())
@@ -0,0 +1,34 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import graph_algorithms
+from graph_algorithms.__main__ import SUBMODULES
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code):
+    """Run code in a fresh interpreter from the repository root and return its stdout."""
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                          check=True).stdout
+
+
+def test_package_import_loads_no_submodules():
+    loaded = run("import sys, graph_algorithms; "
+                 "print(sorted(m for m in sys.modules if m.startswith('graph_algorithms.')))")
+    assert loaded.strip() == "[]"
+
+
+def test_importing_a_module_runs_no_example():
+    for name in SUBMODULES:
+        assert run(f"import graph_algorithms.{name}") == ""
+
+
+def test_every_export_resolves_from_its_module():
+    for name, module in graph_algorithms._EXPORTS.items():
+        assert getattr(graph_algorithms, name) is getattr(importlib.import_module(f"graph_algorithms.{module}"), name)
+        assert module in SUBMODULES
+    assert sorted(graph_algorithms.__all__) == sorted(graph_algorithms._EXPORTS)
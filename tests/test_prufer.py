@@ -0,0 +1,72 @@
+import heapq
+import random
+
+import pytest
+
+from graph_algorithms.prufer import (decode_prufer_batch, decode_prufer_sequence, encode_prufer_batch,
+                                     generate_prufer_sequence)
+
+
+def random_tree(rng, n, labels=None):
+    labels = labels or list(range(1, n + 1))
+    order = labels[:]
+    rng.shuffle(order)
+    tree = {label: [] for label in labels}
+    for i in range(1, n):
+        other = order[rng.randrange(i)]
+        tree[order[i]].append(other)
+        tree[other].append(order[i])
+    return tree
+
+
+def heap_prufer(tree):
+    """The textbook O(n log n) encoding: repeatedly remove the smallest leaf."""
+    neighbors = {v: set(adjacent) for v, adjacent in tree.items()}
+    leaves = [v for v, adjacent in neighbors.items() if len(adjacent) == 1]
+    heapq.heapify(leaves)
+    sequence = []
+    for _ in range(len(tree) - 2):
+        leaf = heapq.heappop(leaves)
+        (parent,) = neighbors.pop(leaf)
+        sequence.append(parent)
+        neighbors[parent].discard(leaf)
+        if len(neighbors[parent]) == 1:
+            heapq.heappush(leaves, parent)
+    return sequence
+
+
+def as_edges(tree):
+    return {frozenset((u, v)) for u in tree for v in tree[u]}
+
+
+def test_encode_matches_heap_version_and_decodes_back():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(1, 30)
+        tree = random_tree(rng, n)
+        sequence = generate_prufer_sequence(tree)
+        assert sequence == heap_prufer(tree)
+        if n >= 2:
+            assert as_edges(decode_prufer_sequence(sequence)) == as_edges(tree)
+
+
+def test_non_integer_labels():
+    rng = random.Random(1)
+    labels = sorted(f"v{k:02d}" for k in range(12))
+    tree = random_tree(rng, len(labels), labels)
+    sequence = generate_prufer_sequence(tree)
+    assert sequence == heap_prufer(tree)
+    assert as_edges(decode_prufer_sequence(sequence, labels)) == as_edges(tree)
+
+
+def test_batch_matches_single():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(2)
+    for n in range(2, 12):
+        sequences = np.array([[rng.randrange(n) for _ in range(n - 2)] for _ in range(40)], dtype=np.int64)
+        parents = decode_prufer_batch(sequences)
+        for sequence, parent in zip(sequences.tolist(), parents.tolist()):
+            labels = list(range(n))
+            expected = decode_prufer_sequence(sequence, labels)
+            assert as_edges({v: [parent[v]] if parent[v] >= 0 else [] for v in labels}) == as_edges(expected)
+        assert encode_prufer_batch(parents).tolist() == sequences.tolist()
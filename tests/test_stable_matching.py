@@ -0,0 +1,117 @@
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from graph_algorithms.stable_matching import IncrementalAllocation, allocate_items, allocate_items_fast
+
+np = pytest.importorskip("numpy")
+
+ITEMS = [f"i{k}" for k in range(6)]
+
+
+def quiet_allocate(preferences):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return allocate_items(preferences)
+
+
+def random_market(rng, num_players, items=ITEMS):
+    return {f"p{k}": rng.sample(items, rng.randint(1, len(items))) for k in range(num_players)}
+
+
+def tie_free_lists(rng, num_players, items=ITEMS):
+    """Preference lists in which no two players put the same item at the same position."""
+    used = set()
+    lists = []
+    for _ in range(num_players):
+        pref_list = []
+        for item in rng.sample(items, len(items)):
+            if (item, len(pref_list)) not in used and rng.random() < 0.8:
+                used.add((item, len(pref_list)))
+                pref_list.append(item)
+        lists.append(pref_list)
+    return lists
+
+
+def is_stable(preferences, allocation):
+    """No player prefers an item that is free or held by someone who ranks it lower."""
+    holder = {item: player for player, item in allocation.items() if item is not None}
+    for player, pref_list in preferences.items():
+        held = allocation[player]
+        for position, item in enumerate(pref_list):
+            if item == held:
+                break
+            other = holder.get(item)
+            if other is None or preferences[other].index(item) > position:
+                return False
+    return True
+
+
+def test_fast_matches_original():
+    rng = random.Random(0)
+    for _ in range(200):
+        preferences = random_market(rng, rng.randint(0, 8))
+        assert allocate_items_fast(preferences) == quiet_allocate(preferences)
+
+
+def test_initial_allocation_matches_original():
+    rng = random.Random(1)
+    for _ in range(100):
+        preferences = random_market(rng, rng.randint(0, 8))
+        assert IncrementalAllocation(preferences).allocation == quiet_allocate(preferences)
+
+
+def test_added_players_match_full_run():
+    # Without ties the player-optimal stable allocation is unique, whatever order players join in
+    rng = random.Random(2)
+    for _ in range(100):
+        lists = tie_free_lists(rng, rng.randint(1, 8))
+        incremental = IncrementalAllocation()
+        for k, pref_list in enumerate(lists):
+            incremental.add_player(f"p{k}", pref_list)
+        assert incremental.allocation == allocate_items_fast(incremental.preferences)
+
+
+def apply_deltas(seed, steps=40):
+    rng = random.Random(seed)
+    incremental = IncrementalAllocation(random_market(rng, 6))
+    history = []
+    for step in range(steps):
+        action = rng.choice(["add", "remove", "update", "update"])
+        players = sorted(incremental.preferences)
+        if action == "add" or not players:
+            incremental.add_player(f"q{step}", rng.sample(ITEMS, rng.randint(1, len(ITEMS))))
+        elif action == "remove":
+            incremental.remove_player(rng.choice(players))
+        else:
+            incremental.update_preferences(rng.choice(players), rng.sample(ITEMS, rng.randint(1, len(ITEMS))))
+        history.append(dict(incremental.allocation))
+    return incremental, history
+
+
+def test_delta_sequence_stays_stable():
+    for seed in range(20):
+        incremental, _ = apply_deltas(seed)
+        assert is_stable(incremental.preferences, incremental.allocation)
+        # Nobody holds an item they don't list, and no item is held twice
+        held = [item for item in incremental.allocation.values() if item is not None]
+        assert len(held) == len(set(held))
+        assert all(item is None or item in incremental.preferences[player]
+                   for player, item in incremental.allocation.items())
+
+
+def test_delta_sequence_is_independent_of_hash_seed():
+    script = ("import sys; sys.path.insert(0, sys.argv[1]); sys.path.insert(0, sys.argv[2]);"
+              "from test_stable_matching import apply_deltas;"
+              "print([sorted(a.items()) for s in range(5) for a in apply_deltas(s)[1]])")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    outputs = set()
+    for hash_seed in ("0", "1", "2", "3"):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        outputs.add(subprocess.run([sys.executable, "-c", script, root, os.path.dirname(__file__)], env=env,
+                                   capture_output=True, text=True, check=True).stdout)
+    assert len(outputs) == 1